@@ -0,0 +1,247 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import math
+import random
+from typing import List, Optional
+
+from zepben.evolve import PhaseCode, NetworkService, BaseVoltage, EnergySource, Terminal, ConductingEquipment, \
+    AcLineSegment, PerLengthSequenceImpedance, PowerTransformer, PowerTransformerEnd, EnergyConsumer, \
+    OverheadWireInfo, EnergySourcePhase, Feeder, Breaker, Junction, Location, PositionPoint, RatioTapChanger, \
+    PowerElectronicsConnection, set_phases, set_direction
+
+__all__ = ["SyntheticFeederSpec", "create_synthetic_network"]
+
+
+class SyntheticFeederSpec:
+    """
+    The shape of a synthetic network: a single `EnergySource` supplying `feeders` feeders, each a breaker followed by a
+    chain of HV spans with a distribution transformer at the end of each span. Each transformer supplies a chain of LV
+    spans with an `EnergyConsumer` at the end of each span, and a `PowerElectronicsConnection` on `pv_ratio` of them.
+
+    :param feeders: The number of feeders.
+    :param transformers: The number of transformers on each feeder.
+    :param consumers_per_transformer: The number of consumers on the LV network of each transformer.
+    :param segments_per_span: The number of `AcLineSegment`s each span is made of. Segments of the same span share
+        their impedance and are collapsed into a single line.
+    :param meshed: Whether to tie every third HV node of a feeder to the node three spans further down.
+    :param switched_ties: Whether each tie ends in a normally open `Breaker`, rather than being permanently closed.
+    :param with_locations: Whether the line segments have `Location`s.
+    :param with_tap_changers: Whether the transformers have `RatioTapChanger`s.
+    :param pv_ratio: The fraction of consumers with a `PowerElectronicsConnection`.
+    :param seed: The seed for the random impedances, lengths and loads.
+    """
+
+    def __init__(
+            self, *,
+            feeders: int = 1,
+            transformers: int = 10,
+            consumers_per_transformer: int = 10,
+            segments_per_span: int = 1,
+            meshed: bool = False,
+            switched_ties: bool = False,
+            with_locations: bool = True,
+            with_tap_changers: bool = True,
+            pv_ratio: float = 0.2,
+            seed: int = 0
+    ):
+        self.feeders = feeders
+        self.transformers = transformers
+        self.consumers_per_transformer = consumers_per_transformer
+        self.segments_per_span = segments_per_span
+        self.meshed = meshed
+        self.switched_ties = switched_ties
+        self.with_locations = with_locations
+        self.with_tap_changers = with_tap_changers
+        self.pv_ratio = pv_ratio
+        self.seed = seed
+
+    @staticmethod
+    def with_equipment_count(equipment: int, *, transformers: int = 50, **kwargs) -> 'SyntheticFeederSpec':
+        """
+        Creates a spec with enough feeders of `transformers` transformers to have approximately `equipment` pieces of
+        `ConductingEquipment`. Smaller networks use a single feeder with fewer transformers.
+        """
+        spec = SyntheticFeederSpec(feeders=1, transformers=transformers, **kwargs)
+        per_transformer = (spec.equipment_count() - 2) / transformers
+        if equipment < spec.equipment_count():
+            spec.transformers = max(1, round((equipment - 2) / per_transformer))
+        else:
+            spec.feeders = max(1, round(equipment / (spec.equipment_count() - 1)))
+        return spec
+
+    def equipment_count(self) -> int:
+        """
+        :return: The number of pieces of `ConductingEquipment` in a network created from this spec.
+        """
+        span = self.segments_per_span + 1
+        pvs = _pv_count(self.consumers_per_transformer, self.pv_ratio)
+        per_transformer = span + 1 + self.consumers_per_transformer * (span + 1) + pvs
+        per_tie = self.segments_per_span + (1 if self.switched_ties else 0)
+        per_feeder = 1 + self.transformers * per_transformer + len(_tie_nodes(self)) * per_tie
+        return 1 + self.feeders * per_feeder
+
+    def __repr__(self):
+        return f"SyntheticFeederSpec({', '.join(f'{k}={v!r}' for k, v in vars(self).items())})"
+
+
+def _pv_count(consumers: int, pv_ratio: float) -> int:
+    return sum(1 for c in range(consumers) if _has_pv(c, pv_ratio))
+
+
+def _has_pv(consumer: int, pv_ratio: float) -> bool:
+    # Spread the PV systems evenly rather than randomly so the equipment count is known up front.
+    return math.floor((consumer + 1) * pv_ratio) > math.floor(consumer * pv_ratio)
+
+
+def _tie_nodes(spec: SyntheticFeederSpec) -> range:
+    return range(0, spec.transformers - 3, 3) if spec.meshed else range(0)
+
+
+class _SyntheticNetworkBuilder:
+
+    def __init__(self, spec: SyntheticFeederSpec):
+        self.spec = spec
+        self.network = NetworkService()
+        self.rand = random.Random(spec.seed)
+        self.bv_hv = BaseVoltage(mrid="bv_22kV", nominal_voltage=22000, name="22kV")
+        self.bv_lv = BaseVoltage(mrid="bv_415V", nominal_voltage=415, name="415V")
+        self.plsis = [
+            PerLengthSequenceImpedance(mrid=f"plsi_{i}", r=(0.1 + 0.1 * i) / 1000, x=(0.05 + 0.02 * i) / 1000)
+            for i in range(4)
+        ]
+        self.wire_infos = [OverheadWireInfo(mrid=f"wire_info_{i}", rated_current=100.0 + 50 * i) for i in range(4)]
+        for io in (self.bv_hv, self.bv_lv, *self.plsis, *self.wire_infos):
+            self.network.add(io)
+
+    def build(self) -> NetworkService:
+        phases = []
+        for sp in PhaseCode.ABC.single_phases:
+            esp = EnergySourcePhase()
+            esp.phase = sp
+            phases.append(esp)
+            self.network.add(esp)
+        es = EnergySource(mrid="source", name="Source", voltage_magnitude=22000, energy_source_phases=phases)
+        es.base_voltage = self.bv_hv
+        es_t = self._add_ce(es, 1)[0]
+
+        for f in range(self.spec.feeders):
+            self._add_feeder(f, es_t)
+        return self.network
+
+    def _add_feeder(self, f: int, es_t: Terminal):
+        cb = Breaker(mrid=f"f{f}_cb", name=f"f{f}_cb")
+        cb.base_voltage = self.bv_hv
+        cb_ts = self._add_ce(cb, 2)
+        self.network.connect_terminals(es_t, cb_ts[0])
+        self.network.add(Feeder(mrid=f"f{f}", name=f"Feeder {f}", normal_head_terminal=cb_ts[1]))
+
+        t_prev = cb_ts[1]
+        hv_nodes = []
+        for n in range(self.spec.transformers):
+            x, y = f * 1.0, n * 0.01
+            node = self._add_node(f"f{f}_hvn{n}", self.bv_hv, self._add_span(f"f{f}_hv{n}", self.bv_hv, t_prev, x, y))
+            hv_nodes.append(node)
+            t_prev = node.get_terminal_by_sn(1)
+            self._add_transformer(f"f{f}_tx{n}", t_prev, x, y)
+
+        for n in _tie_nodes(self.spec):
+            t_end = self._add_span(f"f{f}_tie{n}", self.bv_hv, hv_nodes[n].get_terminal_by_sn(1), f * 1.0, n * 0.01)
+            if self.spec.switched_ties:
+                switch = Breaker(mrid=f"f{f}_tie{n}_cb", name=f"f{f}_tie{n}_cb")
+                switch.base_voltage = self.bv_hv
+                switch.set_normally_open(True)
+                switch.set_open(True)
+                switch_ts = self._add_ce(switch, 2)
+                self.network.connect_terminals(t_end, switch_ts[0])
+                t_end = switch_ts[1]
+            self.network.connect_terminals(t_end, hv_nodes[n + 3].get_terminal_by_sn(1))
+
+    def _add_transformer(self, mrid: str, t_hv: Terminal, x: float, y: float):
+        tx = PowerTransformer(mrid=mrid, name=mrid)
+        tx.location = self._location(mrid, x, y, 1)
+        ts = self._add_ce(tx, 2)
+        self.network.connect_terminals(t_hv, ts[0])
+        for i, (t, rated_u) in enumerate(zip(ts, (22000, 415))):
+            end = PowerTransformerEnd(mrid=f"{mrid}_e{i + 1}", power_transformer=tx, rated_u=rated_u, rated_s=630000)
+            end.terminal = t
+            tx.add_end(end)
+            self.network.add(end)
+
+        if self.spec.with_tap_changers:
+            hv_end = tx.get_end_by_num(1)
+            rtc = RatioTapChanger(mrid=f"{mrid}_rtc", high_step=5, low_step=-5, neutral_step=0, normal_step=1, step=0.0,
+                                  transformer_end=hv_end)
+            rtc.step_voltage_increment = 2.5
+            hv_end.ratio_tap_changer = rtc
+            self.network.add(rtc)
+
+        t_prev = ts[1]
+        for c in range(self.spec.consumers_per_transformer):
+            node = self._add_node(f"{mrid}_lvn{c}", self.bv_lv,
+                                  self._add_span(f"{mrid}_lv{c}", self.bv_lv, t_prev, x + 0.001 * c, y))
+            t_prev = node.get_terminal_by_sn(1)
+
+            ec = EnergyConsumer(mrid=f"{mrid}_ec{c}", name=f"{mrid}_ec{c}", p=self.rand.uniform(1000, 5000), q=500.0)
+            ec.base_voltage = self.bv_lv
+            self.network.connect_terminals(t_prev, self._add_ce(ec, 1)[0])
+
+            if _has_pv(c, self.spec.pv_ratio):
+                pec = PowerElectronicsConnection(mrid=f"{mrid}_pec{c}", name=f"{mrid}_pec{c}", p=-3000.0, q=0.0)
+                pec.base_voltage = self.bv_lv
+                self.network.connect_terminals(t_prev, self._add_ce(pec, 1)[0])
+
+    def _add_span(self, mrid: str, bv: BaseVoltage, t_from: Terminal, x: float, y: float) -> Terminal:
+        # All segments of a span share their impedance so they are collapsed into one line. Every other segment has
+        # its points stored in reverse so the geometry stitching has to reorient them.
+        i = self.rand.randrange(len(self.plsis))
+        for s in range(self.spec.segments_per_span):
+            segment_mrid = mrid if self.spec.segments_per_span == 1 else f"{mrid}_s{s}"
+            acls = AcLineSegment(mrid=segment_mrid, name=segment_mrid, length=self.rand.uniform(20.0, 200.0),
+                                 per_length_impedance=self.plsis[i])
+            acls.asset_info = self.wire_infos[i]
+            acls.base_voltage = bv
+            acls.location = self._location(segment_mrid, x + s * 0.001, y, self.rand.randint(2, 5), s % 2 == 1)
+            ts = self._add_ce(acls, 2)
+            self.network.connect_terminals(t_from, ts[0])
+            t_from = ts[1]
+        return t_from
+
+    def _add_node(self, mrid: str, bv: BaseVoltage, t_from: Terminal) -> Junction:
+        j = Junction(mrid=mrid, name=mrid)
+        j.base_voltage = bv
+        self.network.connect_terminals(t_from, self._add_ce(j, 1)[0])
+        return j
+
+    def _add_ce(self, ce: ConductingEquipment, num_terminals: int) -> List[Terminal]:
+        terminals = []
+        for i in range(num_terminals):
+            t = Terminal(mrid=f"{ce.mrid}_t{i + 1}", conducting_equipment=ce, phases=PhaseCode.ABC,
+                         sequence_number=i + 1)
+            ce.add_terminal(t)
+            self.network.add(t)
+            terminals.append(t)
+        self.network.add(ce)
+        return terminals
+
+    def _location(self, mrid: str, x: float, y: float, points: int, reverse: bool = False) -> Optional[Location]:
+        if not self.spec.with_locations:
+            return None
+        loc = Location(mrid=f"{mrid}_loc")
+        offsets = reversed(range(points)) if reverse else range(points)
+        for i in offsets:
+            loc.add_point(PositionPoint(x + i * 0.0001, y + i * 0.0001))
+        self.network.add(loc)
+        return loc
+
+
+async def create_synthetic_network(spec: SyntheticFeederSpec) -> NetworkService:
+    """
+    Creates a `NetworkService` of the shape described by `spec`, with its feeder directions and phases set.
+    """
+    network = _SyntheticNetworkBuilder(spec).build()
+    await set_direction().run(network)
+    await set_phases().run(network)
+    return network
@@ -0,0 +1,156 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Times the translation of synthetic networks by each of the creators and writes the results as JSON, e.g.
+
+    PYTHONPATH=src python -m benchmarks.translation_benchmark --sizes 1000 10000 --meshed --output results.json
+
+Each case is run in a fresh process so the reported peak RSS is for that case alone.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Callable, Any, List, Optional
+
+import pandapower as pp
+from zepben.evolve import BusBranchNetworkCreator
+
+from benchmarks.synthetic_network import SyntheticFeederSpec, create_synthetic_network
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.creator import PandaPowerNetworkCreator
+from pp_creators.creator_ee import PandaPowerNetworkCreatorEE
+from pp_creators.error_checking_creator import ErrorAggregator
+from pp_creators.profiling import create_profiled
+
+__all__ = ["CREATORS", "run_case", "run_benchmarks"]
+
+_logger = logging.getLogger("pp_translator.benchmark")
+
+CREATORS: Dict[str, Callable[[], BusBranchNetworkCreator]] = {
+    "basic": lambda: BasicPandaPowerNetworkCreator(logger=_logger),
+    "basic_buffered": lambda: BasicPandaPowerNetworkCreator(logger=_logger, buffer_tables=True),
+    "ee": lambda: PandaPowerNetworkCreatorEE(logger=_logger),
+    "pandapower": lambda: PandaPowerNetworkCreator(logger=_logger),
+    "error_aggregator": lambda: ErrorAggregator()
+}
+
+
+def run_case(creator_name: str, spec: SyntheticFeederSpec) -> Dict[str, Any]:
+    """
+    Builds a synthetic network from `spec` and translates it with the creator registered as `creator_name`.
+
+    :return: The timings and sizes of the case as a JSON serialisable dict.
+    """
+    start = time.perf_counter()
+    network = asyncio.run(create_synthetic_network(spec))
+    build_s = time.perf_counter() - start
+    build_rss_mb = _peak_rss_mb()
+
+    creator = CREATORS[creator_name]()
+    case = {
+        "creator": creator_name,
+        "spec": vars(spec),
+        "equipment": spec.equipment_count(),
+        "build_s": build_s,
+        "build_peak_rss_mb": build_rss_mb
+    }
+
+    try:
+        result = asyncio.run(create_profiled(creator, network))
+    except Exception as e:
+        case.update(was_successful=False, error=f"{type(e).__name__}: {e}")
+        return case
+
+    case.update(was_successful=result.was_successful, peak_rss_mb=_peak_rss_mb(), **result.profile.to_dict())
+    return case
+
+
+def run_benchmarks(creator_names: List[str], specs: List[SyntheticFeederSpec], repeat: int = 1) -> Dict[str, Any]:
+    """
+    Runs every combination of creator and spec `repeat` times, each in a fresh worker process.
+    """
+    mp_context = multiprocessing.get_context("spawn")
+    cases = []
+    for spec in specs:
+        for creator_name in creator_names:
+            for _ in range(repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as executor:
+                    case = executor.submit(run_case, creator_name, spec).result()
+                _logger.info("%s on %d equipment (meshed=%s): %s", creator_name, case["equipment"], spec.meshed,
+                             case.get("wall_s", case.get("error")))
+                cases.append(case)
+
+    return {"environment": _environment(), "cases": cases}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes everywhere else.
+    return max_rss / 2 ** 20 if sys.platform == "darwin" else max_rss / 2 ** 10
+
+
+def _environment() -> Dict[str, Any]:
+    from importlib.metadata import version
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": multiprocessing.cpu_count(),
+        "pandapower": pp.__version__,
+        "zepben.evolve": version("zepben.evolve"),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the pandapower creators on synthetic networks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Approximate equipment counts of the networks to translate.")
+    parser.add_argument("--creators", nargs="+", choices=list(CREATORS), default=list(CREATORS))
+    parser.add_argument("--meshed", action="store_true", help="Also benchmark meshed versions of each network.")
+    parser.add_argument("--transformers-per-feeder", type=int, default=50)
+    parser.add_argument("--consumers-per-transformer", type=int, default=10)
+    parser.add_argument("--segments-per-span", type=int, default=1)
+    parser.add_argument("--without-locations", action="store_true")
+    parser.add_argument("--without-tap-changers", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="The file to write the JSON results to. Defaults to stdout.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    specs = [
+        SyntheticFeederSpec.with_equipment_count(
+            size,
+            transformers=args.transformers_per_feeder,
+            consumers_per_transformer=args.consumers_per_transformer,
+            segments_per_span=args.segments_per_span,
+            meshed=meshed,
+            with_locations=not args.without_locations,
+            with_tap_changers=not args.without_tap_changers
+        )
+        for size in args.sizes
+        for meshed in ((False, True) if args.meshed else (False,))
+    ]
+
+    results = run_benchmarks(args.creators, specs, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
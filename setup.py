@@ -10,7 +10,7 @@ from os.path import splitext
 
 from setuptools import setup, find_packages
 
-test_deps = ["pytest", "pytest-cov", "pytest-asyncio", "hypothesis", "numpy"]
+test_deps = ["pytest", "pytest-cov", "pytest-asyncio", "hypothesis", "numpy", "pyarrow"]
 setup(
     name="pp-translator",
     description="Library for translating Zepben CIM network models to pandapower models",
@@ -38,5 +38,6 @@ setup(
     ],
     extras_require={
         "test": test_deps,
+        "arrow": ["pyarrow"],
     },
 )
@@ -0,0 +1,227 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Tuple
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from scipy.sparse import csr_matrix, coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+__all__ = ["BusAdmittance", "build_bus_admittance", "line_admittances"]
+
+# The R/X ratio pandapower gives switches with a positive z_ohm, see the switch_rx_ratio option of pp.runpp.
+_SWITCH_RX_RATIO = 2.0
+
+
+class BusAdmittance:
+    """
+    The bus admittance matrix (Ybus) of a net, in per unit on `sn_mva` and the nominal voltage of each bus.
+
+    Buses joined by closed bus-bus switches without impedance are fused into a single row, as pandapower does, so rows
+    are looked up through `rows` rather than by bus index.
+
+    :param matrix: The complex admittance matrix, one row and column per fused bus.
+    :param rows: The row of each in service bus, indexed by bus index.
+    :param base_kv: The base voltage of each row, in kV.
+    :param sn_mva: The base power, in MVA.
+    """
+
+    def __init__(self, *, matrix: csr_matrix, rows: pd.Series, base_kv: np.ndarray, sn_mva: float):
+        self.matrix = matrix
+        self.rows = rows
+        self.base_kv = base_kv
+        self.sn_mva = sn_mva
+
+    @property
+    def base_ohm(self) -> np.ndarray:
+        """
+        :return: The base impedance of each row, in ohms.
+        """
+        return np.square(self.base_kv) / self.sn_mva
+
+
+def build_bus_admittance(net: pp.pandapowerNet) -> BusAdmittance:
+    """
+    Assembles the positive sequence bus admittance matrix of a net straight from its `line`, `trafo` and `switch`
+    tables, without a pandapower conversion to ppc.
+
+    Elements are modelled as by `pp.runpp` with its default options: lines as pi sections, trafos with the "t" model
+    and their tap position, and a line with an open switch or out of service bus at one end left hanging off its other
+    end. Other out of service elements, and trafos on out of service buses, are left out.
+
+    :param net: The translated net.
+    :return: The admittance matrix of `net`.
+    """
+    sn_mva = net.sn_mva
+    rows, base_kv = _fuse_buses(net)
+    branches = [_line_branches(net, rows, base_kv, sn_mva), _trafo_branches(net, rows, base_kv, sn_mva),
+                _switch_branches(net, rows, base_kv, sn_mva)]
+
+    f, t, ys, ysh_f, ysh_t, tap = (np.concatenate(values) for values in zip(*branches))
+    y_ff = (ys + ysh_f) / (tap * np.conj(tap))
+    y_ft = -ys / np.conj(tap)
+    y_tf = -ys / tap
+    y_tt = ys + ysh_t
+    shape = (len(base_kv), len(base_kv))
+    matrix = coo_matrix((np.concatenate([y_ff, y_ft, y_tf, y_tt]),
+                         (np.concatenate([f, f, t, t]), np.concatenate([f, t, f, t]))), shape=shape).tocsr()
+    return BusAdmittance(matrix=matrix, rows=rows, base_kv=base_kv, sn_mva=sn_mva)
+
+
+def line_admittances(net: pp.pandapowerNet, line: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :param net: The net the lines are in.
+    :param line: Rows of `net.line`.
+    :return: The series admittance and the total shunt admittance of each line, in per unit on the base voltage of its
+        from bus.
+    """
+    base_ohm = np.square(net.bus.vn_kv.reindex(line.from_bus).to_numpy(dtype=np.float64)) / net.sn_mva
+    length_km = line.length_km.to_numpy(dtype=np.float64)
+    parallel = line.parallel.to_numpy(dtype=np.float64)
+    z = (line.r_ohm_per_km.to_numpy(dtype=np.float64) + 1j * line.x_ohm_per_km.to_numpy(dtype=np.float64)) \
+        * length_km / parallel / base_ohm
+    ysh = (line.g_us_per_km.to_numpy(dtype=np.float64) * 1e-6
+           + 2j * np.pi * net.f_hz * line.c_nf_per_km.to_numpy(dtype=np.float64) * 1e-9) \
+        * length_km * parallel * base_ohm
+    return 1 / z, ysh
+
+
+# The rows, series admittance, shunt admittance at each end and complex tap ratio of each branch. A shunt on its own
+# has the same row at both ends and no series admittance.
+_Branches = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _fuse_buses(net: pp.pandapowerNet) -> Tuple[pd.Series, np.ndarray]:
+    bus = net.bus[net.bus.in_service.astype(bool)]
+    positions = pd.Series(np.arange(len(bus)), index=bus.index)
+    switch = net.switch
+    fused = switch[(switch.et == "b") & switch.closed.astype(bool) & ~(switch.z_ohm > 0)]
+    a = positions.reindex(fused.bus).to_numpy()
+    b = positions.reindex(fused.element).to_numpy()
+    found = ~(np.isnan(a) | np.isnan(b))
+    graph = coo_matrix((np.ones(found.sum()), (a[found].astype(np.int64), b[found].astype(np.int64))),
+                       shape=(len(bus), len(bus)))
+    row_count, labels = connected_components(graph, directed=False)
+
+    base_kv = np.zeros(row_count)
+    base_kv[labels] = bus.vn_kv.to_numpy(dtype=np.float64)
+    return pd.Series(labels, index=bus.index, name="row"), base_kv
+
+
+def _rows_of(rows: pd.Series, buses: pd.Series) -> np.ndarray:
+    # The row of each bus, or -1 if it is out of service.
+    return rows.reindex(buses).fillna(-1).to_numpy(dtype=np.int64)
+
+
+def _line_branches(net: pp.pandapowerNet, rows: pd.Series, base_kv: np.ndarray, sn_mva: float) -> _Branches:
+    line = net.line[net.line.in_service.astype(bool)]
+    f, t = _rows_of(rows, line.from_bus), _rows_of(rows, line.to_bus)
+    open_from, open_to = _open_line_ends(net, line)
+    # An end on an out of service bus is left open, as pandapower does.
+    open_from |= f < 0
+    open_to |= t < 0
+
+    ys, ysh = line_admittances(net, line)
+
+    # An open end leaves the line hanging off its other end, as a series admittance into the charging of the open end.
+    y_half = ysh / 2
+    y_hanging = y_half + np.divide(ys * y_half, ys + y_half, out=np.zeros_like(ys), where=y_half != 0)
+    both = ~open_from & ~open_to
+    hanging_from = open_to & ~open_from
+    hanging_to = open_from & ~open_to
+    hanging = np.concatenate([f[hanging_from], t[hanging_to]])
+    no_series = np.zeros(len(hanging), dtype=np.complex128)
+    return (
+        np.concatenate([f[both], hanging]),
+        np.concatenate([t[both], hanging]),
+        np.concatenate([ys[both], no_series]),
+        np.concatenate([y_half[both], y_hanging[hanging_from], y_hanging[hanging_to]]),
+        np.concatenate([y_half[both], no_series]),
+        np.ones(both.sum() + len(hanging), dtype=np.complex128)
+    )
+
+
+def _open_line_ends(net: pp.pandapowerNet, line: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    switch = net.switch
+    open_switches = switch[(switch.et == "l") & ~switch.closed.astype(bool)]
+    ends = pd.DataFrame({"line": open_switches.element.to_numpy(), "bus": open_switches.bus.to_numpy()})
+    ends = ends[ends.line.isin(line.index)]
+    from_bus = line.from_bus.reindex(ends.line).to_numpy()
+    open_from = line.index.isin(ends.line[ends.bus.to_numpy() == from_bus])
+    open_to = line.index.isin(ends.line[ends.bus.to_numpy() != from_bus])
+    return open_from, open_to
+
+
+def _trafo_branches(net: pp.pandapowerNet, rows: pd.Series, base_kv: np.ndarray, sn_mva: float) -> _Branches:
+    trafo = net.trafo[net.trafo.in_service.astype(bool)]
+    f, t = _rows_of(rows, trafo.hv_bus), _rows_of(rows, trafo.lv_bus)
+    connected = (f >= 0) & (t >= 0)
+    trafo, f, t = trafo[connected], f[connected], t[connected]
+
+    def values(column: str) -> np.ndarray:
+        return trafo[column].to_numpy(dtype=np.float64)
+
+    vn_hv_kv, vn_lv_kv = values("vn_hv_kv"), values("vn_lv_kv")
+    vn_hv, vn_lv = vn_hv_kv.copy(), vn_lv_kv.copy()
+    shift = np.nan_to_num(values("shift_degree"))
+    tap_diff = values("tap_pos") - values("tap_neutral")
+    tap_step = values("tap_step_percent")
+    tap_angle = np.nan_to_num(values("tap_step_degree"))
+    for side, vn, direction in (("hv", vn_hv, 1), ("lv", vn_lv, -1)):
+        tapped = np.isfinite(tap_step) & np.isfinite(tap_diff) & (trafo.tap_side == side).to_numpy()
+        du = vn[tapped] * tap_step[tapped] * tap_diff[tapped] / 100
+        cos, sin = np.cos(np.deg2rad(tap_angle[tapped])), np.sin(np.deg2rad(tap_angle[tapped]))
+        shift[tapped] += np.rad2deg(np.arctan(direction * du * sin / (vn[tapped] + du * cos)))
+        vn[tapped] = np.sqrt((vn[tapped] + du * cos) ** 2 + (du * sin) ** 2)
+
+    ratio = (vn_hv / vn_lv) / (base_kv[f] / base_kv[t])
+    tap = ratio * np.exp(1j * np.deg2rad(shift))
+
+    parallel = values("parallel")
+    sn_trafo_mva = values("sn_mva")
+    lv_base_kv = base_kv[t]
+    z_scale = np.square(vn_lv / lv_base_kv) * sn_mva / sn_trafo_mva / parallel
+    z_sc = values("vk_percent") / 100 * z_scale
+    r_sc = values("vkr_percent") / 100 * z_scale
+    x_sc = np.sign(z_sc) * np.sqrt(z_sc ** 2 - r_sc ** 2)
+
+    lv_base_ohm = np.square(lv_base_kv) / sn_mva
+    pfe_mw = values("pfe_kw") * 1e-3
+    i0_percent = values("i0_percent")
+    g_m = pfe_mw / vn_lv_kv ** 2 * lv_base_ohm
+    b_m = np.sqrt(np.maximum((i0_percent / 100 * sn_trafo_mva) ** 2 - pfe_mw ** 2, 0)) * lv_base_ohm / vn_lv_kv ** 2
+    # The magnetising admittance, as pandapower's branch susceptance.
+    y_m = (-g_m * 1j - b_m * np.sign(i0_percent)) / np.square(vn_lv / vn_lv_kv) * parallel
+
+    z = r_sc + 1j * x_sc
+    susceptance = y_m.astype(np.complex128)
+    magnetised = y_m != 0
+    # The "t" model, as an equivalent pi section.
+    za = z[magnetised] / 2
+    zc = -1j / y_m[magnetised]
+    z_sum = za * za + 2 * za * zc
+    z[magnetised] = z_sum / zc
+    susceptance[magnetised] = -2j / (z_sum / za)
+
+    ys = 1 / z
+    ysh = 1j * susceptance / 2
+    return f, t, ys, ysh, ysh.copy(), tap
+
+
+def _switch_branches(net: pp.pandapowerNet, rows: pd.Series, base_kv: np.ndarray, sn_mva: float) -> _Branches:
+    switch = net.switch
+    switch = switch[(switch.et == "b") & switch.closed.astype(bool) & (switch.z_ohm > 0)]
+    f, t = _rows_of(rows, switch.bus), _rows_of(rows, switch.element)
+    connected = (f >= 0) & (t >= 0)
+    switch, f, t = switch[connected], f[connected], t[connected]
+
+    angle = np.arctan(1 / _SWITCH_RX_RATIO)
+    z_pu = switch.z_ohm.to_numpy(dtype=np.float64) / (np.square(base_kv[f]) / sn_mva)
+    z = z_pu * (np.cos(angle) + 1j * np.sin(angle))
+    zeros = np.zeros(len(f), dtype=np.complex128)
+    return f, t, 1 / z, zeros, zeros.copy(), np.ones(len(f), dtype=np.complex128)
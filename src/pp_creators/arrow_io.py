@@ -0,0 +1,291 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from pathlib import Path
+from typing import Union, Optional, List, Dict, Tuple, Iterable
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from zepben.evolve import BusBranchNetworkCreationResult, BusBranchNetworkCreationMappings, NetworkService
+
+from pp_creators.geometry import NetGeometry
+from pp_creators.mappings import MridMappings, mappings_to_mrids, mappings_from_mrids, GROUPING_MAPPINGS, \
+    SET_MAPPINGS
+
+__all__ = ["NET_TABLES", "export_result", "load_table", "load_net", "load_mrid_mappings", "load_mappings"]
+
+NET_TABLES = ("bus", "line", "trafo", "load", "sgen", "ext_grid", "switch", "bus_geodata", "line_geodata")
+"""
+The tables of a `pandapowerNet` that are exported, along with the result table of each element table if it has results.
+"""
+
+_FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+_TO_BBN = "to_bbn"
+_TO_NBN = "to_nbn"
+_GROUPING_ROLES = ("border", "inner", "equipment")
+
+# A polyline of x and y positions.
+_COORDS_TYPE = pa.list_(pa.list_(pa.float64(), 2))
+
+
+def export_result(
+        result: BusBranchNetworkCreationResult,
+        directory: Union[str, Path],
+        *,
+        file_format: str = "arrow"
+):
+    """
+    Writes the net and mappings of a creation result to `directory` as one file per table.
+
+    Each table of `NET_TABLES` is written as `<table>.arrow` or `<table>.parquet`, with its index kept as a column. The
+    coordinates of the geodata tables are stored as lists of (x, y) pairs, and are taken from the result's `geometry`
+    if it was created with `geometry="buffer"`. The mappings are written as two long tables:
+        - `to_bbn`: A row for each element each mRID maps to, with the mRID and the element's type and index.
+        - `to_nbn`: A row for each mRID each element maps to, with the name of the mapping, the element's type and index,
+          the mRID and its role in the element: "border", "inner" or "equipment" for topological nodes and branches,
+          and "equipment" for everything else.
+
+    :param result: A successful creation result whose mappings map to `PpElement`s.
+    :param directory: The directory to write the files to. It is created if it does not exist. Files of a previous
+        export to it are replaced, and any other files are left as they are.
+    :param file_format: "arrow" to write uncompressed Arrow IPC files, which `load_table` can memory-map without
+        copying, or "parquet" to write compressed Parquet files, which are smaller but have to be decoded when read.
+    """
+    if file_format not in _FORMATS:
+        raise ValueError(f"Unsupported file format {file_format!r}, expected one of {list(_FORMATS)}.")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Only remove files from a previous export, so tables of another format or stale results are not read back, and
+    # anything else in the directory is left alone.
+    for name in (*_net_table_names(), _TO_BBN, _TO_NBN):
+        for extension in _FORMATS.values():
+            _unlink(directory / f"{name}{extension}")
+
+    net = result.network
+    tables = {name: net[name] for name in _exported_tables(net)}
+    geometry = getattr(result, "geometry", None)
+    if geometry is not None:
+        tables.update(_materialised_geodata(net, geometry))
+    for name, df in tables.items():
+        _write(_net_table_to_arrow(df), directory, name, file_format)
+
+    to_bbn, to_nbn = _mrid_mappings_to_arrow(mappings_to_mrids(result.mappings))
+    _write(to_bbn, directory, _TO_BBN, file_format)
+    _write(to_nbn, directory, _TO_NBN, file_format)
+
+
+def load_table(
+        directory: Union[str, Path],
+        name: str,
+        *,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True
+) -> pa.Table:
+    """
+    Reads a single table written by `export_result`, e.g. "line", "res_bus" or "to_bbn".
+
+    :param columns: The columns to read. All columns are read if not given.
+    :param memory_map: Whether to memory-map the file. Arrow files are then read without copying, so only the pages of
+        the requested columns are ever loaded.
+    """
+    directory = Path(directory)
+    arrow_path = directory / f"{name}{_FORMATS['arrow']}"
+    if arrow_path.exists():
+        source = pa.memory_map(str(arrow_path)) if memory_map else pa.OSFile(str(arrow_path))
+        table = pa.ipc.open_file(source).read_all()
+        return table if columns is None else table.select(columns)
+
+    parquet_path = directory / f"{name}{_FORMATS['parquet']}"
+    if parquet_path.exists():
+        return pq.read_table(parquet_path, columns=columns, memory_map=memory_map)
+
+    raise FileNotFoundError(f"No table {name!r} in {directory}.")
+
+
+def load_net(directory: Union[str, Path], *, tables: Optional[Iterable[str]] = None) -> pp.pandapowerNet:
+    """
+    Rebuilds a `pandapowerNet` from the tables written by `export_result`.
+
+    :param tables: The tables to read. Every exported net table is read if not given, and the rest are left empty.
+    """
+    directory = Path(directory)
+    if tables is None:
+        tables = [path.stem for path in directory.iterdir()
+                  if path.suffix in _FORMATS.values() and path.stem in _net_table_names()]
+
+    net = pp.create_empty_network()
+    for name in tables:
+        df = _net_table_from_arrow(load_table(directory, name))
+        empty = net[name]
+        if not len(df):
+            continue
+        # Keep pandapower's column order and dtypes for the columns it knows about.
+        columns = [*empty.columns, *(column for column in df.columns if column not in empty.columns)]
+        net[name] = df.reindex(columns=columns).astype(
+            {column: dtype for column, dtype in empty.dtypes.items() if column in df.columns}
+        )
+    return net
+
+
+def load_mrid_mappings(directory: Union[str, Path]) -> MridMappings:
+    """
+    Reads the mappings written by `export_result` back into the form returned by `mappings_to_mrids`.
+    """
+    to_bbn_table = load_table(directory, _TO_BBN)
+    to_bbn: Dict[str, List[Tuple[str, int]]] = {}
+    for mrid, element_type, element_index in zip(*(_to_list(to_bbn_table.column(name))
+                                                   for name in ("mrid", "element_type", "element_index"))):
+        to_bbn.setdefault(mrid, []).append((element_type, element_index))
+
+    to_nbn_table = load_table(directory, _TO_NBN)
+    to_nbn: Dict[str, Dict[str, list]] = {name: {} for name in (*GROUPING_MAPPINGS, *SET_MAPPINGS)}
+    for mapping, element_type, element_index, role, mrid in zip(
+            *(_to_list(to_nbn_table.column(name))
+              for name in ("mapping", "element_type", "element_index", "role", "mrid"))
+    ):
+        key = f"{element_type}:{element_index}"
+        if mapping in GROUPING_MAPPINGS:
+            to_nbn[mapping].setdefault(key, ([], [], []))[_GROUPING_ROLES.index(role)].append(mrid)
+        else:
+            to_nbn[mapping].setdefault(key, []).append(mrid)
+
+    return to_bbn, to_nbn
+
+
+def load_mappings(
+        directory: Union[str, Path],
+        node_breaker_network: NetworkService
+) -> BusBranchNetworkCreationMappings:
+    """
+    Reads the mappings written by `export_result`, resolving their mRIDs against `node_breaker_network` when they are
+    first accessed.
+    """
+    return mappings_from_mrids(load_mrid_mappings(directory), node_breaker_network)
+
+
+def _to_list(column: pa.ChunkedArray) -> list:
+    # Much faster than `to_pylist`, which creates an Arrow scalar for every value.
+    array = column.combine_chunks()
+    if pa.types.is_dictionary(array.type):
+        dictionary = array.dictionary.to_pylist()
+        return [dictionary[i] for i in array.indices.to_numpy(zero_copy_only=False).tolist()]
+    return array.to_numpy(zero_copy_only=False).tolist()
+
+
+def _net_table_names() -> List[str]:
+    return [*NET_TABLES, *(f"res_{name}" for name in NET_TABLES)]
+
+
+def _exported_tables(net: pp.pandapowerNet) -> List[str]:
+    tables = list(NET_TABLES)
+    tables.extend(f"res_{name}" for name in NET_TABLES if f"res_{name}" in net and len(net[f"res_{name}"]))
+    return tables
+
+
+def _unlink(path: Path):
+    # Path.unlink(missing_ok=True) needs Python 3.8.
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _materialised_geodata(net: pp.pandapowerNet, geometry: NetGeometry) -> Dict[str, pd.DataFrame]:
+    # The geodata tables the geometry would give the net, leaving the net itself untouched.
+    staged = pp.pandapowerNet({name: net[name] for name in ("bus", "line", "bus_geodata", "line_geodata")})
+    geometry.materialise(staged)
+    return {"bus_geodata": staged.bus_geodata, "line_geodata": staged.line_geodata}
+
+
+def _write(table: pa.Table, directory: Path, name: str, file_format: str):
+    path = directory / f"{name}{_FORMATS[file_format]}"
+    if file_format == "arrow":
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        pq.write_table(table, path)
+
+
+def _net_table_to_arrow(df: pd.DataFrame) -> pa.Table:
+    coords = df["coords"] if "coords" in df.columns else None
+    table = pa.Table.from_pandas(df.drop(columns="coords") if coords is not None else df, preserve_index=True)
+    if coords is not None:
+        table = table.append_column(pa.field("coords", _COORDS_TYPE), _coords_to_arrow(coords))
+    return table
+
+
+def _net_table_from_arrow(table: pa.Table) -> pd.DataFrame:
+    if "coords" not in table.column_names:
+        return table.to_pandas()
+
+    coords = table.column("coords")
+    df = table.drop_columns(["coords"]).to_pandas()
+    df["coords"] = pd.Series(
+        [None if points is None else [tuple(xy) for xy in points] for points in coords.to_pylist()],
+        index=df.index,
+        dtype=object
+    )
+    return df
+
+
+def _coords_to_arrow(coords: pd.Series) -> pa.Array:
+    # Builds the list array from flat offsets and values rather than converting each point as a Python object.
+    point_lists = [points if isinstance(points, (list, tuple, np.ndarray)) else None for points in coords]
+    offsets = np.zeros(len(point_lists) + 1, dtype=np.int32)
+    np.cumsum([0 if points is None else len(points) for points in point_lists], out=offsets[1:])
+    values = np.array([xy for points in point_lists if points is not None for xy in points], dtype=np.float64)
+    points = pa.FixedSizeListArray.from_arrays(pa.array(values.reshape(-1), type=pa.float64()), 2)
+    mask = pa.array([points is None for points in point_lists], type=pa.bool_())
+    return pa.ListArray.from_arrays(pa.array(offsets), points, type=_COORDS_TYPE, mask=mask)
+
+
+def _mrid_mappings_to_arrow(mrid_mappings: MridMappings) -> Tuple[pa.Table, pa.Table]:
+    to_bbn, to_nbn = mrid_mappings
+
+    mrids, element_types, element_indices = [], [], []
+    for mrid, elements in to_bbn.items():
+        for element_type, element_index in elements:
+            mrids.append(mrid)
+            element_types.append(element_type)
+            element_indices.append(element_index)
+    to_bbn_table = pa.table({
+        "mrid": pa.array(mrids, pa.string()),
+        "element_type": pa.array(element_types, pa.string()).dictionary_encode(),
+        "element_index": pa.array(element_indices, pa.int64())
+    })
+
+    columns: Dict[str, list] = {"mapping": [], "element_type": [], "element_index": [], "role": [], "mrid": []}
+
+    def add(mapping: str, key: str, role: str, mapped_mrids: List[str]):
+        element_type, _, element_index = key.partition(":")
+        for mapped_mrid in mapped_mrids:
+            columns["mapping"].append(mapping)
+            columns["element_type"].append(element_type)
+            columns["element_index"].append(int(element_index))
+            columns["role"].append(role)
+            columns["mrid"].append(mapped_mrid)
+
+    for name in GROUPING_MAPPINGS:
+        for key, groups in to_nbn[name].items():
+            for role, group in zip(_GROUPING_ROLES, groups):
+                add(name, key, role, group)
+    for name in SET_MAPPINGS:
+        for key, mapped in to_nbn[name].items():
+            add(name, key, "equipment", mapped)
+
+    to_nbn_table = pa.table({
+        name: pa.array(values, pa.int64() if name == "element_index" else pa.string())
+        for name, values in columns.items()
+    })
+    for name in ("mapping", "element_type", "role"):
+        to_nbn_table = to_nbn_table.set_column(
+            to_nbn_table.schema.get_field_index(name), name, to_nbn_table.column(name).dictionary_encode()
+        )
+    return to_bbn_table, to_nbn_table
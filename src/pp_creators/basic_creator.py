@@ -4,57 +4,133 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import logging
-from typing import FrozenSet, Tuple, Iterable, List, Optional, Callable, Dict, TypeVar
-
-from scipy.spatial import distance
-
-T = TypeVar("T")
+from collections import defaultdict
+from typing import FrozenSet, Tuple, Iterable, List, Optional, Dict
 
+import numpy as np
 import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
 from zepben.evolve import Terminal, NetworkService, AcLineSegment, PowerTransformer, EnergyConsumer, \
     PowerTransformerEnd, ConductingEquipment, \
-    PowerElectronicsConnection, Location, BusBranchNetworkCreator, EnergySource, Switch, Junction, EquivalentBranch, \
-    connected_equipment
-
-from pp_creators.utils import get_upstream_end_to_tns
+    PowerElectronicsConnection, Location, BusBranchNetworkCreator, EnergySource, Switch, EquivalentBranch
+
+from pp_creators.admittance import build_bus_admittance
+from pp_creators.elements import PpElement
+from pp_creators.geometry import NetGeometry, GEOMETRY_MODES
+from pp_creators.load_profiles import LoadRowIndex
+from pp_creators.load_providers import LoadProvider, as_batch_load_provider, PrefetchedLoads, no_load
+from pp_creators.mappings import compact_mappings
+from pp_creators.std_types import intern_std_type
+from pp_creators.switches import create_switch_elements, use_line_switches, SWITCH_TYPES
+from pp_creators.table_buffer import PpTableBuffer, create_element
+from pp_creators.utils import TransformerEndIndex, has_negligible_impedance
 from pp_creators.validators.validator import PandaPowerNetworkValidator
+from pp_creators.warm_start import seed_bus_voltages
 
 __all__ = ["BasicPandaPowerNetworkCreator", "PpElement"]
 
 
-class PpElement:
-    def __init__(self, index: int, type: str):
-        self.index = index
-        self.type = type
-
-
 class BasicPandaPowerNetworkCreator(
     BusBranchNetworkCreator[pp.pandapowerNet, PpElement, PpElement, PpElement, PpElement, PpElement, PpElement,
                             PpElement, PandaPowerNetworkValidator]
 ):
+    # Every element is created through this, so the pandapower table appends can be timed on their own.
+    create_element = staticmethod(create_element)
+    # Every network is created through this, so several networks can be translated into one shared net.
+    create_network = staticmethod(pp.create_empty_network)
 
     def __init__(
             self, *,
             logger: logging.Logger,
             vm_pu: float = 1.0,
-            tx_load_provider: Callable[[PowerTransformer], Tuple[float, float]] = lambda x: (0, 0),
-            ec_load_provider: Callable[[EnergyConsumer], Tuple[float, float]] = lambda x: (0, 0),
-            pec_load_provider: Callable[[PowerElectronicsConnection], Tuple[float, float]] = lambda x: (0, 0),
+            tx_load_provider: LoadProvider = no_load,
+            ec_load_provider: LoadProvider = no_load,
+            pec_load_provider: LoadProvider = no_load,
             min_line_r_ohm: float = 0.001,
             min_line_x_ohm: float = 0.001,
-            include_tap_changers: bool = True
+            include_tap_changers: bool = True,
+            buffer_tables: bool = False,
+            create_zero_loads: bool = False,
+            geometry: str = "geodata",
+            std_types: bool = False,
+            initial_voltages: Optional[pd.DataFrame] = None,
+            switch_elements: bool = False,
+            admittance: bool = False
     ):
+        if geometry not in GEOMETRY_MODES:
+            raise ValueError(f"Unsupported geometry mode {geometry!r}, expected one of {list(GEOMETRY_MODES)}.")
         self.vm_pu = vm_pu
         self.logger = logger
-        self.tx_load_provider = tx_load_provider
-        self.ec_load_provider = ec_load_provider
-        self.pec_load_provider = pec_load_provider
+        self.tx_load_provider = as_batch_load_provider(tx_load_provider)
+        self.ec_load_provider = as_batch_load_provider(ec_load_provider)
+        self.pec_load_provider = as_batch_load_provider(pec_load_provider)
         self.min_line_r_ohm = min_line_r_ohm
         self.min_line_x_ohm = min_line_x_ohm
         self.include_tap_changers = include_tap_changers
+        self.buffer_tables = buffer_tables
+        # A load is normally only created for non-zero P. Creating them for zero P as well means every piece of
+        # equipment has a row that a LoadProfile can be applied to.
+        self.create_zero_loads = create_zero_loads
+        # Where the coordinates of buses and lines are kept, see GEOMETRY_MODES.
+        self.geometry = geometry
+        # Whether each distinct set of line and trafo parameters is added to the net's std_types, and the elements
+        # with them refer to it by name.
+        self.std_types = std_types
+        # The voltages of a previous load flow by mRID, e.g. from bus_voltages_by_mrid, seeded into res_bus so the next
+        # load flow can start from them with init="results".
+        self.initial_voltages = initial_voltages
+        # Whether switches are created as net.switch rows, open or closed, rather than closed switches being collapsed
+        # into the buses either side of them and open switches left out.
+        self.switch_elements = switch_elements
+        # Whether the bus admittance matrix of the net is assembled from its tables once they are written, and set as
+        # the result's `admittance`.
+        self.admittance = admittance
+
+    async def create(self, node_breaker_network: NetworkService):
+        result = await super().create(node_breaker_network)
+        # A net with elements missing, e.g. from a subclass that stops creating them, is not post-processed.
+        complete = result.network is not None and not self._has_missing_elements(result.network)
+        if complete and self.switch_elements:
+            create_switch_elements(self, result, node_breaker_network)
+
+        compact_mappings(result.mappings)
+        if result.network is not None:
+            PrefetchedLoads.detach(result.network)
+            TransformerEndIndex.detach(result.network)
+            result.geometry = NetGeometry.detach(result.network)
+            table_buffer = PpTableBuffer.detach(result.network)
+            if table_buffer is not None:
+                table_buffer.flush(result.network)
+        if complete:
+            if self.switch_elements:
+                use_line_switches(result)
+            result.load_rows = LoadRowIndex.from_mappings(result.mappings, sgen_sign=-1)
+            if self.initial_voltages is not None:
+                seed_bus_voltages(result.network, result.mappings.to_bbn.objects, self.initial_voltages)
+            if self.admittance:
+                result.admittance = build_bus_admittance(result.network)
+        return result
+
+    def _has_missing_elements(self, net: pp.pandapowerNet) -> bool:
+        return False
 
     def bus_branch_network_creator(self, node_breaker_network: NetworkService) -> pp.pandapowerNet:
-        return pp.create_empty_network()
+        net = self.create_network()
+        pts = list(node_breaker_network.objects(PowerTransformer))
+        TransformerEndIndex.attach(net, pts)
+        PrefetchedLoads.attach(net, {
+            "tx": self.tx_load_provider.prefetch(pts),
+            "ec": self.ec_load_provider.prefetch(node_breaker_network.objects(EnergyConsumer)),
+            "pec": self.pec_load_provider.prefetch(node_breaker_network.objects(PowerElectronicsConnection))
+        })
+        if self.geometry == "buffer":
+            NetGeometry.attach(net)
+        if self.buffer_tables:
+            # Rows are staged and handed out indices as they are created, then written in bulk once the whole
+            # network has been translated.
+            PpTableBuffer.attach(net)
+        return net
 
     def topological_node_creator(
             self,
@@ -65,17 +141,24 @@ class BasicPandaPowerNetworkCreator(
             inner_terminals: FrozenSet[Terminal],
             node_breaker_network: NetworkService
     ) -> Tuple[str, PpElement]:
-        locations: List[Location] = [t.conducting_equipment.location for t in border_terminals
-                                     if t.conducting_equipment.location is not None]
-        coords = [(p.x_position, p.y_position) for location in locations for p in location.points]
+        coord = None
+        if self.geometry != "none":
+            coord = next((
+                (p.x_position, p.y_position) for t in border_terminals if t.conducting_equipment.location is not None
+                for p in t.conducting_equipment.location.points
+            ), None)
+        geometry = NetGeometry.of(bus_branch_network)
 
         vn_v = base_voltage
-        bus_idx = pp.create_bus(
+        bus_idx = self.create_element(
             bus_branch_network,
+            "bus",
             vn_kv=vn_v / 1000,
             name=f"bus_{_create_id_from_terminals(border_terminals)}",
-            geodata=coords[0] if coords else None
+            geodata=coord if geometry is None else None
         )
+        if geometry is not None and coord is not None:
+            geometry.buses.add(bus_idx, coord)
         return f"bus:{bus_idx}", PpElement(bus_idx, "bus")
 
     def topological_branch_creator(
@@ -90,34 +173,16 @@ class BasicPandaPowerNetworkCreator(
     ) -> Tuple[str, PpElement]:
         length_km = (length or 1) / 1000
 
-        start_acls = next(iter(border_terminals)).conducting_equipment
-        if start_acls in collapsed_ac_line_segments:
-            acls_series = _order_collapsed_ac_line_segments(collapsed_ac_line_segments, start_acls)
-        else:
-            acls_series = list(collapsed_ac_line_segments)
-        locations: List[Location] = [acls.location for acls in acls_series if acls.location]
-        coords = []
-        if locations:
-            coords = [(p.x_position, p.y_position) for p in locations[0].points]
-        if len(locations) >= 2:
-            next_coords = [(p.x_position, p.y_position) for p in locations[1].points]
-            # Make sure we start the coordinates in the right direction
-            min_dist1 = min(
-                distance.euclidean(coords[-1], next_coords[-1]),
-                distance.euclidean(coords[-1], next_coords[0])
-            )
-            min_dist2 = min(
-                distance.euclidean(coords[0], next_coords[-1]),
-                distance.euclidean(coords[0], next_coords[0])
-            )
-            if min_dist2 < min_dist1:
-                coords = coords[::-1]
-
-            for location in locations[1:]:
-                next_coords = [(p.x_position, p.y_position) for p in location.points]
-                if distance.euclidean(coords[-1], next_coords[-1]) < distance.euclidean(coords[-1], next_coords[0]):
-                    next_coords = next_coords[::-1]
-                coords.extend(next_coords)
+        coords = None
+        if self.geometry != "none":
+            start_acls = next(iter(border_terminals)).conducting_equipment
+            if start_acls in collapsed_ac_line_segments:
+                acls_series = _order_collapsed_ac_line_segments(collapsed_ac_line_segments, start_acls)
+            else:
+                acls_series = list(collapsed_ac_line_segments)
+            locations: List[Location] = [acls.location for acls in acls_series if acls.location]
+            coords = _stitch_coordinates(locations)
+        geometry = NetGeometry.of(bus_branch_network)
 
         # Use r and x of first line
         line = next(iter(collapsed_ac_line_segments))
@@ -126,18 +191,27 @@ class BasicPandaPowerNetworkCreator(
         #  Otherwise the pandapower load flow will fail to run due to a division by 0
         rating_ka = (line.wire_info and line.wire_info.rated_current or 1) / 1000
 
-        line_idx = pp.create_line_from_parameters(
+        line_type = {
+            "r_ohm_per_km": line.per_length_sequence_impedance.r * 1000,
+            "x_ohm_per_km": line.per_length_sequence_impedance.x * 1000,
+            "max_i_ka": rating_ka,
+            "c_nf_per_km": 0
+        }
+        if self.std_types:
+            line_type["std_type"] = intern_std_type(bus_branch_network, "line", line_type)
+
+        line_idx = self.create_element(
             bus_branch_network,
+            "line",
             name=",".join((cacls.name for cacls in collapsed_ac_line_segments)),
             from_bus=connected_topological_nodes[0].index,
             to_bus=connected_topological_nodes[1].index,
             length_km=length_km,
-            r_ohm_per_km=line.per_length_sequence_impedance.r * 1000,
-            x_ohm_per_km=line.per_length_sequence_impedance.x * 1000,
-            max_i_ka=rating_ka,
-            c_nf_per_km=0,
-            geodata=coords
+            **line_type,
+            geodata=[tuple(xy) for xy in coords.tolist()] if coords is not None and geometry is None else None
         )
+        if geometry is not None:
+            geometry.lines.add(line_idx, coords)
         return f"line:{line_idx}", PpElement(line_idx, "line")
 
     def equivalent_branch_creator(self, bus_branch_network: pp.pandapowerNet,
@@ -145,8 +219,9 @@ class BasicPandaPowerNetworkCreator(
                                   node_breaker_network: NetworkService) -> Tuple[str, PpElement]:
         rating_ka = 1  # Equivalent branches have no rating, so we default to 1kA
 
-        line_idx = pp.create_line_from_parameters(
+        line_idx = self.create_element(
             bus_branch_network,
+            "line",
             name=f"{equivalent_branch.mrid}_eb",
             from_bus=connected_topological_nodes[0].index,
             to_bus=connected_topological_nodes[1].index,
@@ -167,8 +242,12 @@ class BasicPandaPowerNetworkCreator(
     ) -> Dict[str, PpElement]:
         mapped_elements: Dict[str, PpElement] = {}
 
-        upstream_end, upstream_tn = get_upstream_end_to_tns(ends_to_topological_nodes)[0]
-        downstream_end, downstream_tn = [(end, tn) for (end, tn) in ends_to_topological_nodes if tn != upstream_tn][0]
+        upstream, downstream = TransformerEndIndex.of_network(bus_branch_network).split_end_to_tns(
+            power_transformer,
+            ends_to_topological_nodes
+        )
+        upstream_end, upstream_tn = upstream[0]
+        downstream_end, downstream_tn = downstream[0]
 
         upstream_voltage = upstream_end.rated_u
         downstream_voltage = downstream_end.rated_u
@@ -199,21 +278,33 @@ class BasicPandaPowerNetworkCreator(
                 "tap_side": "hv" if tap_changer.transformer_end is upstream_end else "lv"
             })
 
-        tx_idx = pp.create_transformer_from_parameters(
+        trafo_type = {
+            "sn_mva": sn_mva,
+            "vn_hv_kv": vn_hv_kv,
+            "vn_lv_kv": vn_lv_kv,
+            "vk_percent": 5,
+            "vkr_percent": 2.5,
+            "pfe_kw": 0,
+            "i0_percent": 0,
+            "vector_group": vector_group,
+            **tap_changer_kwargs
+        }
+        if self.std_types:
+            # The tap position is set per transformer rather than by its type.
+            trafo_type["std_type"] = intern_std_type(
+                bus_branch_network,
+                "trafo",
+                {"shift_degree": 0, **{k: v for k, v in trafo_type.items() if k != "tap_pos"}}
+            )
+
+        tx_idx = self.create_element(
             bus_branch_network,
+            "trafo",
             # NOTE: We are assigning busses based on upstream/downstream instead of hv/lv
             # to handle regulators and step-up transformers.
             hv_bus=upstream_tn.index,
             lv_bus=downstream_tn.index,
-            sn_mva=sn_mva,
-            vn_hv_kv=vn_hv_kv,
-            vn_lv_kv=vn_lv_kv,
-            vk_percent=5,
-            vkr_percent=2.5,
-            pfe_kw=0,
-            i0_percent=0,
-            vector_group=vector_group,
-            **tap_changer_kwargs,
+            **trafo_type,
             name=power_transformer.name
         )
 
@@ -229,21 +320,28 @@ class BasicPandaPowerNetworkCreator(
             mapped_elements: Dict[str, PpElement]
     ) -> PpElement:
         # Create Bus
-        coord: Tuple[float, float] = [(p.x_position, p.y_position) for p in power_transformer.location.points][0]
+        coord: Optional[Tuple[float, float]] = None
+        if self.geometry != "none":
+            coord = [(p.x_position, p.y_position) for p in power_transformer.location.points][0]
+        geometry = NetGeometry.of(bus_branch_network)
 
-        bus_idx = pp.create_bus(
+        bus_idx = self.create_element(
             bus_branch_network,
+            "bus",
             vn_kv=downstream_voltage / 1000,
             name=f"{power_transformer.name}_bus",
-            geodata=coord
+            geodata=coord if geometry is None else None
         )
+        if geometry is not None:
+            geometry.buses.add(bus_idx, coord)
         bus_element = PpElement(bus_idx, "bus")
 
         # Create load or sgen or nothing depending on p
-        p, q = self.tx_load_provider(power_transformer)
-        if p > 0:
-            load_idx = pp.create_load(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "tx", self.tx_load_provider)(power_transformer)
+        if p > 0 or (p == 0 and self.create_zero_loads):
+            load_idx = self.create_element(
                 bus_branch_network,
+                "load",
                 bus=bus_idx,
                 p_mw=p / 1000000,
                 q_mvar=q / 1000000,
@@ -251,8 +349,9 @@ class BasicPandaPowerNetworkCreator(
             )
             mapped_elements[f"load:{load_idx}"] = PpElement(load_idx, "load")
         elif p < 0:
-            sgen_idx = pp.create_sgen(
+            sgen_idx = self.create_element(
                 bus_branch_network,
+                "sgen",
                 bus=bus_idx,
                 p_mw=-p / 1000000,
                 q_mvar=-q / 1000000,
@@ -271,8 +370,9 @@ class BasicPandaPowerNetworkCreator(
             connected_topological_node: PpElement,
             node_breaker_network: NetworkService
     ) -> Dict[str, PpElement]:
-        ext_grid_idx = pp.create_ext_grid(
+        ext_grid_idx = self.create_element(
             bus_branch_network,
+            "ext_grid",
             bus=connected_topological_node.index,
             vm_pu=self.vm_pu,
             name=energy_source.name
@@ -286,11 +386,12 @@ class BasicPandaPowerNetworkCreator(
             connected_topological_node: PpElement,
             node_breaker_network: NetworkService
     ) -> Dict[str, PpElement]:
-        p, q = self.ec_load_provider(energy_consumer)
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "ec", self.ec_load_provider)(energy_consumer)
         mapped_elements = dict()
-        if p > 0:
-            load_idx = pp.create_load(
+        if p > 0 or (p == 0 and self.create_zero_loads):
+            load_idx = self.create_element(
                 bus_branch_network,
+                "load",
                 bus=connected_topological_node.index,
                 p_mw=p / 1000000,
                 q_mvar=q / 1000000,
@@ -298,8 +399,9 @@ class BasicPandaPowerNetworkCreator(
             )
             mapped_elements[f"load:{load_idx}"] = PpElement(load_idx, "load")
         elif p < 0:
-            sgen_idx = pp.create_sgen(
+            sgen_idx = self.create_element(
                 bus_branch_network,
+                "sgen",
                 bus=connected_topological_node.index,
                 p_mw=-p / 1000000,
                 q_mvar=-q / 1000000,
@@ -317,10 +419,13 @@ class BasicPandaPowerNetworkCreator(
             node_breaker_network: NetworkService,
     ) -> Dict[str, PpElement]:
         mapped_elements = dict()
-        p, q = self.pec_load_provider(power_electronics_connection)
-        if p > 0:
-            load_idx = pp.create_load(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "pec", self.pec_load_provider)(
+            power_electronics_connection
+        )
+        if p > 0 or (p == 0 and self.create_zero_loads):
+            load_idx = self.create_element(
                 bus_branch_network,
+                "load",
                 bus=connected_topological_node.index,
                 p_mw=p / 1000000,
                 q_mvar=q / 1000000,
@@ -328,8 +433,9 @@ class BasicPandaPowerNetworkCreator(
             )
             mapped_elements[f"load:{load_idx}"] = PpElement(load_idx, "load")
         elif p < 0:
-            sgen_idx = pp.create_sgen(
+            sgen_idx = self.create_element(
                 bus_branch_network,
+                "sgen",
                 bus=connected_topological_node.index,
                 p_mw=-p / 1000000,
                 q_mvar=-q / 1000000,
@@ -339,23 +445,32 @@ class BasicPandaPowerNetworkCreator(
 
         return mapped_elements
 
+    def switch_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            switch: Switch,
+            buses: Tuple[int, int]
+    ) -> PpElement:
+        # Only called when switch_elements is set, once the rest of the network has been translated.
+        switch_idx = self.create_element(
+            bus_branch_network,
+            "switch",
+            bus=buses[0],
+            element=buses[1],
+            et="b",
+            closed=not switch.is_open(),
+            type=SWITCH_TYPES.get(type(switch)),
+            name=switch.name
+        )
+        return PpElement(switch_idx, "switch")
+
     def has_negligible_impedance(self, ce: ConductingEquipment) -> bool:
-        if isinstance(ce, AcLineSegment):
-            if ce.length == 0 or ce.per_length_sequence_impedance.r == 0:
-                return True
-
-            if ce.length * ce.per_length_sequence_impedance.r < self.min_line_r_ohm \
-                    or ce.length * ce.per_length_sequence_impedance.x < self.min_line_x_ohm:
-                return True
-
-            return False
-        if isinstance(ce, Switch):
-            return not ce.is_open()
-        if isinstance(ce, Junction):
-            return True
-        if isinstance(ce, EquivalentBranch):
-            return True
-        return False
+        return has_negligible_impedance(
+            ce,
+            min_line_r_ohm=self.min_line_r_ohm,
+            min_line_x_ohm=self.min_line_x_ohm,
+            switch_elements=self.switch_elements
+        )
 
     def validator_creator(self) -> PandaPowerNetworkValidator:
         return PandaPowerNetworkValidator(logger=self.logger)
@@ -370,17 +485,72 @@ def _order_collapsed_ac_line_segments(
         collapsed_ac_line_segments: FrozenSet[AcLineSegment],
         start_acls: AcLineSegment
 ) -> List[AcLineSegment]:
-    remaining_acls = set(collapsed_ac_line_segments)
+    # Index the segments by the connectivity nodes they connect to once, so each step along the series is a lookup
+    # rather than a search of the connected equipment.
+    acls_by_node: Dict[str, List[AcLineSegment]] = defaultdict(list)
+    for acls in collapsed_ac_line_segments:
+        for t in acls.terminals:
+            if t.connectivity_node is not None:
+                acls_by_node[t.connectivity_node.mrid].append(acls)
+
+    visited = set()
     acls_series = []
     current_acls = start_acls
     while current_acls:
-        remaining_acls.remove(current_acls)
+        visited.add(current_acls.mrid)
         acls_series.append(current_acls)
-        for cr in connected_equipment(current_acls):
-            if cr.to_equip in remaining_acls:
-                current_acls = cr.to_equip
-                break
-        else:
-            current_acls = None
+        current_acls = next(
+            (acls for t in current_acls.terminals if t.connectivity_node is not None
+             for acls in acls_by_node[t.connectivity_node.mrid] if acls.mrid not in visited),
+            None
+        )
 
     return acls_series
+
+
+def _stitch_coordinates(locations: List[Location]) -> np.ndarray:
+    """
+    Joins the points of an ordered series of locations into a single polyline, reversing any location whose points
+    run against the direction of the series.
+
+    :param locations: The locations of consecutive line segments.
+    :return: An (n, 2) array of x and y positions.
+    """
+    point_arrays = [
+        np.array([(p.x_position, p.y_position) for p in location.points], dtype=np.float64).reshape(-1, 2)
+        for location in locations
+    ]
+    point_arrays = [points for points in point_arrays if len(points)]
+    if not point_arrays:
+        return np.empty((0, 2))
+
+    starts = np.array([points[0] for points in point_arrays])
+    ends = np.array([points[-1] for points in point_arrays])
+
+    # Squared distances between the endpoints of each location and the next one.
+    def sq_dist(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return ((a - b) ** 2).sum(axis=1)
+
+    end_to_start = sq_dist(ends[:-1], starts[1:])
+    end_to_end = sq_dist(ends[:-1], ends[1:])
+    start_to_start = sq_dist(starts[:-1], starts[1:])
+    start_to_end = sq_dist(starts[:-1], ends[1:])
+
+    # Whether a location is reversed depends on which end of the previous location the polyline finished on.
+    reverse_after_forward = end_to_end < end_to_start
+    reverse_after_reversed = start_to_end < start_to_start
+
+    reversed_ = np.zeros(len(point_arrays), dtype=bool)
+    if len(point_arrays) >= 2:
+        # Make sure we start the coordinates in the right direction
+        reversed_[0] = min(start_to_end[0], start_to_start[0]) < min(end_to_end[0], end_to_start[0])
+        for i in range(1, len(point_arrays)):
+            reversed_[i] = reverse_after_reversed[i - 1] if reversed_[i - 1] else reverse_after_forward[i - 1]
+
+    coords = np.empty((sum(len(points) for points in point_arrays), 2), dtype=np.float64)
+    offset = 0
+    for points, is_reversed in zip(point_arrays, reversed_):
+        coords[offset:offset + len(points)] = points[::-1] if is_reversed else points
+        offset += len(points)
+
+    return coords
@@ -0,0 +1,141 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import copy
+import threading
+from concurrent.futures import Executor
+from typing import Optional, Callable
+
+from zepben.evolve import BusBranchNetworkCreator, BusBranchNetworkCreationResult, NetworkService
+
+__all__ = ["CreationProgress", "create_in_executor"]
+
+# The phase of the translation each creator callback is called in. Topological nodes are created as they are first
+# needed by the other callbacks, so they don't start a phase of their own.
+_CALLBACK_PHASES = {
+    "bus_branch_network_creator": "preparing",
+    "topological_node_creator": None,
+    "topological_branch_creator": "topological_branches",
+    "equivalent_branch_creator": "equivalent_branches",
+    "power_transformer_creator": "power_transformers",
+    "energy_source_creator": "energy_sources",
+    "energy_consumer_creator": "energy_consumers",
+    "power_electronics_connection_creator": "power_electronics_connections"
+}
+
+
+class CreationProgress:
+    """
+    How far through a translation started with `create_in_executor` is. It is updated from the thread doing the
+    translation, and can be read at any time.
+
+    `phase` is "pending" before the translation starts, "preparing" while the creator prefetches its loads, then the
+    kind of equipment being translated, e.g. "topological_branches" or "energy_consumers", and "done" once the result is
+    ready. `elements` counts the creator callbacks called so far, which is the number of buses, lines, transformers and
+    other equipment translated.
+    """
+
+    def __init__(self):
+        self.phase = "pending"
+        self.elements = 0
+
+    def __repr__(self):
+        return f"CreationProgress(phase={self.phase!r}, elements={self.elements})"
+
+
+async def create_in_executor(
+        creator: BusBranchNetworkCreator,
+        node_breaker_network: NetworkService,
+        *,
+        progress: Optional[CreationProgress] = None,
+        on_progress: Optional[Callable[[CreationProgress], None]] = None,
+        report_every: int = 1000,
+        executor: Optional[Executor] = None
+) -> BusBranchNetworkCreationResult:
+    """
+    Runs `creator.create(node_breaker_network)` on an executor thread, so the CPU bound translation doesn't block the
+    event loop it is awaited from. Several translations can be awaited at once from the same loop, although they share
+    the GIL, so together they take as long as running them one after the other.
+
+    Cancelling the awaiting task stops the translation at its next creator callback. The task waits for the translation
+    to stop before the cancellation is raised, so the creator and network are no longer in use when it returns.
+
+    A copy of `creator` is used to track progress, so the creator itself is left untouched and can be used at the same
+    time.
+
+    :param creator: Any `BusBranchNetworkCreator`, e.g. one of the pandapower creators.
+    :param node_breaker_network: The `NetworkService` to create a bus-branch network from.
+    :param progress: The `CreationProgress` to update. Defaults to a new one.
+    :param on_progress: Called on the event loop with the progress at the start of each phase, and then every
+        `report_every` elements.
+    :param report_every: How many elements to translate between calls to `on_progress`.
+    :param executor: The executor to run the translation in. Defaults to the loop's default executor.
+    :return: The creation result.
+    """
+    loop = asyncio.get_running_loop()
+    progress = progress if progress is not None else CreationProgress()
+    stopped = threading.Event()
+
+    def report():
+        if on_progress is not None:
+            loop.call_soon_threadsafe(on_progress, progress)
+
+    tracked = copy.copy(creator)
+    for name, phase in _CALLBACK_PHASES.items():
+        setattr(tracked, name, _tracked(getattr(tracked, name), phase, progress, stopped, report, report_every))
+    negligible_impedance = tracked.has_negligible_impedance
+
+    def stoppable_negligible_impedance(ce) -> bool:
+        # Checked for every piece of equipment while the topology is collapsed, so a cancellation is noticed then too.
+        if stopped.is_set():
+            raise _CreationCancelled()
+        return negligible_impedance(ce)
+
+    tracked.has_negligible_impedance = stoppable_negligible_impedance
+
+    future = loop.run_in_executor(executor, asyncio.run, tracked.create(node_breaker_network))
+    try:
+        result = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        stopped.set()
+        try:
+            await future
+        except _CreationCancelled:
+            pass
+        raise
+
+    progress.phase = "done"
+    if on_progress is not None:
+        on_progress(progress)
+    return result
+
+
+class _CreationCancelled(Exception):
+    pass
+
+
+def _tracked(
+        callback: Callable,
+        phase: Optional[str],
+        progress: CreationProgress,
+        stopped: threading.Event,
+        report: Callable[[], None],
+        report_every: int
+) -> Callable:
+    def tracked_callback(*args, **kwargs):
+        if stopped.is_set():
+            raise _CreationCancelled()
+        if phase is not None and progress.phase != phase:
+            progress.phase = phase
+            report()
+        result = callback(*args, **kwargs)
+        if phase != "preparing":
+            progress.elements += 1
+            if progress.elements % report_every == 0:
+                report()
+        return result
+
+    return tracked_callback
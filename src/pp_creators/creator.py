@@ -4,16 +4,24 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import logging
-from typing import FrozenSet, Tuple, Iterable, List, Optional, Dict
+from typing import FrozenSet, Tuple, Iterable, List, Optional, Dict, Set
 
+import numpy as np
 import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from scipy.sparse import csr_matrix
 from zepben.evolve import Terminal, NetworkService, AcLineSegment, PowerTransformer, EnergySource, EnergyConsumer, \
     BusBranchNetworkCreator, \
-    PowerTransformerEnd, ConductingEquipment, PowerElectronicsConnection, EquivalentBranch
+    PowerTransformerEnd, ConductingEquipment, PowerElectronicsConnection, EquivalentBranch, Switch
 
-__all__ = ["PandaPowerNetworkCreator"]
+__all__ = ["PandaPowerNetworkCreator", "TopologyNetwork", "TopologyNetworkCreator"]
 
-from pp_creators.utils import get_upstream_end_to_tns
+from pp_creators.elements import PpElement
+from pp_creators.feeders import create_network_from_equipment
+from pp_creators.mappings import compact_mappings
+from pp_creators.switches import create_switch_elements
+from pp_creators.utils import get_upstream_end_to_tns, TransformerEndIndex, has_negligible_impedance
 from pp_creators.validators.validator import PandaPowerNetworkValidator
 
 
@@ -136,6 +144,258 @@ class PandaPowerNetworkCreator(BusBranchNetworkCreator[pp.pandapowerNet, int, in
         return PandaPowerNetworkValidator(logger=self.logger)
 
 
+class TopologyNetwork:
+    """
+    The connectivity of a translated network: its buses, and the lines, trafos and switches joining them, without any
+    of their electrical parameters. It is indexed the same way as the net of a `BasicPandaPowerNetworkCreator` with the
+    same line thresholds and `switch_elements`, so bus, line, trafo and switch indices match `net.bus`, `net.line`,
+    `net.trafo` and `net.switch`. The only difference is that the buses `BasicPandaPowerNetworkCreator` drops in favour
+    of bus-line switches are kept, with a bus-bus switch to them.
+
+    The electrical parameters of part of the network can be filled in later by translating the `subnetwork` of some of
+    its buses with a pandapower creator.
+    """
+
+    def __init__(self):
+        # The nominal voltage of each bus in volts, and the mRIDs of the equipment collapsed into it.
+        self.bus_voltages: List[Optional[int]] = []
+        self.bus_equipment: List[Tuple[str, ...]] = []
+        # The buses each line, trafo and switch joins, and the mRIDs of the equipment it was created from.
+        self.branch_buses: Dict[str, Tuple[List[int], List[int]]] = {
+            "line": ([], []), "trafo": ([], []), "switch": ([], [])
+        }
+        self.branch_equipment: Dict[str, List[Tuple[str, ...]]] = {"line": [], "trafo": [], "switch": []}
+        # The indices of the open switches.
+        self.open_switches: Set[int] = set()
+        # The bus of each external grid, and the mRID of each energy source, consumer and power electronics
+        # connection with the bus it connects to.
+        self.ext_grid_buses: List[int] = []
+        self.connections: Dict[str, int] = {}
+        self.transformer_ends = TransformerEndIndex()
+
+    @property
+    def bus_count(self) -> int:
+        return len(self.bus_voltages)
+
+    def add_bus(self, voltage: Optional[int], equipment: Iterable[ConductingEquipment]) -> int:
+        self.bus_voltages.append(voltage)
+        self.bus_equipment.append(tuple(ce.mrid for ce in equipment))
+        return len(self.bus_voltages) - 1
+
+    def add_branch(self, branch_type: str, buses: Tuple[int, int], equipment: Iterable[ConductingEquipment]) -> int:
+        from_buses, to_buses = self.branch_buses[branch_type]
+        from_buses.append(buses[0])
+        to_buses.append(buses[1])
+        self.branch_equipment[branch_type].append(tuple(ce.mrid for ce in equipment))
+        return len(from_buses) - 1
+
+    def edges(self) -> pd.DataFrame:
+        """
+        :return: A row for each line, trafo and switch, with its `type`, its `index` in that table, the `from_bus` and
+            `to_bus` it joins and whether it is `closed`. Trafos go from their upstream bus to their downstream bus.
+        """
+        edges = pd.DataFrame({
+            "type": [branch_type for branch_type, (from_buses, _) in self.branch_buses.items() for _ in from_buses],
+            "index": np.concatenate([np.arange(len(from_buses)) for from_buses, _ in self.branch_buses.values()]),
+            "from_bus": np.concatenate([from_buses for from_buses, _ in self.branch_buses.values()]),
+            "to_bus": np.concatenate([to_buses for _, to_buses in self.branch_buses.values()])
+        }).astype({"index": np.int64, "from_bus": np.int64, "to_bus": np.int64})
+        edges["closed"] = ~((edges.type == "switch") & edges["index"].isin(self.open_switches))
+        return edges
+
+    def adjacency(self) -> csr_matrix:
+        """
+        :return: The symmetric bus adjacency matrix, with the number of lines, trafos and closed switches joining each
+            pair of buses.
+        """
+        edges = self.edges()
+        edges = edges[edges.closed]
+        rows = np.concatenate([edges.from_bus.to_numpy(), edges.to_bus.to_numpy()])
+        columns = np.concatenate([edges.to_bus.to_numpy(), edges.from_bus.to_numpy()])
+        return csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)), shape=(self.bus_count, self.bus_count))
+
+    def subnetwork(self, node_breaker_network: NetworkService, buses: Iterable[int]) -> NetworkService:
+        """
+        Finds the equipment of some of the buses, to translate with a pandapower creator when their electrical
+        parameters are needed. Only the load providers of that equipment are called, and only its lines are given
+        impedances and geometry.
+
+        :param node_breaker_network: The translated network.
+        :param buses: The indices of the buses.
+        :return: A `NetworkService` with the equipment collapsed into the buses, the lines, trafos and switches between
+            them, and the equipment connected to them.
+        """
+        buses = set(buses)
+        mrids: Set[str] = set()
+        for bus in buses:
+            mrids.update(self.bus_equipment[bus])
+        for branch_type, (from_buses, to_buses) in self.branch_buses.items():
+            for equipment, from_bus, to_bus in zip(self.branch_equipment[branch_type], from_buses, to_buses):
+                if from_bus in buses and to_bus in buses:
+                    mrids.update(equipment)
+        mrids.update(mrid for mrid, bus in self.connections.items() if bus in buses)
+        return create_network_from_equipment(
+            node_breaker_network.get(mrid, ConductingEquipment) for mrid in sorted(mrids)
+        )
+
+
+class TopologyNetworkCreator(
+    BusBranchNetworkCreator[TopologyNetwork, PpElement, PpElement, PpElement, PpElement, PpElement, PpElement,
+                            PpElement, PandaPowerNetworkValidator]
+):
+    """
+    Translates a network into a `TopologyNetwork`, for jobs that only need its connectivity. Nothing electrical is
+    looked up: no impedances, ratings, locations or loads.
+
+    Buses, lines, trafos, switches and external grids are mapped as by `BasicPandaPowerNetworkCreator`, with the same
+    indices. Energy consumers and power electronics connections are not given elements, but the bus they connect to is
+    kept in `connections`.
+
+    :param min_line_r_ohm: The resistance below which lines are collapsed, as for `BasicPandaPowerNetworkCreator`.
+    :param min_line_x_ohm: The reactance below which lines are collapsed, as for `BasicPandaPowerNetworkCreator`.
+    :param switch_elements: Whether switches are kept as edges, as for `BasicPandaPowerNetworkCreator`.
+    """
+
+    def __init__(
+            self, *,
+            logger: logging.Logger,
+            min_line_r_ohm: float = 0.001,
+            min_line_x_ohm: float = 0.001,
+            switch_elements: bool = False
+    ):
+        self.logger = logger
+        self.min_line_r_ohm = min_line_r_ohm
+        self.min_line_x_ohm = min_line_x_ohm
+        self.switch_elements = switch_elements
+
+    async def create(self, node_breaker_network: NetworkService):
+        result = await super().create(node_breaker_network)
+        if result.network is not None and self.switch_elements:
+            create_switch_elements(self, result, node_breaker_network)
+        compact_mappings(result.mappings)
+        return result
+
+    def bus_branch_network_creator(self, node_breaker_network: NetworkService) -> TopologyNetwork:
+        network = TopologyNetwork()
+        network.transformer_ends = TransformerEndIndex(node_breaker_network.objects(PowerTransformer))
+        return network
+
+    def topological_node_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            base_voltage: Optional[int],
+            collapsed_conducting_equipment: FrozenSet[ConductingEquipment],
+            border_terminals: FrozenSet[Terminal],
+            inner_terminals: FrozenSet[Terminal],
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        bus_idx = bus_branch_network.add_bus(base_voltage, collapsed_conducting_equipment)
+        return f"bus:{bus_idx}", PpElement(bus_idx, "bus")
+
+    def topological_branch_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            connected_topological_nodes: Tuple[PpElement, PpElement],
+            length: Optional[float],
+            collapsed_ac_line_segments: FrozenSet[AcLineSegment],
+            border_terminals: FrozenSet[Terminal],
+            inner_terminals: FrozenSet[Terminal],
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        buses = (connected_topological_nodes[0].index, connected_topological_nodes[1].index)
+        line_idx = bus_branch_network.add_branch("line", buses, collapsed_ac_line_segments)
+        return f"line:{line_idx}", PpElement(line_idx, "line")
+
+    def equivalent_branch_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            connected_topological_nodes: List[PpElement],
+            equivalent_branch: EquivalentBranch,
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        buses = (connected_topological_nodes[0].index, connected_topological_nodes[1].index)
+        line_idx = bus_branch_network.add_branch("line", buses, [equivalent_branch])
+        return f"line:{line_idx}", PpElement(line_idx, "line")
+
+    def power_transformer_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            power_transformer: PowerTransformer,
+            ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, Optional[PpElement]]],
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        mapped_elements: Dict[str, PpElement] = {}
+        upstream, downstream = bus_branch_network.transformer_ends.split_end_to_tns(
+            power_transformer,
+            ends_to_topological_nodes
+        )
+        _, upstream_tn = upstream[0]
+        downstream_end, downstream_tn = downstream[0]
+        if downstream_tn is None:
+            # The same bus BasicPandaPowerNetworkCreator creates for the LV network of a transformer without one.
+            bus_idx = bus_branch_network.add_bus(downstream_end.rated_u, ())
+            downstream_tn = mapped_elements[f"bus:{bus_idx}"] = PpElement(bus_idx, "bus")
+
+        tx_idx = bus_branch_network.add_branch("trafo", (upstream_tn.index, downstream_tn.index), [power_transformer])
+        mapped_elements[f"trafo:{tx_idx}"] = PpElement(tx_idx, "trafo")
+        return mapped_elements
+
+    def energy_source_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            energy_source: EnergySource,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        bus_branch_network.ext_grid_buses.append(connected_topological_node.index)
+        ext_grid_idx = len(bus_branch_network.ext_grid_buses) - 1
+        bus_branch_network.connections[energy_source.mrid] = connected_topological_node.index
+        return {f"ext_grid:{ext_grid_idx}": PpElement(ext_grid_idx, "ext_grid")}
+
+    def energy_consumer_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            energy_consumer: EnergyConsumer,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        bus_branch_network.connections[energy_consumer.mrid] = connected_topological_node.index
+        return {}
+
+    def power_electronics_connection_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            power_electronics_connection: PowerElectronicsConnection,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        bus_branch_network.connections[power_electronics_connection.mrid] = connected_topological_node.index
+        return {}
+
+    def switch_creator(
+            self,
+            bus_branch_network: TopologyNetwork,
+            switch: Switch,
+            buses: Tuple[int, int]
+    ) -> PpElement:
+        # Only called when switch_elements is set, once the rest of the network has been translated.
+        switch_idx = bus_branch_network.add_branch("switch", buses, [switch])
+        if switch.is_open():
+            bus_branch_network.open_switches.add(switch_idx)
+        return PpElement(switch_idx, "switch")
+
+    def has_negligible_impedance(self, ce: ConductingEquipment) -> bool:
+        return has_negligible_impedance(
+            ce,
+            min_line_r_ohm=self.min_line_r_ohm,
+            min_line_x_ohm=self.min_line_x_ohm,
+            switch_elements=self.switch_elements
+        )
+
+    def validator_creator(self) -> PandaPowerNetworkValidator:
+        return PandaPowerNetworkValidator(logger=self.logger)
+
+
 def _create_id_from_terminals(ts: Iterable[Terminal]):
     "_".join(sorted((t.mrid for t in ts)))
     pass
@@ -4,48 +4,94 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import logging
-from typing import FrozenSet, Tuple, Iterable, List, Optional, Callable, Dict
+from typing import FrozenSet, Tuple, Iterable, List, Optional, Dict
 
 import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
 from zepben.evolve import Terminal, NetworkService, AcLineSegment, PowerTransformer, EnergyConsumer, \
     PowerTransformerEnd, ConductingEquipment, \
-    PowerElectronicsConnection, Location, BusBranchNetworkCreator, EnergySource, Switch, Junction, EquivalentBranch
-
-from pp_creators.utils import get_upstream_end_to_tns
+    PowerElectronicsConnection, Location, BusBranchNetworkCreator, EnergySource, EquivalentBranch
+
+from pp_creators.admittance import build_bus_admittance
+from pp_creators.elements import PpElement
+from pp_creators.geometry import NetGeometry, GEOMETRY_MODES
+from pp_creators.load_profiles import LoadRowIndex
+from pp_creators.load_providers import LoadProvider, as_batch_load_provider, PrefetchedLoads, no_load
+from pp_creators.mappings import compact_mappings
+from pp_creators.table_buffer import create_element
+from pp_creators.utils import TransformerEndIndex, has_negligible_impedance
 from pp_creators.validators.validator import PandaPowerNetworkValidator
+from pp_creators.warm_start import seed_bus_voltages
 
 __all__ = ["PandaPowerNetworkCreatorEE", "PpElement"]
 
 
-class PpElement:
-    def __init__(self, index: int, type: str):
-        self.index = index
-        self.type = type
-
-
 class PandaPowerNetworkCreatorEE(
     BusBranchNetworkCreator[pp.pandapowerNet, PpElement, PpElement, PpElement, PpElement, PpElement, PpElement, PpElement,
                             PandaPowerNetworkValidator]
 ):
+    # Every element is created through this, so the pandapower table appends can be timed on their own.
+    create_element = staticmethod(create_element)
+    # Every network is created through this, so several networks can be translated into one shared net.
+    create_network = staticmethod(pp.create_empty_network)
 
     def __init__(
             self, *,
             logger: logging.Logger,
             vm_pu: float = 1.0,
-            load_provider: Callable[[ConductingEquipment], Tuple[float, float]] = lambda x: (0, 0),
-            pec_load_provider: Callable[[ConductingEquipment], Tuple[float, float]] = lambda x: (0, 0),
+            load_provider: LoadProvider = no_load,
+            pec_load_provider: LoadProvider = no_load,
             min_line_r_ohm: float = 0.001,
-            min_line_x_ohm: float = 0.001
+            min_line_x_ohm: float = 0.001,
+            geometry: str = "geodata",
+            initial_voltages: Optional[pd.DataFrame] = None,
+            admittance: bool = False
     ):
+        if geometry not in GEOMETRY_MODES:
+            raise ValueError(f"Unsupported geometry mode {geometry!r}, expected one of {list(GEOMETRY_MODES)}.")
         self.vm_pu = vm_pu
         self.logger = logger
-        self.load_provider = load_provider
-        self.pec_load_provider = pec_load_provider
+        self.load_provider = as_batch_load_provider(load_provider)
+        self.pec_load_provider = as_batch_load_provider(pec_load_provider)
         self.min_line_r_ohm = min_line_r_ohm
         self.min_line_x_ohm = min_line_x_ohm
+        # Where the coordinates of buses and lines are kept, see GEOMETRY_MODES.
+        self.geometry = geometry
+        # The voltages of a previous load flow by mRID, e.g. from bus_voltages_by_mrid, seeded into res_bus so the next
+        # load flow can start from them with init="results".
+        self.initial_voltages = initial_voltages
+        # Whether the bus admittance matrix of the net is assembled from its tables, and set as the result's
+        # `admittance`.
+        self.admittance = admittance
+
+    async def create(self, node_breaker_network: NetworkService):
+        result = await super().create(node_breaker_network)
+
+        compact_mappings(result.mappings)
+        if result.network is not None:
+            PrefetchedLoads.detach(result.network)
+            TransformerEndIndex.detach(result.network)
+            result.geometry = NetGeometry.detach(result.network)
+            result.load_rows = LoadRowIndex.from_mappings(result.mappings, sgen_sign=1)
+            if self.initial_voltages is not None:
+                seed_bus_voltages(result.network, result.mappings.to_bbn.objects, self.initial_voltages)
+            if self.admittance:
+                result.admittance = build_bus_admittance(result.network)
+        return result
 
     def bus_branch_network_creator(self, node_breaker_network: NetworkService) -> pp.pandapowerNet:
-        return pp.create_empty_network()
+        net = self.create_network()
+        # Both providers are also used for the load and generation behind transformers without an LV network.
+        pts = list(node_breaker_network.objects(PowerTransformer))
+        TransformerEndIndex.attach(net, pts)
+        if self.geometry == "buffer":
+            NetGeometry.attach(net)
+        PrefetchedLoads.attach(net, {
+            "load": self.load_provider.prefetch([*pts, *node_breaker_network.objects(EnergyConsumer)]),
+            "pec": self.pec_load_provider.prefetch([*pts, *node_breaker_network.objects(PowerElectronicsConnection)])
+        })
+        return net
 
     def topological_node_creator(
             self,
@@ -56,17 +102,24 @@ class PandaPowerNetworkCreatorEE(
             inner_terminals: FrozenSet[Terminal],
             node_breaker_network: NetworkService
     ) -> Tuple[str, PpElement]:
-        locations: List[Location] = [t.conducting_equipment.location for t in border_terminals
-                                     if t.conducting_equipment.location is not None]
-        coords = [(p.x_position, p.y_position) for location in locations for p in location.points]
+        coord = None
+        if self.geometry != "none":
+            coord = next((
+                (p.x_position, p.y_position) for t in border_terminals if t.conducting_equipment.location is not None
+                for p in t.conducting_equipment.location.points
+            ), None)
+        geometry = NetGeometry.of(bus_branch_network)
 
         vn_v = base_voltage
-        bus_idx = pp.create_bus(
+        bus_idx = self.create_element(
             bus_branch_network,
+            "bus",
             vn_kv=vn_v / 1000,
             name=f"bus_{_create_id_from_terminals(border_terminals)}",
-            geodata=coords[0] if len(coords) else None
+            geodata=coord if geometry is None else None
         )
+        if geometry is not None and coord is not None:
+            geometry.buses.add(bus_idx, coord)
         return f"bus:{bus_idx}", PpElement(bus_idx, "bus")
 
     def topological_branch_creator(
@@ -79,8 +132,11 @@ class PandaPowerNetworkCreatorEE(
             inner_terminals: FrozenSet[Terminal],
             node_breaker_network: NetworkService
     ) -> Tuple[str, PpElement]:
-        locations: List[Location] = [acls.location for acls in collapsed_ac_line_segments]
-        coords = [(p.x_position, p.y_position) for location in locations for p in location.points]
+        coords = None
+        if self.geometry != "none":
+            locations: List[Location] = [acls.location for acls in collapsed_ac_line_segments]
+            coords = [(p.x_position, p.y_position) for location in locations for p in location.points]
+        geometry = NetGeometry.of(bus_branch_network)
         voltage = [l.base_voltage.nominal_voltage for l in collapsed_ac_line_segments][0]
         length = (length * 3 if voltage == 12700 else length) / 1000
         line = next(iter(collapsed_ac_line_segments))
@@ -89,8 +145,9 @@ class PandaPowerNetworkCreatorEE(
         #  Otherwise the pandapower load flow will fail to run due to a division by 0
         rating_ka = (1 if line.wire_info is None or line.wire_info.rated_current == 0 else line.wire_info.rated_current) / 1000
 
-        line_idx = pp.create_line_from_parameters(
+        line_idx = self.create_element(
             bus_branch_network,
+            "line",
             name=",".join((cacls.name for cacls in collapsed_ac_line_segments)),
             from_bus=connected_topological_nodes[0].index,
             to_bus=connected_topological_nodes[1].index,
@@ -99,8 +156,10 @@ class PandaPowerNetworkCreatorEE(
             x_ohm_per_km=line.per_length_sequence_impedance.x * 1000,
             max_i_ka=rating_ka,
             c_nf_per_km=0,
-            geodata=coords
+            geodata=coords if geometry is None else None
         )
+        if geometry is not None:
+            geometry.lines.add(line_idx, coords)
         return f"line:{line_idx}", PpElement(line_idx, "line")
 
     def equivalent_branch_creator(self, bus_branch_network: pp.pandapowerNet, connected_topological_nodes: List[PpElement], equivalent_branch: EquivalentBranch,
@@ -108,8 +167,9 @@ class PandaPowerNetworkCreatorEE(
         length = 1.5
         rating_ka = 1
 
-        line_idx = pp.create_line_from_parameters(
+        line_idx = self.create_element(
             bus_branch_network,
+            "line",
             name=f"{equivalent_branch.mrid}_eb",
             from_bus=connected_topological_nodes[0].index,
             to_bus=connected_topological_nodes[1].index,
@@ -130,8 +190,12 @@ class PandaPowerNetworkCreatorEE(
     ) -> Dict[str, PpElement]:
         mapped_elements: Dict[str, PpElement] = {}
 
-        upstream_end, upstream_tn = get_upstream_end_to_tns(ends_to_topological_nodes)[0]
-        downstream_end, downstream_tn = [(end, tn) for (end, tn) in ends_to_topological_nodes if tn != upstream_tn][0]
+        upstream, downstream = TransformerEndIndex.of_network(bus_branch_network).split_end_to_tns(
+            power_transformer,
+            ends_to_topological_nodes
+        )
+        upstream_end, upstream_tn = upstream[0]
+        downstream_end, downstream_tn = downstream[0]
 
         upstream_voltage = upstream_end.rated_u
         downstream_voltage = downstream_end.rated_u
@@ -150,8 +214,9 @@ class PandaPowerNetworkCreatorEE(
         vn_lv_kv = downstream_voltage / 1000
         vector_group = "Dyn"
 
-        tx_idx = pp.create_transformer_from_parameters(
+        tx_idx = self.create_element(
             bus_branch_network,
+            "trafo",
             # NOTE: We are assigning busses based on upstream/downstream instead of hv/lv
             # to handle regulators and step-up transformers.
             hv_bus=upstream_tn.index,
@@ -179,20 +244,27 @@ class PandaPowerNetworkCreatorEE(
             mapped_elements: Dict[str, PpElement]
     ) -> PpElement:
         # Create Bus
-        coord: Tuple[float, float] = [(p.x_position, p.y_position) for p in power_transformer.location.points][0]
+        coord: Optional[Tuple[float, float]] = None
+        if self.geometry != "none":
+            coord = [(p.x_position, p.y_position) for p in power_transformer.location.points][0]
+        geometry = NetGeometry.of(bus_branch_network)
 
-        bus_idx = pp.create_bus(
+        bus_idx = self.create_element(
             bus_branch_network,
+            "bus",
             vn_kv=downstream_voltage / 1000,
             name=f"{power_transformer.name}_bus",
-            geodata=coord
+            geodata=coord if geometry is None else None
         )
+        if geometry is not None:
+            geometry.buses.add(bus_idx, coord)
         bus_element = PpElement(bus_idx, "bus")
 
         # Create Load
-        p, q = self.load_provider(power_transformer)
-        load_idx = pp.create_load(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "load", self.load_provider)(power_transformer)
+        load_idx = self.create_element(
             bus_branch_network,
+            "load",
             bus=bus_idx,
             p_mw=p / 1000000,
             q_mvar=q / 1000000,
@@ -200,9 +272,10 @@ class PandaPowerNetworkCreatorEE(
         )
 
         # Create PV
-        p, q = self.pec_load_provider(power_transformer)
-        pv_load_idx = pp.create_sgen(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "pec", self.pec_load_provider)(power_transformer)
+        pv_load_idx = self.create_element(
             bus_branch_network,
+            "sgen",
             bus=bus_idx,
             p_mw=p / 1000000,
             q_mvar=q / 1000000,
@@ -222,8 +295,9 @@ class PandaPowerNetworkCreatorEE(
             connected_topological_node: PpElement,
             node_breaker_network: NetworkService
     ) -> Dict[str, PpElement]:
-        ext_grid_idx = pp.create_ext_grid(
+        ext_grid_idx = self.create_element(
             bus_branch_network,
+            "ext_grid",
             bus=connected_topological_node.index,
             vm_pu=self.vm_pu,
             name=energy_source.name
@@ -237,9 +311,10 @@ class PandaPowerNetworkCreatorEE(
             connected_topological_node: PpElement,
             node_breaker_network: NetworkService
     ) -> Dict[str, PpElement]:
-        p, q = self.load_provider(energy_consumer)
-        load_idx = pp.create_load(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "load", self.load_provider)(energy_consumer)
+        load_idx = self.create_element(
             bus_branch_network,
+            "load",
             bus=connected_topological_node.index,
             p_mw=p / 1000000,
             q_mvar=q / 1000000,
@@ -255,9 +330,12 @@ class PandaPowerNetworkCreatorEE(
             connected_topological_node: PpElement,
             node_breaker_network: NetworkService,
     ) -> Dict[str, PpElement]:
-        p, q = self.pec_load_provider(power_electronics_connection)
-        load_idx = pp.create_sgen(
+        p, q = PrefetchedLoads.lookup(bus_branch_network, "pec", self.pec_load_provider)(
+            power_electronics_connection
+        )
+        load_idx = self.create_element(
             bus_branch_network,
+            "sgen",
             bus=connected_topological_node.index,
             p_mw=p / 1000000,
             q_mvar=q / 1000000,
@@ -267,22 +345,11 @@ class PandaPowerNetworkCreatorEE(
         return {f"sgen:{load_idx}": PpElement(load_idx, "sgen")}
 
     def has_negligible_impedance(self, ce: ConductingEquipment) -> bool:
-        if isinstance(ce, AcLineSegment):
-            if ce.length == 0 or ce.per_length_sequence_impedance.r == 0:
-                return True
-
-            if ce.length * ce.per_length_sequence_impedance.r < self.min_line_r_ohm \
-                    or ce.length * ce.per_length_sequence_impedance.x < self.min_line_x_ohm:
-                return True
-
-            return False
-        if isinstance(ce, Switch):
-            return not ce.is_open()
-        if isinstance(ce, Junction):
-            return True
-        if isinstance(ce, EquivalentBranch):
-            return True
-        return False
+        return has_negligible_impedance(
+            ce,
+            min_line_r_ohm=self.min_line_r_ohm,
+            min_line_x_ohm=self.min_line_x_ohm
+        )
 
     def validator_creator(self) -> PandaPowerNetworkValidator:
         return PandaPowerNetworkValidator(logger=self.logger)
@@ -0,0 +1,33 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["PpElement"]
+
+
+class PpElement:
+    """
+    A reference to a row of a pandapower element table, e.g. `PpElement(3, "bus")` for row 3 of `net.bus`. Elements
+    referring to the same row are equal.
+
+    :param index: The index of the row.
+    :param type: The name of the element table.
+    """
+    __slots__ = ("index", "type")
+
+    def __init__(self, index: int, type: str):
+        self.index = int(index)
+        self.type = type
+
+    def __eq__(self, other):
+        if not isinstance(other, PpElement):
+            return NotImplemented
+        return self.index == other.index and self.type == other.type
+
+    def __hash__(self):
+        return hash((self.type, self.index))
+
+    def __repr__(self):
+        return f"PpElement({self.index}, {self.type!r})"
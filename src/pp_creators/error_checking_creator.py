@@ -3,48 +3,181 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import FrozenSet, Tuple, List, Optional, Set, Dict
+import asyncio
+import queue
+import threading
+from typing import FrozenSet, Tuple, List, Optional, Set, Dict, Callable, NamedTuple, Union, Collection, Iterator, \
+    Any
 
 from zepben.evolve import Terminal, NetworkService, AcLineSegment, PowerTransformer, EnergyConsumer, \
     PowerTransformerEnd, ConductingEquipment, \
     PowerElectronicsConnection, BusBranchNetworkCreator, IdentifiedObject, BusBranchNetworkCreationValidator, \
-    EnergySource
+    EnergySource, EquivalentBranch, BusBranchNetworkCreationResult
 
-from pp_creators.utils import get_upstream_end_to_tns
+from pp_creators.utils import TransformerEndIndex
 
-__all__ = ["NetworkError", "NetworkErrors", "ErrorAggregator"]
+__all__ = ["NetworkError", "NetworkErrors", "NetworkErrorEvent", "FatalNetworkError", "ErrorAggregator"]
 
 
 class NetworkError:
+    """
+    A category of problem found in a network.
 
-    def __init__(self, description: str, ios: Set[IdentifiedObject] = None):
+    :param description: A description of the problem.
+    :param mrids: The mRIDs of the objects with the problem.
+    :param fatal: Whether the pandapower creators fail to translate a network with the problem.
+    """
+
+    def __init__(self, description: str, mrids: Set[str] = None, *, fatal: bool = False):
         self.description = description
-        self.ios = set() if ios is None else ios
+        self.mrids = set() if mrids is None else mrids
+        self.fatal = fatal
+        # Whether more objects had the problem than were kept.
+        self.truncated = False
 
 
-class NetworkErrors:
+class NetworkErrorEvent(NamedTuple):
+    """
+    An object found to have a problem.
+    """
+    category: str
+    description: str
+    mrid: str
+
+
+class FatalNetworkError(Exception):
+    """
+    Raised by `NetworkErrors.add` to stop checking a network on an error in one of its fail-fast categories.
+    """
+
+    def __init__(self, errors: 'NetworkErrors', category: str):
+        super().__init__(f"{errors.errors[category].description}: {next(iter(errors.errors[category].mrids))}")
+        self.errors = errors
+        self.category = category
 
-    def __init__(self):
+
+class NetworkErrors:
+    """
+    The problems found in a network, by category.
+
+    :param max_per_category: The maximum number of mRIDs to keep for each category. Further objects with the problem are
+        ignored, and the category is marked as truncated.
+    :param fail_fast: The categories that stop the check as soon as an object is found with them. True for every fatal
+        category.
+    :param on_error: Called with each object found to have a problem, as it is found.
+    :param transformer_ends: The ends of the transformers being checked. Defaults to finding them as they are checked.
+    """
+
+    def __init__(
+            self, *,
+            max_per_category: Optional[int] = None,
+            fail_fast: Union[bool, Collection[str]] = False,
+            on_error: Optional[Callable[[NetworkErrorEvent], None]] = None,
+            transformer_ends: Optional[TransformerEndIndex] = None
+    ):
         self.errors: Dict[str, NetworkError] = {
-            "missing_voltage": NetworkError("Equipment has no voltage"),
-            "acls_missing_length": NetworkError("AcLineSegment has no length"),
-            "pt_no_upstream_terminal": NetworkError("PowerTransformer has no upstream terminal"),
-            "pt_multiple_upstream_terminals": NetworkError("PowerTransformer has multiple upstream terminals"),
+            "missing_voltage": NetworkError("Equipment has no voltage", fatal=True),
+            "acls_missing_length": NetworkError("AcLineSegment has no length", fatal=True),
+            "pt_no_upstream_terminal": NetworkError("PowerTransformer has no upstream terminal", fatal=True),
+            "pt_multiple_upstream_terminals": NetworkError("PowerTransformer has multiple upstream terminals",
+                                                             fatal=True),
             "pt_no_downstream_terminal": NetworkError("PowerTransformer has no downstream terminal"),
             "pt_multiple_downstream_terminals": NetworkError("PowerTransformer has multiple downstream terminals"),
             "pt_terminals_and_end_terminals_not_matching": NetworkError(
                 "PowerTransformer terminals do not match the ends' terminals"),
-            "pt_end_missing_voltage": NetworkError("PowerTransformer end has no voltage")
+            "pt_end_missing_voltage": NetworkError("PowerTransformer end has no voltage", fatal=True)
         }
         self.count: int = 0
+        self.max_per_category = max_per_category
+        if fail_fast is True:
+            fail_fast = {category for category, error in self.errors.items() if error.fatal}
+        self.fail_fast: Set[str] = set(fail_fast or ())
+        self.on_error = on_error
+        self.transformer_ends = transformer_ends or TransformerEndIndex()
+        # The category that stopped the check early, if any.
+        self.stopped_on: Optional[str] = None
+
+    def add(self, category: str, io: IdentifiedObject):
+        """
+        Records that `io` has the problem `category`.
+
+        :raises FatalNetworkError: If `category` is one of the fail-fast categories.
+        """
+        error = self.errors[category]
+        if io.mrid in error.mrids:
+            return
+        if self.max_per_category is not None and len(error.mrids) >= self.max_per_category:
+            error.truncated = True
+            return
+
+        error.mrids.add(io.mrid)
+        if self.on_error is not None:
+            self.on_error(NetworkErrorEvent(category, error.description, io.mrid))
+        if category in self.fail_fast:
+            self.stopped_on = category
+            raise FatalNetworkError(self, category)
+
+    @property
+    def has_fatal_errors(self) -> bool:
+        return any(error.fatal and error.mrids for error in self.errors.values())
+
+    def check_topological_node(
+            self,
+            base_voltage: Optional[int],
+            collapsed_conducting_equipment: FrozenSet[ConductingEquipment],
+            border_terminals: FrozenSet[Terminal],
+            inner_terminals: FrozenSet[Terminal]
+    ):
+        if base_voltage is None:
+            for cce in collapsed_conducting_equipment:
+                if cce.base_voltage is None:
+                    self.add("missing_voltage", cce)
+
+            for t in border_terminals:
+                if t.conducting_equipment.base_voltage is None:
+                    self.add("missing_voltage", t.conducting_equipment)
+
+            for t in inner_terminals:
+                if t.conducting_equipment.base_voltage is None:
+                    self.add("missing_voltage", t.conducting_equipment)
+
+    def check_topological_branch(self, collapsed_ac_line_segments: FrozenSet[AcLineSegment]):
+        for acls in collapsed_ac_line_segments:
+            if acls.length is None:
+                self.add("acls_missing_length", acls)
+
+    def check_power_transformer(
+            self,
+            power_transformer: PowerTransformer,
+            ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, Optional[Any]]]
+    ):
+        ends = self.transformer_ends.ends(power_transformer)
+        upstream, downstream = self.transformer_ends.split_end_to_tns(power_transformer, ends_to_topological_nodes)
+        upstream_tns = [tn for (end, tn) in upstream]
+        downstream_tns = [tn for (end, tn) in downstream if tn is not None]
+        if len(upstream_tns) == 0:
+            self.add("pt_no_upstream_terminal", power_transformer)
+        if len(upstream_tns) > 1:
+            self.add("pt_multiple_upstream_terminals", power_transformer)
+        if len(downstream_tns) == 0:
+            self.add("pt_no_downstream_terminal", power_transformer)
+        if len(downstream_tns) > 1:
+            self.add("pt_multiple_downstream_terminals", power_transformer)
+
+        ends_missing_voltage = [end for end in power_transformer.ends if end.rated_u is None]
+        if len(ends_missing_voltage):
+            self.add("pt_end_missing_voltage", power_transformer)
+
+        if not ends.terminals_match:
+            self.add("pt_terminals_and_end_terminals_not_matching", power_transformer)
 
     def get_errors(self) -> List[NetworkError]:
-        return sorted(self.errors.values(), key=lambda val: len(val.ios), reverse=True)
+        return sorted(self.errors.values(), key=lambda val: len(val.mrids), reverse=True)
 
     def add_errors(self, new_errors: 'NetworkErrors'):
         for k, err in new_errors.errors.items():
-            for io in err.ios:
-                self.errors[k].ios.add(io)
+            self.errors[k].mrids.update(err.mrids)
+            self.errors[k].truncated |= err.truncated
 
     def get_inc(self):
         val = self.count
@@ -52,7 +185,7 @@ class NetworkErrors:
         return val
 
 
-class PermissiveValidator(BusBranchNetworkCreationValidator[NetworkErrors, int, int, int, int, int, int]):
+class PermissiveValidator(BusBranchNetworkCreationValidator[NetworkErrors, int, int, int, int, int, int, int]):
 
     def is_valid_network_data(self, node_breaker_network: NetworkService) -> bool:
         return True
@@ -63,6 +196,9 @@ class PermissiveValidator(BusBranchNetworkCreationValidator[NetworkErrors, int,
     def is_valid_topological_branch_data(self, *arg, **kargs) -> bool:
         return True
 
+    def is_valid_equivalent_branch_data(self, *arg, **kargs) -> bool:
+        return True
+
     def is_valid_power_transformer_data(self, *arg, **kargs) -> bool:
         return True
 
@@ -76,10 +212,100 @@ class PermissiveValidator(BusBranchNetworkCreationValidator[NetworkErrors, int,
         return True
 
 
-class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int, int, int, PermissiveValidator]):
+class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int, int, int, int, PermissiveValidator]):
+    """
+    Checks a network for problems that would stop it being translated, collecting them in the `NetworkErrors` that is
+    the network of the creation result.
+
+    :param max_per_category: The maximum number of mRIDs to keep for each category of problem.
+    :param fail_fast: The categories of problem to stop checking on, or True for every fatal category. A check that
+        stops early is unsuccessful, but its result still has the errors found so far.
+    :param on_error: Called with each object found to have a problem, as it is found.
+    """
+
+    def __init__(
+            self, *,
+            max_per_category: Optional[int] = None,
+            fail_fast: Union[bool, Collection[str]] = False,
+            on_error: Optional[Callable[[NetworkErrorEvent], None]] = None
+    ):
+        self.max_per_category = max_per_category
+        self.fail_fast = fail_fast
+        self.on_error = on_error
+        # Set to stop a streamed check at its next callback.
+        self._stopped: Optional[threading.Event] = None
+
+    async def create(self, node_breaker_network: NetworkService) -> BusBranchNetworkCreationResult:
+        try:
+            return await super().create(node_breaker_network)
+        except FatalNetworkError as e:
+            result = BusBranchNetworkCreationResult(self.validator_creator())
+            result.network = e.errors
+            return result
+
+    def stream_errors(
+            self,
+            node_breaker_network: NetworkService,
+            *,
+            buffer_size: int = 1024
+    ) -> Iterator[NetworkErrorEvent]:
+        """
+        Checks `node_breaker_network` in a background thread, yielding each problem as it is found. Closing the
+        generator, e.g. by breaking out of a loop over it, stops the check at its next callback.
+
+        :param buffer_size: The number of problems that can be found ahead of the consumer before the check waits.
+        """
+        events: queue.Queue = queue.Queue(maxsize=buffer_size)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item):
+            while True:
+                if stopped.is_set():
+                    raise _StopStreaming()
+                try:
+                    events.put(item, timeout=0.05)
+                    return
+                except queue.Full:
+                    pass
+
+        aggregator = ErrorAggregator(max_per_category=self.max_per_category, fail_fast=self.fail_fast, on_error=put)
+        aggregator._stopped = stopped
+
+        def check():
+            try:
+                asyncio.run(aggregator.create(node_breaker_network))
+                put(done)
+            except _StopStreaming:
+                pass
+            except BaseException as e:
+                try:
+                    put(e)
+                except _StopStreaming:
+                    pass
+
+        # A daemon thread, so a generator that is never closed cannot stop the interpreter from exiting.
+        thread = threading.Thread(target=check, name="stream_errors", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = events.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            thread.join()
 
     def bus_branch_network_creator(self, node_breaker_network: NetworkService) -> NetworkErrors:
-        return NetworkErrors()
+        return NetworkErrors(
+            max_per_category=self.max_per_category,
+            fail_fast=self.fail_fast,
+            on_error=self.on_error,
+            transformer_ends=TransformerEndIndex(node_breaker_network.objects(PowerTransformer))
+        )
 
     def topological_node_creator(
             self,
@@ -90,19 +316,13 @@ class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int,
             inner_terminals: FrozenSet[Terminal],
             node_breaker_network: NetworkService
     ) -> Tuple[int, int]:
-        if base_voltage is None:
-            for cce in collapsed_conducting_equipment:
-                if cce.base_voltage is None:
-                    bus_branch_network.errors["missing_voltage"].ios.add(cce)
-
-            for t in border_terminals:
-                if t.conducting_equipment.base_voltage is None:
-                    bus_branch_network.errors["missing_voltage"].ios.add(t.conducting_equipment)
-
-            for t in inner_terminals:
-                if t.conducting_equipment.base_voltage is None:
-                    bus_branch_network.errors["missing_voltage"].ios.add(t.conducting_equipment)
-
+        self._check_stopped()
+        bus_branch_network.check_topological_node(
+            base_voltage,
+            collapsed_conducting_equipment,
+            border_terminals,
+            inner_terminals
+        )
         count = bus_branch_network.get_inc()
         return count, count
 
@@ -116,9 +336,19 @@ class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int,
             inner_terminals: FrozenSet[Terminal],
             node_breaker_network: NetworkService
     ) -> Tuple[int, int]:
-        for acls in collapsed_ac_line_segments:
-            if acls.length is None:
-                bus_branch_network.errors["acls_missing_length"].ios.add(acls)
+        self._check_stopped()
+        bus_branch_network.check_topological_branch(collapsed_ac_line_segments)
+        count = bus_branch_network.get_inc()
+        return count, count
+
+    def equivalent_branch_creator(
+            self,
+            bus_branch_network: NetworkErrors,
+            connected_topological_nodes: List[int],
+            equivalent_branch: EquivalentBranch,
+            node_breaker_network: NetworkService
+    ) -> Tuple[int, int]:
+        self._check_stopped()
         count = bus_branch_network.get_inc()
         return count, count
 
@@ -129,33 +359,15 @@ class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int,
             ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, Optional[int]]],
             node_breaker_network: NetworkService
     ) -> Dict[int, int]:
-        upstream_end_to_tns = get_upstream_end_to_tns(ends_to_topological_nodes)
-        upstream_tns = [tn for (end, tn) in upstream_end_to_tns]
-        downstream_tns = [tn for (end, tn) in ends_to_topological_nodes if tn not in upstream_tns and tn is not None]
-        if len(upstream_tns) == 0:
-            bus_branch_network.errors["pt_no_upstream_terminal"].ios.add(power_transformer)
-        if len(upstream_tns) > 1:
-            bus_branch_network.errors["pt_multiple_upstream_terminals"].ios.add(power_transformer)
-        if len(downstream_tns) == 0:
-            bus_branch_network.errors["pt_no_downstream_terminal"].ios.add(power_transformer)
-        if len(downstream_tns) > 1:
-            bus_branch_network.errors["pt_multiple_downstream_terminals"].ios.add(power_transformer)
-
-        ends_missing_voltage = [end for end in power_transformer.ends if end.rated_u is None]
-        if len(ends_missing_voltage):
-            bus_branch_network.errors["pt_end_missing_voltage"].ios.add(power_transformer)
-
-        end_terminals = {end.terminal.mrid for end in power_transformer.ends if end.terminal is not None}
-        pt_terminals = {t.mrid for t in power_transformer.terminals if t is not None}
-        symm_diff = end_terminals ^ pt_terminals
-        if len(symm_diff) != 0:
-            bus_branch_network.errors["pt_terminals_and_end_terminals_not_matching"].ios.add(power_transformer)
+        self._check_stopped()
+        bus_branch_network.check_power_transformer(power_transformer, ends_to_topological_nodes)
 
         count = bus_branch_network.get_inc()
         return {count: count}
 
     def energy_source_creator(self, bus_branch_network: NetworkErrors, energy_source: EnergySource,
                               connected_topological_node: int, node_breaker_network: NetworkService) -> Dict[int, int]:
+        self._check_stopped()
         count = bus_branch_network.get_inc()
         return {count: count}
 
@@ -165,6 +377,7 @@ class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int,
             connected_topological_node: int,
             node_breaker_network: NetworkService
     ) -> Dict[int, int]:
+        self._check_stopped()
         count = bus_branch_network.get_inc()
         return {count: count}
 
@@ -175,8 +388,17 @@ class ErrorAggregator(BusBranchNetworkCreator[NetworkErrors, int, int, int, int,
             connected_topological_node: int,
             node_breaker_network: NetworkService,
     ) -> Dict[int, int]:
+        self._check_stopped()
         count = bus_branch_network.get_inc()
         return {count: count}
 
     def validator_creator(self) -> PermissiveValidator:
         return PermissiveValidator()
+
+    def _check_stopped(self):
+        if self._stopped is not None and self._stopped.is_set():
+            raise _StopStreaming()
+
+
+class _StopStreaming(Exception):
+    pass
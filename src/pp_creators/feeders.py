@@ -0,0 +1,94 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Dict, Tuple, Iterable, List, Optional
+
+from zepben.evolve import NetworkService, Feeder, ConductingEquipment, FeederDirection, Terminal
+
+__all__ = ["feeder_equipment", "partition_by_feeder", "create_network_from_equipment", "feeder_networks"]
+
+
+def feeder_equipment(feeder: Feeder) -> Dict[str, ConductingEquipment]:
+    """
+    Collects the equipment of a feeder by tracing from its `normal_head_terminal` through every terminal with a
+    downstream feeder direction.
+
+    :param feeder: The `Feeder` to trace.
+    :return: The head equipment and all equipment downstream of the head terminal, keyed by mRID.
+    """
+    head: Terminal = feeder.normal_head_terminal
+    if head is None or head.conducting_equipment is None:
+        return {}
+
+    # NOTE: Everything is keyed by mRID as hashing the CIM objects themselves is comparatively expensive.
+    equipment = {head.conducting_equipment.mrid: head.conducting_equipment}
+    visited = {head.mrid}
+    queue = [head]
+    while queue:
+        terminal = queue.pop()
+        if FeederDirection.DOWNSTREAM not in terminal.normal_feeder_direction:
+            continue
+
+        for connected in terminal.connected_terminals():
+            ce = connected.conducting_equipment
+            if ce is None or connected.mrid in visited:
+                continue
+            visited.add(connected.mrid)
+            equipment[ce.mrid] = ce
+            for other in ce.terminals:
+                if other.mrid not in visited:
+                    visited.add(other.mrid)
+                    queue.append(other)
+
+    return equipment
+
+
+def partition_by_feeder(
+        node_breaker_network: NetworkService
+) -> Tuple[Dict[str, Dict[str, ConductingEquipment]], Dict[str, ConductingEquipment]]:
+    """
+    Splits the equipment of a network by the `Feeder` it belongs to.
+
+    :param node_breaker_network: The `NetworkService` to split.
+    :return: A tuple of the equipment of each feeder keyed by feeder mRID, and the equipment not on any feeder (e.g.
+        the zone substation upstream of the feeder heads). All equipment is keyed by its mRID.
+    """
+    feeders = {feeder.mrid: feeder_equipment(feeder) for feeder in node_breaker_network.objects(Feeder)}
+    on_a_feeder = {mrid for equipment in feeders.values() for mrid in equipment}
+    shared = {ce.mrid: ce for ce in node_breaker_network.objects(ConductingEquipment) if ce.mrid not in on_a_feeder}
+    return feeders, shared
+
+
+def create_network_from_equipment(equipment: Iterable[ConductingEquipment]) -> NetworkService:
+    """
+    Creates a `NetworkService` holding a subset of the equipment of another network. The equipment keeps its
+    connectivity, so the topology collapsed around it is the same as in the full network.
+
+    :param equipment: The equipment to add.
+    :return: A `NetworkService` containing `equipment`.
+    """
+    network = NetworkService()
+    for ce in equipment:
+        network.add(ce)
+    return network
+
+
+def feeder_networks(
+        node_breaker_network: NetworkService,
+        feeder_mrids: Optional[Iterable[str]] = None
+) -> List[NetworkService]:
+    """
+    Splits a network into a `NetworkService` per `Feeder`, each holding the equipment of the feeder together with the
+    equipment that is not on any feeder (e.g. the zone substation).
+
+    :param node_breaker_network: The `NetworkService` to split.
+    :param feeder_mrids: The mRIDs of the feeders to create networks for. Defaults to every feeder.
+    :return: The network of each feeder, in the order of `feeder_mrids`.
+    """
+    feeders, shared = partition_by_feeder(node_breaker_network)
+    return [
+        create_network_from_equipment([*feeders[mrid].values(), *shared.values()])
+        for mrid in (feeders if feeder_mrids is None else feeder_mrids)
+    ]
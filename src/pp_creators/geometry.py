@@ -0,0 +1,165 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from array import array
+from typing import Dict, Optional, Union, Sequence, Tuple
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+
+__all__ = ["GEOMETRY_MODES", "GeometryBuffer", "NetGeometry"]
+
+GEOMETRY_MODES = ("geodata", "buffer", "none")
+"""
+How the pandapower creators store the coordinates of buses and lines: in `bus_geodata` and `line_geodata` as usual, in
+a `NetGeometry` set as `geometry` on the creation result, or not at all.
+"""
+
+_GEOMETRY_KEY = "_geometry"
+
+Coordinates = Union[np.ndarray, Sequence[Tuple[float, float]]]
+
+
+class GeometryBuffer:
+    """
+    The coordinates of the elements of one pandapower table, all in a single contiguous buffer rather than an object
+    per element, laid out like a GeoArrow linestring array: `coords` has the (x, y) of every point, and the points of the
+    `i`th element added are `coords[offsets[i]:offsets[i + 1]]`. `index` is the table index of each element.
+    """
+
+    def __init__(self):
+        self._xy = array("d")
+        self._offsets = array("q", [0])
+        self._index = array("q")
+        self._positions: Optional[Dict[int, int]] = None
+
+    def add(self, index: int, coords: Coordinates):
+        """
+        Adds the points of the element at `index` of the table.
+        """
+        points = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self._xy.frombytes(points.tobytes())
+        self._offsets.append(len(self._xy) // 2)
+        self._index.append(index)
+        self._positions = None
+
+    def extend(self, other: 'GeometryBuffer'):
+        offset = len(self._xy) // 2
+        self._xy.extend(other._xy)
+        self._offsets.extend(o + offset for o in other._offsets[1:])
+        self._index.extend(other._index)
+        self._positions = None
+
+    @property
+    def coords(self) -> np.ndarray:
+        return np.frombuffer(self._xy, dtype=np.float64).reshape(-1, 2)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return np.frombuffer(self._offsets, dtype=np.int64)
+
+    @property
+    def index(self) -> np.ndarray:
+        return np.frombuffer(self._index, dtype=np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self._xy, self._offsets, self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._positions_by_index()
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        :return: A read-only (n, 2) view of the points of the element at `index` of the table.
+        """
+        position = self._positions_by_index()[index]
+        return self.coords[self._offsets[position]:self._offsets[position + 1]]
+
+    def points(self) -> pd.DataFrame:
+        """
+        :return: The first point of each element as `x` and `y` columns, as in `bus_geodata`.
+        """
+        starts = self.offsets[:-1]
+        located = starts < self.offsets[1:]
+        xy = self.coords[starts[located]]
+        return pd.DataFrame({"x": xy[:, 0], "y": xy[:, 1]}, index=self.index[located])
+
+    def linestrings(self) -> pd.DataFrame:
+        """
+        :return: The points of each element as a `coords` column of lists of (x, y) tuples, as in `line_geodata`.
+        """
+        coords = self.coords
+        offsets = self.offsets
+        return pd.DataFrame(
+            {"coords": [list(map(tuple, coords[offsets[i]:offsets[i + 1]].tolist())) for i in range(len(self))]},
+            index=self.index
+        )
+
+    def _positions_by_index(self) -> Dict[int, int]:
+        if self._positions is None:
+            self._positions = {index: position for position, index in enumerate(self._index)}
+        return self._positions
+
+    def __getstate__(self):
+        return self._xy, self._offsets, self._index
+
+    def __setstate__(self, state):
+        self._xy, self._offsets, self._index = state
+        self._positions = None
+
+
+class NetGeometry:
+    """
+    The coordinates of the buses and lines of a pandapower net, kept in a `GeometryBuffer` per table rather than in
+    `bus_geodata` and `line_geodata`. `materialise` writes them to those tables when they are needed.
+    """
+
+    def __init__(self):
+        self.buses = GeometryBuffer()
+        self.lines = GeometryBuffer()
+
+    @staticmethod
+    def attach(net: pp.pandapowerNet) -> 'NetGeometry':
+        geometry = NetGeometry()
+        net[_GEOMETRY_KEY] = geometry
+        return geometry
+
+    @staticmethod
+    def detach(net: pp.pandapowerNet) -> Optional['NetGeometry']:
+        return net.pop(_GEOMETRY_KEY, None)
+
+    @staticmethod
+    def of(net: pp.pandapowerNet) -> Optional['NetGeometry']:
+        """
+        :return: The geometry attached to `net` while it is created, if its coordinates are being buffered.
+        """
+        return net.get(_GEOMETRY_KEY)
+
+    @property
+    def nbytes(self) -> int:
+        return self.buses.nbytes + self.lines.nbytes
+
+    def extend(self, other: 'NetGeometry'):
+        self.buses.extend(other.buses)
+        self.lines.extend(other.lines)
+
+    def materialise(self, net: pp.pandapowerNet):
+        """
+        Replaces the `bus_geodata` and `line_geodata` of `net` with these coordinates.
+        """
+        # Elements may have been dropped from the net since their coordinates were added, e.g. buses replaced by line
+        # switches.
+        points = self.buses.points()
+        linestrings = self.lines.linestrings()
+        points = points[points.index.isin(net.bus.index)]
+        linestrings = linestrings[linestrings.index.isin(net.line.index)]
+        net["bus_geodata"] = points.reindex(columns=net.bus_geodata.columns).astype(net.bus_geodata.dtypes)
+        net["line_geodata"] = linestrings.reindex(columns=net.line_geodata.columns)
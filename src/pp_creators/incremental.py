@@ -0,0 +1,254 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple, Iterable, Mapping, Set, Callable, Any
+
+import pandapower as pp
+from zepben.evolve import NetworkService, BusBranchNetworkCreationResult, TerminalGrouping, Terminal, Switch, \
+    ConductingEquipment, AcLineSegment, EquivalentBranch, PowerTransformer, EnergySource, EnergyConsumer, \
+    PowerElectronicsConnection
+
+from pp_creators.mappings import BUS_COLUMNS
+from pp_creators.parallel_creator import PandaPowerCreator
+from pp_creators.switches import set_switches_open
+from pp_creators.utils import group_terminals, grouping_mrids, get_base_voltage
+
+__all__ = ["IncrementalTranslation", "SwitchingChanges"]
+
+# Equipment that is always given topological nodes for its terminals when it is translated.
+_NODE_CREATING_EQUIPMENT = (EquivalentBranch, PowerTransformer, EnergySource, EnergyConsumer, PowerElectronicsConnection)
+
+
+class SwitchingChanges:
+    """
+    The buses changed by applying a set of switch states to an `IncrementalTranslation`.
+
+    :param created_buses: The buses added to the net.
+    :param removed_buses: The buses dropped from the net.
+    :param updated_buses: The buses that were kept, but now group different terminals.
+    """
+
+    def __init__(self, *, created_buses: List[int], removed_buses: List[int], updated_buses: List[int]):
+        self.created_buses = created_buses
+        self.removed_buses = removed_buses
+        self.updated_buses = updated_buses
+
+    def __repr__(self):
+        return f"SwitchingChanges(created_buses={self.created_buses}, removed_buses={self.removed_buses}, " \
+               f"updated_buses={self.updated_buses})"
+
+
+class IncrementalTranslation:
+    """
+    A translated network that is kept up to date as its switches are opened and closed.
+
+    Closed switches have negligible impedance, so switching changes which terminals are merged into each bus. Rather
+    than translating the whole network again, only the buses that touch a changed switch are regrouped. Buses are split
+    or merged in `net.bus`, the lines, transformers, loads, sgens and external grids connected to them are re-pointed,
+    and the topological node mappings are updated to match. Every other row and mapping is left as it is, so each
+    switching operation costs time proportional to the part of the network it changes.
+
+    Buses keep their index where possible: a merged bus keeps the index of one of the buses merged into it, and the
+    part of a split bus with the most of its terminals keeps the original index.
+
+    :param creator: The creator `result` was created with.
+    :param node_breaker_network: The translated network. Its switches are opened and closed in place.
+    :param result: A successful translation of `node_breaker_network` by `creator`. Its net and mappings are updated
+        in place.
+    """
+
+    def __init__(
+            self, *,
+            creator: PandaPowerCreator,
+            node_breaker_network: NetworkService,
+            result: BusBranchNetworkCreationResult
+    ):
+        if not result.was_successful:
+            raise ValueError("Only a successful translation can be updated incrementally.")
+        self.creator = creator
+        self.node_breaker_network = node_breaker_network
+        self.result = result
+
+    @staticmethod
+    async def create(creator: PandaPowerCreator, node_breaker_network: NetworkService) -> 'IncrementalTranslation':
+        """
+        Translates `node_breaker_network` with `creator` in full, ready for switching changes to be applied.
+        """
+        result = await creator.create(node_breaker_network)
+        return IncrementalTranslation(creator=creator, node_breaker_network=node_breaker_network, result=result)
+
+    @property
+    def network(self) -> pp.pandapowerNet:
+        return self.result.network
+
+    def set_switch_states(self, open_states: Mapping[str, bool]) -> SwitchingChanges:
+        """
+        Opens or closes switches and updates the translation to match.
+
+        :param open_states: Whether each switch should be open, keyed by mRID. Switches already in the requested state
+            are ignored.
+        """
+        changed = []
+        for mrid, is_open in open_states.items():
+            switch = self.node_breaker_network.get(mrid, Switch)
+            if switch.is_open() != is_open:
+                switch.set_open(is_open)
+                changed.append(switch)
+        return self.apply(changed)
+
+    def apply(self, switches: Iterable[Switch]) -> SwitchingChanges:
+        """
+        Updates the translation after `switches` have been opened or closed in the node-breaker network.
+
+        :param switches: Every switch whose state has changed since the translation was last updated.
+        """
+        if getattr(self.creator, "switch_elements", False):
+            # The switches are rows of net.switch, so only their state needs to change.
+            set_switches_open(self.result, {switch.mrid: switch.is_open() for switch in switches})
+            return SwitchingChanges(created_buses=[], removed_buses=[], updated_buses=[])
+
+        net = self.result.network
+        to_bbn = self.result.mappings.to_bbn.objects
+        topological_nodes = self.result.mappings.to_nbn.topological_nodes
+
+        negligible: Dict[str, bool] = {}
+
+        def has_negligible_impedance(ce: ConductingEquipment) -> bool:
+            if ce.mrid not in negligible:
+                negligible[ce.mrid] = self.creator.has_negligible_impedance(ce)
+            return negligible[ce.mrid]
+
+        # The buses the changed switches are part of, or border on when open.
+        old_nodes: Dict[int, Any] = {}
+        for switch in switches:
+            for t in switch.terminals:
+                for element in to_bbn.get(t.mrid, ()):
+                    if element.type == "bus":
+                        old_nodes[element.index] = element
+        if not old_nodes:
+            return SwitchingChanges(created_buses=[], removed_buses=[], updated_buses=[])
+
+        old_groupings = {index: topological_nodes[f"bus:{index}"] for index in old_nodes}
+        old_bus_by_terminal: Dict[str, int] = {
+            t.mrid: index
+            for index, grouping in old_groupings.items()
+            for terminals in (grouping.border_terminals, grouping.inner_terminals)
+            for t in terminals
+        }
+
+        # Regroup the affected terminals, starting from those a full translation would create a bus for. Terminals
+        # across a changed switch that were not part of any bus are reached through the switch.
+        start_terminals: Dict[str, Terminal] = {}
+        for grouping in old_groupings.values():
+            for t in grouping.border_terminals:
+                start_terminals[t.mrid] = t
+        grouped: Set[str] = set()
+        new_groupings: List[TerminalGrouping] = []
+        for mrid in sorted(start_terminals):
+            t = start_terminals[mrid]
+            if mrid in grouped or not _creates_topological_node(t, has_negligible_impedance):
+                continue
+            grouping, terminal_mrids = group_terminals(t, has_negligible_impedance)
+            grouped.update(terminal_mrids)
+            new_groupings.append(grouping)
+
+        # Keep the index of the old bus that shares the most terminals with each new one.
+        new_buses: List[Tuple[TerminalGrouping, Any]] = []
+        available = set(old_nodes)
+        created_buses, updated_buses = [], []
+        for grouping in sorted(new_groupings, key=lambda it: -len(it.border_terminals)):
+            shared = Counter(old_bus_by_terminal[t.mrid] for t in grouping.border_terminals
+                             if old_bus_by_terminal.get(t.mrid) in available)
+            if shared:
+                index = min(shared, key=lambda it: (-shared[it], it))
+                available.remove(index)
+                updated_buses.append(index)
+                new_buses.append((grouping, old_nodes[index]))
+            else:
+                _, node = self.creator.topological_node_creator(
+                    net,
+                    get_base_voltage(grouping.border_terminals),
+                    frozenset(grouping.conducting_equipment_group),
+                    frozenset(grouping.border_terminals),
+                    frozenset(grouping.inner_terminals),
+                    self.node_breaker_network
+                )
+                created_buses.append(node.index)
+                new_buses.append((grouping, node))
+
+        removed_buses = sorted(available)
+        net.bus.drop(index=removed_buses, inplace=True)
+        net.bus_geodata.drop(index=net.bus_geodata.index.intersection(removed_buses), inplace=True)
+
+        self._update_mappings(old_groupings, old_nodes, new_buses)
+        self._repoint_elements(old_bus_by_terminal, new_buses, has_negligible_impedance)
+
+        return SwitchingChanges(created_buses=created_buses, removed_buses=removed_buses,
+                                updated_buses=sorted(updated_buses))
+
+    def _update_mappings(
+            self,
+            old_groupings: Dict[int, TerminalGrouping],
+            old_nodes: Dict[int, Any],
+            new_buses: List[Tuple[TerminalGrouping, Any]]
+    ):
+        to_bbn = self.result.mappings.to_bbn.objects
+        topological_nodes = self.result.mappings.to_nbn.topological_nodes
+
+        for index, grouping in old_groupings.items():
+            del topological_nodes[f"bus:{index}"]
+            for mrid in grouping_mrids(grouping):
+                elements = to_bbn.get(mrid)
+                if elements is not None:
+                    elements.discard(old_nodes[index])
+                    if not elements:
+                        del to_bbn[mrid]
+
+        for grouping, node in new_buses:
+            topological_nodes[f"bus:{node.index}"] = grouping
+            for mrid in grouping_mrids(grouping):
+                to_bbn.setdefault(mrid, set()).add(node)
+
+    def _repoint_elements(
+            self,
+            old_bus_by_terminal: Dict[str, int],
+            new_buses: List[Tuple[TerminalGrouping, Any]],
+            has_negligible_impedance: Callable[[ConductingEquipment], bool]
+    ):
+        net = self.result.network
+        to_bbn = self.result.mappings.to_bbn.objects
+
+        # The old and new bus of each terminal of each element that has moved, in the order the terminals are connected
+        # in a full translation.
+        moves: Dict[Tuple[str, int], List[Tuple[int, int, int]]] = defaultdict(list)
+        for grouping, node in new_buses:
+            for t in grouping.border_terminals:
+                old_bus = old_bus_by_terminal.get(t.mrid)
+                if old_bus is None or old_bus == node.index \
+                        or not _creates_topological_node(t, has_negligible_impedance):
+                    continue
+                for element in to_bbn.get(t.conducting_equipment.mrid, ()):
+                    if element.type != "bus":
+                        moves[(element.type, element.index)].append(
+                            (t.normal_feeder_direction.value, old_bus, node.index)
+                        )
+
+        for (element_type, index), element_moves in moves.items():
+            table = net[element_type]
+            element_moves.sort()
+            for column in BUS_COLUMNS.get(element_type, ("bus",)):
+                current = table.at[index, column]
+                move = next((move for move in element_moves if move[1] == current), None)
+                if move is not None:
+                    table.at[index, column] = move[2]
+                    element_moves.remove(move)
+
+
+def _creates_topological_node(t: Terminal, has_negligible_impedance: Callable[[ConductingEquipment], bool]) -> bool:
+    ce = t.conducting_equipment
+    if isinstance(ce, AcLineSegment):
+        return not has_negligible_impedance(ce)
+    return isinstance(ce, _NODE_CREATING_EQUIPMENT)
@@ -0,0 +1,189 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Iterable
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import NetworkService, BusBranchNetworkCreationResult, ConductingEquipment
+
+from pp_creators.feeders import partition_by_feeder
+from pp_creators.parallel_creator import worker_context
+
+__all__ = ["feeder_buses", "runpp_by_feeder"]
+
+logger = logging.getLogger(__name__)
+
+_BRANCH_BUS_COLUMNS = {"line": ("from_bus", "to_bus"), "trafo": ("hv_bus", "lv_bus")}
+_BUS_ELEMENTS = ("load", "sgen", "ext_grid")
+_RESULT_TABLES = ("bus", "line", "trafo", "load", "sgen", "ext_grid")
+
+
+def feeder_buses(
+        result: BusBranchNetworkCreationResult,
+        node_breaker_network: NetworkService
+) -> Dict[str, Set[int]]:
+    """
+    Finds the buses of each `Feeder` in a translated net, from the elements its equipment and their terminals map to.
+
+    :param result: The creation result of `node_breaker_network` by one of the pandapower creators.
+    :param node_breaker_network: The translated `NetworkService`.
+    :return: The indices of the buses of each feeder, keyed by feeder mRID.
+    """
+    net = result.network
+    objects = result.mappings.to_bbn.objects
+    feeders, _ = partition_by_feeder(node_breaker_network)
+    return {mrid: _buses_of(net, objects, equipment.values()) for mrid, equipment in feeders.items()}
+
+
+def runpp_by_feeder(
+        result: BusBranchNetworkCreationResult,
+        node_breaker_network: NetworkService,
+        *,
+        max_workers: Optional[int] = None,
+        start_method: Optional[str] = None,
+        **kwargs
+):
+    """
+    Runs a load flow on the net of a creation result one `Feeder` at a time, each in its own worker process, and writes
+    the results of every feeder back into the net's `res_*` tables.
+
+    The net is split into a subnet per feeder, plus one for the buses on no feeder. Buses with an external grid are in
+    every subnet, as their voltage is held by it. Its other elements, e.g. the loads on those buses, are only in the
+    first. The results of the external grids, and the powers of the buses they are on, are summed over the subnets.
+
+    This is only the same as a load flow of the whole net if the subnets are independent, i.e. feeders only meet at
+    buses with an external grid. Otherwise, or if there are fewer than two feeders, the whole net is solved with
+    `pp.runpp` as usual.
+
+    :param result: The creation result of `node_breaker_network` by one of the pandapower creators.
+    :param node_breaker_network: The translated `NetworkService`.
+    :param max_workers: The maximum number of worker processes. Defaults to the number of CPUs.
+    :param start_method: The multiprocessing start method of the workers. Defaults to "fork", see `create_by_feeder`.
+    :param kwargs: Keyword arguments for `pp.runpp`.
+    :raises LoadflowNotConverged: If the load flow of any subnet does not converge.
+    """
+    net = result.network
+    shards = _independent_shards(net, feeder_buses(result, node_breaker_network))
+    if shards is None:
+        pp.runpp(net, **kwargs)
+        return
+
+    slack_buses = _slack_buses(net)
+    subnets = [_subnet(net, buses, slack_buses, with_slack_elements=i == 0) for i, buses in enumerate(shards.values())]
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context(start_method, "runpp_by_feeder")) as e:
+        solved = list(e.map(_runpp, subnets, [kwargs] * len(subnets)))
+
+    failed = [name for name, (converged, _) in zip(shards, solved) if not converged]
+    net.converged = not failed
+    if failed:
+        raise pp.LoadflowNotConverged(f"The load flow did not converge for {failed}.")
+    _write_results(net, [results for _, results in solved], slack_buses)
+
+
+def _buses_of(net: pp.pandapowerNet, objects, equipment: Iterable[ConductingEquipment]) -> Set[int]:
+    elements: Dict[str, Set[int]] = {}
+    for ce in equipment:
+        for mrid in (ce.mrid, *(t.mrid for t in ce.terminals)):
+            for element in objects.get(mrid, ()):
+                elements.setdefault(element.type, set()).add(element.index)
+
+    buses = set(elements.get("bus", ()))
+    for element_type, columns in _BRANCH_BUS_COLUMNS.items():
+        rows = net[element_type].loc[sorted(elements.get(element_type, ()))]
+        for column in columns:
+            buses.update(rows[column].tolist())
+    for element_type in _BUS_ELEMENTS:
+        buses.update(net[element_type].bus.loc[sorted(elements.get(element_type, ()))].tolist())
+    return buses
+
+
+def _slack_buses(net: pp.pandapowerNet) -> Set[int]:
+    return set(net.ext_grid.bus[net.ext_grid.in_service].tolist())
+
+
+def _independent_shards(net: pp.pandapowerNet, buses_by_feeder: Dict[str, Set[int]]) -> Optional[Dict[str, Set[int]]]:
+    # The buses of each subnet, not counting the buses with an external grid, or None if the feeders are not
+    # independent.
+    if len(buses_by_feeder) < 2:
+        return None
+
+    slack_buses = _slack_buses(net)
+    shards: Dict[str, Set[int]] = {}
+    shard_of_bus: Dict[int, str] = {}
+    for feeder, buses in buses_by_feeder.items():
+        shards[feeder] = buses - slack_buses
+        for bus in shards[feeder]:
+            if shard_of_bus.setdefault(bus, feeder) != feeder:
+                logger.warning(f"Solving the whole net, as bus {bus} is on feeders {shard_of_bus[bus]} and {feeder}.")
+                return None
+
+    rest = set(net.bus.index.tolist()) - slack_buses - set(shard_of_bus)
+    if rest:
+        shards[""] = rest
+        shard_of_bus.update((bus, "") for bus in rest)
+
+    for element_type, columns in _BRANCH_BUS_COLUMNS.items():
+        table = net[element_type]
+        shard_pairs = zip(*(table[column].map(lambda b: shard_of_bus.get(b)) for column in columns))
+        for index, (a, b) in zip(table.index, shard_pairs):
+            if a is not None and b is not None and a != b:
+                logger.warning(f"Solving the whole net, as {element_type} {index} joins feeders {a!r} and {b!r}.")
+                return None
+
+    bus_switches = net.switch[(net.switch.et == "b") & net.switch.closed]
+    for index, bus, element in zip(bus_switches.index, bus_switches.bus, bus_switches.element):
+        a, b = shard_of_bus.get(bus), shard_of_bus.get(element)
+        if a is not None and b is not None and a != b:
+            logger.warning(f"Solving the whole net, as switch {index} joins feeders {a!r} and {b!r}.")
+            return None
+    return shards
+
+
+def _subnet(
+        net: pp.pandapowerNet,
+        buses: Set[int],
+        slack_buses: Set[int],
+        with_slack_elements: bool
+) -> pp.pandapowerNet:
+    subnet = pp.select_subnet(net, buses | slack_buses)
+    if not with_slack_elements:
+        # The loads and generation on the buses with an external grid are only solved once.
+        for element_type in ("load", "sgen"):
+            table = subnet[element_type]
+            subnet[element_type] = table[~table.bus.isin(slack_buses)]
+    return subnet
+
+
+def _runpp(subnet: pp.pandapowerNet, kwargs: dict) -> Tuple[bool, Dict[str, pd.DataFrame]]:
+    try:
+        pp.runpp(subnet, **kwargs)
+    except pp.LoadflowNotConverged:
+        return False, {}
+    return True, {table: subnet[f"res_{table}"] for table in _RESULT_TABLES}
+
+
+def _write_results(net: pp.pandapowerNet, solved: List[Dict[str, pd.DataFrame]], slack_buses: Set[int]):
+    for table in _RESULT_TABLES:
+        frames = [results[table] for results in solved if len(results[table])]
+        combined = pd.concat(frames, sort=False) if frames else net[f"res_{table}"].iloc[0:0]
+        if table == "ext_grid":
+            res = combined.groupby(level=0).sum()
+        elif table == "bus":
+            # Every subnet has the buses with an external grid. Their voltage is the same in each, and their power is
+            # split between them.
+            res = combined[~combined.index.duplicated()].copy()
+            shared = res.index[res.index.isin(list(slack_buses))]
+            powers = combined.loc[combined.index.isin(shared), ["p_mw", "q_mvar"]].groupby(level=0).sum()
+            res.loc[powers.index, ["p_mw", "q_mvar"]] = powers
+        else:
+            res = combined
+        net[f"res_{table}"] = res.reindex(net[table].index).astype(
+            {column: np.float64 for column in res.columns if res[column].dtype.kind == "f"}
+        )
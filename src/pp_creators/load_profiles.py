@@ -0,0 +1,139 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Optional, List, Tuple, Any, Dict
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from pandapower.control import ConstControl
+from pandapower.timeseries import DFData
+from zepben.evolve import BusBranchNetworkCreationMappings
+
+__all__ = ["LoadRowIndex", "LoadProfile"]
+
+_LOAD_MAPPINGS = ("power_transformers", "energy_consumers", "power_electronics_connections")
+_TABLES = ("load", "sgen")
+
+
+class LoadRowIndex:
+    """
+    The rows of `net.load` and `net.sgen` created for each piece of equipment, keyed by mRID.
+
+    Equipment with both a load and an sgen row, e.g. a transformer without an LV network translated by
+    `PandaPowerNetworkCreatorEE`, is only indexed by its load row, so its P and Q are written once. Its sgen keeps the P
+    and Q it was created with.
+
+    :param load: The `net.load` row of each mRID.
+    :param sgen: The `net.sgen` row of each mRID.
+    :param sgen_sign: The sign applied to P and Q when they are written to an sgen row. `BasicPandaPowerNetworkCreator`
+        creates sgens from negative P, so its index uses -1. `PandaPowerNetworkCreatorEE` uses the provided P as is.
+    """
+
+    def __init__(self, load: pd.Series, sgen: pd.Series, sgen_sign: int = -1):
+        self.load = load
+        self.sgen = sgen
+        self.sgen_sign = sgen_sign
+
+    @staticmethod
+    def from_mappings(mappings: BusBranchNetworkCreationMappings, sgen_sign: int = -1) -> 'LoadRowIndex':
+        rows: Dict[str, Tuple[List[str], List[int]]] = {table: ([], []) for table in _TABLES}
+        for name in _LOAD_MAPPINGS:
+            for element_id, equipment in getattr(mappings.to_nbn, name).items():
+                table, _, index = element_id.partition(":")
+                if table in rows:
+                    mrids, indices = rows[table]
+                    for ce in equipment:
+                        mrids.append(ce.mrid)
+                        indices.append(int(index))
+
+        load, sgen = (pd.Series(indices, index=mrids, dtype=np.int64) for mrids, indices in rows.values())
+        sgen = sgen[~sgen.index.isin(load.index)]
+        return LoadRowIndex(load, sgen, sgen_sign)
+
+    def __len__(self):
+        return len(self.load) + len(self.sgen)
+
+
+class LoadProfile:
+    """
+    P and Q snapshots for the loads and sgens of a translated network, e.g. the half-hourly readings of a day.
+
+    The profile is aligned with the rows of the net once, so each snapshot is written with a single vectorised
+    assignment per table. Equipment in the profile without a load or sgen row is ignored, as are rows without a profile.
+
+    :param row_index: The `LoadRowIndex` of the net the profile is for.
+    :param p: The P of each piece of equipment in W, indexed by time with a column per mRID.
+    :param q: The Q of each piece of equipment in VAr, in the same shape as `p`. If not given, Q is left as it is.
+    :param tables: The tables to apply the profile to.
+    """
+
+    def __init__(
+            self,
+            row_index: LoadRowIndex,
+            p: pd.DataFrame,
+            q: Optional[pd.DataFrame] = None,
+            tables: Tuple[str, ...] = _TABLES
+    ):
+        if q is not None and (not q.index.equals(p.index) or not q.columns.equals(p.columns)):
+            raise ValueError("The P and Q profiles must have the same times and mRIDs.")
+
+        self.times = p.index
+        self._p = p.to_numpy(dtype=np.float64) / 1000000
+        self._q = None if q is None else q.to_numpy(dtype=np.float64) / 1000000
+        self._columns: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        for table in tables:
+            rows = getattr(row_index, table)
+            sign = row_index.sgen_sign if table == "sgen" else 1
+            positions = p.columns.get_indexer(rows.index)
+            matched = positions >= 0
+            self._columns[table] = (rows.to_numpy()[matched], positions[matched], sign)
+
+    def apply(self, net: pp.pandapowerNet, time: Any):
+        """
+        Writes the P and Q of a single snapshot into `net` in place.
+
+        :param net: The net the `LoadRowIndex` of this profile was built for.
+        :param time: A label of the profile's index.
+        """
+        self.apply_position(net, self.times.get_loc(time))
+
+    def apply_position(self, net: pp.pandapowerNet, position: int):
+        """
+        Writes the P and Q of the snapshot at `position` in the profile into `net` in place.
+        """
+        for table, (rows, columns, sign) in self._columns.items():
+            net[table].loc[rows, "p_mw"] = sign * self._p[position, columns]
+            if self._q is not None:
+                net[table].loc[rows, "q_mvar"] = sign * self._q[position, columns]
+
+    def create_controllers(self, net: pp.pandapowerNet) -> List[ConstControl]:
+        """
+        Adds a `ConstControl` to `net` for each table and variable of the profile, so it can be run with
+        `pandapower.timeseries.run_timeseries`. The time steps are the positions in the profile, i.e.
+        `range(len(profile.times))`.
+
+        :return: The created controllers.
+        """
+        controllers = []
+        for table, (rows, columns, sign) in self._columns.items():
+            for variable, values in (("p_mw", self._p), ("q_mvar", self._q)):
+                if values is None or not len(rows):
+                    continue
+                profile_names = [f"{table}:{row}" for row in rows]
+                data = pd.DataFrame(sign * values[:, columns], columns=profile_names)
+                controllers.append(ConstControl(
+                    net,
+                    element=table,
+                    variable=variable,
+                    element_index=rows,
+                    profile_name=profile_names,
+                    data_source=DFData(data)
+                ))
+        return controllers
+
+    def __len__(self):
+        return len(self.times)
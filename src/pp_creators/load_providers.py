@@ -0,0 +1,158 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Callable, List, Tuple, Dict, Union, Mapping, Iterable, Optional
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import ConductingEquipment
+
+__all__ = ["BatchLoads", "BatchLoadProvider", "LoadProvider", "as_batch_load_provider", "PrefetchedLoads",
+           "no_load", "describe_load_provider"]
+
+_PREFETCHED_LOADS_KEY = "_prefetched_loads"
+
+ElementLoads = Callable[[ConductingEquipment], Tuple[float, float]]
+
+BatchLoads = Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray], Mapping[str, Tuple[float, float]]]
+"""
+The P and Q in W and VAr of a batch of equipment, as one of:
+    - A `DataFrame` indexed by mRID with "p" and "q" columns.
+    - A tuple of P and Q arrays in the same order as the requested mRIDs.
+    - A mapping of mRID to a (P, Q) tuple.
+Equipment missing from the batch has no load.
+"""
+
+
+class BatchLoadProvider:
+    """
+    A load provider that looks up the P and Q of all the equipment it is needed for with a single call.
+
+    The creators call `prefetch` with every piece of equipment that may need a load before translating a network, and
+    then look up each piece of equipment in the loads it returns as they would call a per-element load provider.
+
+    :param provider: Called with a list of mRIDs, and returns their `BatchLoads`.
+    """
+
+    def __init__(self, provider: Callable[[List[str]], BatchLoads]):
+        self.provider = provider
+
+    def prefetch(self, equipment: Iterable[ConductingEquipment]) -> ElementLoads:
+        """
+        Looks up the loads of all of `equipment` at once. Nothing is stored on the provider, so it can be shared by
+        concurrent creations.
+
+        :return: A per-element load provider for the prefetched loads.
+        """
+        loads = self.load_all(list(equipment))
+        return lambda ce: loads.get(ce.mrid, (0, 0))
+
+    def load_all(self, equipment: List[ConductingEquipment]) -> Dict[str, Tuple[float, float]]:
+        """
+        :return: The P and Q of each piece of `equipment` that has a load, keyed by mRID.
+        """
+        mrids = [ce.mrid for ce in equipment]
+        if not mrids:
+            return {}
+
+        loads = self.provider(mrids)
+        if isinstance(loads, pd.DataFrame):
+            loads = loads.reindex(mrids)
+            p = loads["p"].to_numpy(dtype=np.float64, na_value=0.0)
+            q = loads["q"].to_numpy(dtype=np.float64, na_value=0.0)
+        elif isinstance(loads, tuple):
+            p, q = (np.asarray(values, dtype=np.float64) for values in loads)
+            if len(p) != len(mrids) or len(q) != len(mrids):
+                raise ValueError(f"Expected {len(mrids)} P and Q values, but got {len(p)} and {len(q)}.")
+        else:
+            return {mrid: tuple(loads[mrid]) for mrid in mrids if mrid in loads}
+        return dict(zip(mrids, zip(p.tolist(), q.tolist())))
+
+    def __call__(self, ce: ConductingEquipment) -> Tuple[float, float]:
+        return self.load_all([ce]).get(ce.mrid, (0, 0))
+
+
+class _PerElementLoadProvider(BatchLoadProvider):
+    # Adapts a per-element load provider. Nothing is prefetched, so it is still only called for the equipment that
+    # actually needs a load, e.g. only transformers without an LV network.
+
+    def __init__(self, provider: ElementLoads):
+        super().__init__(lambda mrids: {})
+        self.per_element_provider = provider
+
+    def prefetch(self, equipment: Iterable[ConductingEquipment]) -> ElementLoads:
+        return self.per_element_provider
+
+    def load_all(self, equipment: List[ConductingEquipment]) -> Dict[str, Tuple[float, float]]:
+        return {ce.mrid: self.per_element_provider(ce) for ce in equipment}
+
+    def __call__(self, ce: ConductingEquipment) -> Tuple[float, float]:
+        return self.per_element_provider(ce)
+
+
+LoadProvider = Union[BatchLoadProvider, ElementLoads]
+
+
+def no_load(ce: ConductingEquipment) -> Tuple[float, float]:
+    """
+    The default load provider of the creators, which gives no equipment a load.
+    """
+    return 0, 0
+
+
+def describe_load_provider(provider: LoadProvider) -> Optional[str]:
+    """
+    :return: The type and qualified name of the function behind `provider`, or None if it is `no_load`.
+    """
+    if isinstance(provider, _PerElementLoadProvider):
+        provider = provider.per_element_provider
+    elif isinstance(provider, BatchLoadProvider):
+        provider = provider.provider
+    if provider is no_load:
+        return None
+    name = getattr(provider, "__qualname__", type(provider).__qualname__)
+    return f"{type(provider).__qualname__}:{getattr(provider, '__module__', None)}.{name}"
+
+
+def as_batch_load_provider(provider: LoadProvider) -> BatchLoadProvider:
+    """
+    :return: `provider` if it is already a `BatchLoadProvider`, otherwise an adapter that calls the per-element
+        `provider` for each piece of equipment.
+    """
+    if isinstance(provider, BatchLoadProvider):
+        return provider
+    return _PerElementLoadProvider(provider)
+
+
+class PrefetchedLoads:
+    """
+    The loads prefetched by each of a creator's load providers for a single creation. They are kept on the net being
+    created rather than on the providers, so creations sharing a creator or provider never see each other's loads.
+
+    :param loads: The prefetched loads of each load provider, keyed by the name of the provider.
+    """
+
+    def __init__(self, loads: Dict[str, ElementLoads]):
+        self.loads = loads
+
+    @staticmethod
+    def attach(net: pp.pandapowerNet, loads: Dict[str, ElementLoads]) -> 'PrefetchedLoads':
+        prefetched = PrefetchedLoads(loads)
+        net[_PREFETCHED_LOADS_KEY] = prefetched
+        return prefetched
+
+    @staticmethod
+    def detach(net: pp.pandapowerNet) -> Optional['PrefetchedLoads']:
+        return net.pop(_PREFETCHED_LOADS_KEY, None)
+
+    @staticmethod
+    def lookup(net: pp.pandapowerNet, name: str, provider: BatchLoadProvider) -> ElementLoads:
+        """
+        :return: The loads `provider` prefetched for the creation of `net`, or `provider` itself if there are none.
+        """
+        prefetched = net.get(_PREFETCHED_LOADS_KEY)
+        return provider if prefetched is None else prefetched.loads[name]
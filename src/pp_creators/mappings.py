@@ -0,0 +1,320 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from array import array
+from typing import Dict, List, Tuple, Any, Set, Callable, Optional, MutableMapping, Iterable, Mapping, \
+    Iterator
+
+import numpy as np
+from zepben.evolve import BusBranchNetworkCreationMappings, NetworkService, TerminalGrouping, IdentifiedObject
+from zepben.evolve.model.busbranch.bus_branch import NodeBreakerToBusBranchMappings, BusBranchToNodeBreakerMappings
+
+from pp_creators.elements import PpElement
+
+__all__ = ["MridMappings", "mappings_to_mrids", "mappings_from_mrids", "ElementMappingStore", "compact_mappings"]
+
+GROUPING_MAPPINGS = ("topological_nodes", "topological_branches")
+SET_MAPPINGS = ("equivalent_branches", "power_transformers", "energy_sources", "energy_consumers",
+                "power_electronics_connections")
+
+# Columns of each element table that hold bus indices, which must be updated whenever buses are re-indexed.
+BUS_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "bus": (),
+    "line": ("from_bus", "to_bus"),
+    "trafo": ("hv_bus", "lv_bus"),
+    "load": ("bus",),
+    "sgen": ("bus",),
+    "ext_grid": ("bus",),
+    "switch": ("bus",)
+}
+
+MridMappings = Tuple[Dict[str, List[Tuple[str, int]]], Dict[str, Dict[str, Any]]]
+"""
+Bus-branch creation mappings with every node-breaker object replaced by its mRID, so they can be pickled or sent to
+another process without the network model. A tuple of:
+    - to_bbn: The (type, index) of each element created for an mRID.
+    - to_nbn: For each mapping name, the mRIDs of each element id. Topological nodes and branches have a tuple of the
+      border terminal, inner terminal and equipment mRIDs.
+"""
+
+
+def mappings_to_mrids(mappings: BusBranchNetworkCreationMappings) -> MridMappings:
+    """
+    :return: `mappings` with every node-breaker object replaced by its mRID. The bus-branch elements must be
+        `PpElement`s.
+    """
+    if isinstance(mappings, _MridBackedMappings) and mappings._to_bbn is None and mappings._to_nbn is None:
+        return mappings._mrid_mappings
+
+    if isinstance(mappings.to_bbn.objects, ElementMappingStore):
+        to_bbn = mappings.to_bbn.objects.to_mrid_lists()
+    else:
+        to_bbn = {
+            mrid: [(element.type, int(element.index)) for element in elements]
+            for mrid, elements in mappings.to_bbn.objects.items()
+        }
+    to_nbn = {
+        name: {
+            key: (_mrids(grouping.border_terminals), _mrids(grouping.inner_terminals),
+                  _mrids(grouping.conducting_equipment_group))
+            for key, grouping in getattr(mappings.to_nbn, name).items()
+        }
+        for name in GROUPING_MAPPINGS
+    }
+    to_nbn.update({
+        name: {key: _mrids(ios) for key, ios in getattr(mappings.to_nbn, name).items()}
+        for name in SET_MAPPINGS
+    })
+    return to_bbn, to_nbn
+
+
+def mappings_from_mrids(
+        mrid_mappings: MridMappings,
+        node_breaker_network: NetworkService
+) -> BusBranchNetworkCreationMappings:
+    """
+    Rebuilds the mappings from `mappings_to_mrids`, looking each mRID up in `node_breaker_network`.
+
+    Each direction of the mappings is only rebuilt when it is first accessed, as creating the sets of node-breaker
+    objects is comparatively expensive.
+    """
+    return _MridBackedMappings(mrid_mappings, node_breaker_network)
+
+
+class _MridBackedMappings(BusBranchNetworkCreationMappings):
+
+    def __init__(self, mrid_mappings: MridMappings, node_breaker_network: NetworkService):
+        self._mrid_mappings = mrid_mappings
+        self._node_breaker_network = node_breaker_network
+        self._to_bbn: Optional[NodeBreakerToBusBranchMappings] = None
+        self._to_nbn: Optional[BusBranchToNodeBreakerMappings] = None
+
+    @property
+    def to_bbn(self) -> NodeBreakerToBusBranchMappings:
+        if self._to_bbn is None:
+            self._to_bbn = NodeBreakerToBusBranchMappings()
+            self._to_bbn.objects = ElementMappingStore.from_mrid_lists(self._mrid_mappings[0])
+        return self._to_bbn
+
+    @to_bbn.setter
+    def to_bbn(self, to_bbn: NodeBreakerToBusBranchMappings):
+        self._to_bbn = to_bbn
+
+    @property
+    def to_nbn(self) -> BusBranchToNodeBreakerMappings:
+        if self._to_nbn is None:
+            self._to_nbn = BusBranchToNodeBreakerMappings()
+            to_nbn = self._mrid_mappings[1]
+            get: Callable[[str], IdentifiedObject] = self._node_breaker_network.get
+            for name in GROUPING_MAPPINGS:
+                getattr(self._to_nbn, name).update({
+                    key: TerminalGrouping(
+                        border_terminals={get(mrid) for mrid in border},
+                        inner_terminals={get(mrid) for mrid in inner},
+                        conducting_equipment_group={get(mrid) for mrid in equipment}
+                    )
+                    for key, (border, inner, equipment) in to_nbn[name].items()
+                })
+            for name in SET_MAPPINGS:
+                mapping = getattr(self._to_nbn, name)
+                mapping.update({key: {get(mrid) for mrid in mrids} for key, mrids in to_nbn[name].items()})
+        return self._to_nbn
+
+    @to_nbn.setter
+    def to_nbn(self, to_nbn: BusBranchToNodeBreakerMappings):
+        self._to_nbn = to_nbn
+
+
+class ElementMappingStore(MutableMapping[str, Set[PpElement]]):
+    """
+    A compact replacement for `to_bbn.objects`. Rather than a set of `PpElement`s per mRID, the elements are stored as
+    a type code and table index in arrays shared by every mRID.
+
+    Looking up an mRID returns a set of its elements, built the first time it is looked up and kept from then on, so
+    code written against the plain dictionary of sets keeps working. Changing the elements of an mRID, or adding a new
+    one, stores its elements in an ordinary set from then on, so the store can still be updated after it is built.
+
+    :param objects: The elements each mRID maps to.
+    """
+
+    def __init__(self, objects: Optional[Mapping[str, Iterable[PpElement]]] = None):
+        self._types: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._rows: Dict[str, int] = {}
+        self._offsets = array("q", [0])
+        self._codes = array("B")
+        self._indices = array("q")
+        self._first_indices: Dict[int, np.ndarray] = {}
+        self._overrides: Dict[str, Set[PpElement]] = {}
+        self._row_elements: Dict[int, _RowElements] = {}
+
+        if objects is not None:
+            self._extend((mrid, ((element.type, element.index) for element in elements))
+                         for mrid, elements in objects.items())
+
+    @staticmethod
+    def from_mrid_lists(to_bbn: Mapping[str, Iterable[Tuple[str, int]]]) -> 'ElementMappingStore':
+        """
+        Creates a store from the (type, index) of each element each mRID maps to, as in `MridMappings`.
+        """
+        store = ElementMappingStore()
+        store._extend(to_bbn.items())
+        return store
+
+    def to_mrid_lists(self) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        :return: The (type, index) of each element each mRID maps to, as in `MridMappings`.
+        """
+        to_bbn = {mrid: list(self._entries(row)) for mrid, row in self._rows.items()}
+        to_bbn.update({mrid: [(e.type, e.index) for e in elements] for mrid, elements in self._overrides.items()})
+        return to_bbn
+
+    def indices(self, mrids: Iterable[str], element_type: str) -> np.ndarray:
+        """
+        Looks up the elements of many mRIDs at once.
+
+        :return: For each mRID, the lowest index of the `element_type` elements it maps to, or -1 if it maps to none.
+        """
+        mrids = list(mrids)
+        rows = np.fromiter((self._rows.get(mrid, -1) for mrid in mrids), dtype=np.int64, count=len(mrids))
+        code = self._type_codes.get(element_type)
+        if code is None:
+            found = np.full(len(mrids), -1, dtype=np.int64)
+        else:
+            first = self._first_indices_of(code)
+            found = np.where(rows >= 0, first[np.maximum(rows, 0)], -1)
+
+        for position in np.flatnonzero(rows < 0).tolist():
+            elements = self._overrides.get(mrids[position], ())
+            found[position] = min((e.index for e in elements if e.type == element_type), default=-1)
+        return found
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the arrays holding the elements, not counting the dictionaries of mRIDs.
+        """
+        return sum(a.itemsize * len(a) for a in (self._offsets, self._codes, self._indices))
+
+    def __getitem__(self, mrid: str) -> Set[PpElement]:
+        return self._elements(mrid)
+
+    def __setitem__(self, mrid: str, elements: Iterable[PpElement]):
+        self._row_elements.pop(self._rows.pop(mrid, -1), None)
+        self._overrides[mrid] = elements if isinstance(elements, set) else set(elements)
+
+    def __delitem__(self, mrid: str):
+        row = self._rows.pop(mrid, None)
+        if row is not None:
+            self._row_elements.pop(row, None)
+        elif self._overrides.pop(mrid, None) is None:
+            raise KeyError(mrid)
+
+    def __contains__(self, mrid) -> bool:
+        return mrid in self._rows or mrid in self._overrides
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._rows)
+        yield from list(self._overrides)
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._overrides)
+
+    def _extend(self, entries: Iterable[Tuple[str, Iterable[Tuple[str, int]]]]):
+        for mrid, elements in entries:
+            self._overrides.pop(mrid, None)
+            self._row_elements.pop(self._rows.get(mrid, -1), None)
+            self._rows[mrid] = len(self._offsets) - 1
+            for element_type, index in elements:
+                code = self._type_codes.get(element_type)
+                if code is None:
+                    code = self._type_codes[element_type] = len(self._types)
+                    self._types.append(element_type)
+                self._codes.append(code)
+                self._indices.append(index)
+            self._offsets.append(len(self._codes))
+        self._first_indices.clear()
+
+    def _entries(self, row: int) -> Iterator[Tuple[str, int]]:
+        types, codes, indices = self._types, self._codes, self._indices
+        for i in range(self._offsets[row], self._offsets[row + 1]):
+            yield types[codes[i]], indices[i]
+
+    def _elements(self, mrid: str) -> Set[PpElement]:
+        overridden = self._overrides.get(mrid)
+        if overridden is not None:
+            return overridden
+        row = self._rows[mrid]
+        elements = self._row_elements.get(row)
+        if elements is None:
+            # Built the first time the mRID is looked up, so later lookups cost no more than with a plain set.
+            types, codes, indices = self._types, self._codes, self._indices
+            elements = self._row_elements[row] = _RowElements(
+                self,
+                mrid,
+                (PpElement(indices[i], types[codes[i]]) for i in range(self._offsets[row], self._offsets[row + 1]))
+            )
+        return elements
+
+    def _detach(self, mrid: str, elements: Set[PpElement]):
+        # The elements of `mrid` are about to change, so they are kept in `elements` rather than the arrays from now on.
+        row = self._rows.get(mrid)
+        if row is not None and self._row_elements.get(row) is elements:
+            del self._rows[mrid], self._row_elements[row]
+            self._overrides[mrid] = elements
+
+    def _first_indices_of(self, code: int) -> np.ndarray:
+        # The lowest index of the elements of type `code` in each row, computed once for all rows.
+        first = self._first_indices.get(code)
+        if first is None:
+            offsets = np.frombuffer(self._offsets, dtype=np.int64)
+            codes = np.frombuffer(self._codes, dtype=np.uint8)
+            indices = np.frombuffer(self._indices, dtype=np.int64)
+            entry_rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            matched = codes == code
+            first = np.full(len(offsets) - 1, np.iinfo(np.int64).max, dtype=np.int64)
+            np.minimum.at(first, entry_rows[matched], indices[matched])
+            first[first == np.iinfo(np.int64).max] = -1
+            self._first_indices[code] = first
+        return first
+
+
+class _RowElements(set):
+    # The elements of a single mRID in an `ElementMappingStore`, built from its arrays. Changing them moves them out
+    # of the arrays and into the store's ordinary sets, so the arrays never disagree with what was looked up.
+    __slots__ = ("_store", "_mrid")
+
+    def __init__(self, store: ElementMappingStore, mrid: str, elements: Iterable[PpElement]):
+        super().__init__(elements)
+        self._store = store
+        self._mrid = mrid
+
+
+def _detaching(name: str) -> Callable:
+    method = getattr(set, name)
+
+    def detach_then(self: _RowElements, *args):
+        self._store._detach(self._mrid, self)
+        return method(self, *args)
+
+    detach_then.__name__ = name
+    return detach_then
+
+
+for _name in ("add", "discard", "remove", "pop", "clear", "update", "difference_update", "intersection_update",
+              "symmetric_difference_update", "__ior__", "__iand__", "__isub__", "__ixor__"):
+    setattr(_RowElements, _name, _detaching(_name))
+
+
+def compact_mappings(mappings: BusBranchNetworkCreationMappings):
+    """
+    Replaces the `to_bbn` mappings of a creation result with an `ElementMappingStore` in place.
+    """
+    if not isinstance(mappings.to_bbn.objects, ElementMappingStore):
+        mappings.to_bbn.objects = ElementMappingStore(mappings.to_bbn.objects)
+
+
+def _mrids(ios: Set[IdentifiedObject]) -> List[str]:
+    return [io.mrid for io in ios]
@@ -0,0 +1,243 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import copy
+import multiprocessing
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Optional, Union, Any, NamedTuple
+
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import NetworkService, BusBranchNetworkCreationResult, TerminalGrouping
+
+from pp_creators.admittance import build_bus_admittance
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.elements import PpElement
+from pp_creators.creator_ee import PandaPowerNetworkCreatorEE
+from pp_creators.feeders import partition_by_feeder, create_network_from_equipment
+from pp_creators.load_profiles import LoadRowIndex
+from pp_creators.mappings import mappings_to_mrids, GROUPING_MAPPINGS, BUS_COLUMNS, ElementMappingStore
+from pp_creators.validators.validator import PandaPowerNetworkValidator
+from pp_creators.warm_start import seed_bus_voltages
+
+__all__ = ["create_by_feeder"]
+
+PandaPowerCreator = Union[BasicPandaPowerNetworkCreator, PandaPowerNetworkCreatorEE]
+
+_GEODATA_TABLES = {"bus": "bus_geodata", "line": "line_geodata"}
+
+
+class _PieceResult(NamedTuple):
+    # A creation result reduced to mRIDs, so it can be sent back from a worker without pickling the network model.
+    was_successful: bool
+    network: Optional[pp.pandapowerNet]
+    to_bbn: Dict[str, List[Tuple[str, int]]]
+    to_nbn: Dict[str, Dict[str, Any]]
+
+
+async def create_by_feeder(
+        creator: PandaPowerCreator,
+        node_breaker_network: NetworkService,
+        *,
+        max_workers: Optional[int] = None,
+        start_method: Optional[str] = None
+) -> BusBranchNetworkCreationResult[pp.pandapowerNet, PandaPowerNetworkValidator]:
+    """
+    Translates each `Feeder` of a network in a separate worker process and merges the resulting nets into one.
+
+    Each worker translates the equipment of one feeder together with the equipment that is not on any feeder (e.g. the
+    zone substation). Elements created from that shared equipment are only kept once, and all element indices and
+    mappings are rewritten to refer to the merged net.
+
+    If any feeder fails to translate, the result is unsuccessful and has the mRIDs of the feeders that failed as
+    `failed_feeders`. The reason each one failed is logged by the creator's validator in its worker.
+
+    NOTE: By default the workers are forked, so they inherit the creator and network without pickling them. Forking a
+    process with more than one thread can deadlock the workers, so the default needs the caller to be single threaded,
+    e.g. a plain `asyncio.run` with no executor threads started. Pass another `start_method` to use a pickled copy of
+    the creator and network instead, in which case the creator's load providers must be picklable.
+
+    :param creator: The pandapower creator used to translate each feeder.
+    :param node_breaker_network: The `NetworkService` to translate.
+    :param max_workers: The maximum number of worker processes. Defaults to the number of CPUs.
+    :param start_method: The multiprocessing start method of the workers. Defaults to "fork".
+    :return: The merged creation result.
+    :raises RuntimeError: If the workers would be forked from a process with more than one thread.
+    """
+    feeders, shared = partition_by_feeder(node_breaker_network)
+    if len(feeders) < 2:
+        return await creator.create(node_breaker_network)
+
+    pieces = {mrid: [*equipment.values(), *shared.values()] for mrid, equipment in feeders.items()}
+    # The admittance matrix is assembled and the bus voltages seeded once for the merged net rather than for each piece.
+    piece_creator = copy.copy(creator)
+    piece_creator.admittance = False
+    piece_creator.initial_voltages = None
+    mp_context = worker_context(start_method, "create_by_feeder")
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(piece_creator, pieces)
+    ) as executor:
+        piece_results = await asyncio.gather(
+            *(loop.run_in_executor(executor, _translate_piece, mrid) for mrid in pieces)
+        )
+
+    merger = _NetMerger(node_breaker_network, creator.validator_creator())
+    failed_feeders = [mrid for mrid, piece_result in zip(pieces, piece_results) if not piece_result.was_successful]
+    if failed_feeders:
+        creator.logger.error(f"Failed to translate feeders {failed_feeders}, see the errors logged above.")
+        merger.result.failed_feeders = failed_feeders
+        return merger.result
+
+    for piece_result in piece_results:
+        merger.add(piece_result)
+
+    result = merger.finish()
+    result.failed_feeders = []
+    result.load_rows = LoadRowIndex.from_mappings(
+        result.mappings,
+        sgen_sign=1 if isinstance(creator, PandaPowerNetworkCreatorEE) else -1
+    )
+    if creator.initial_voltages is not None:
+        seed_bus_voltages(result.network, result.mappings.to_bbn.objects, creator.initial_voltages)
+    if creator.admittance:
+        result.admittance = build_bus_admittance(result.network)
+    return result
+
+
+def worker_context(start_method: Optional[str], caller: str) -> multiprocessing.context.BaseContext:
+    """
+    :return: The multiprocessing context for the worker processes of `caller`, forking them by default.
+    :raises RuntimeError: If the workers would be forked from a process with more than one thread.
+    """
+    mp_context = multiprocessing.get_context(start_method or "fork")
+    if mp_context.get_start_method() == "fork" and threading.active_count() > 1:
+        raise RuntimeError(
+            f"Cannot fork workers from a process with {threading.active_count()} threads. Call {caller} from a single "
+            "threaded process, or pass another start_method."
+        )
+    return mp_context
+
+
+_worker_creator: Optional[PandaPowerCreator] = None
+_worker_pieces: Dict[str, list] = {}
+
+
+def _init_worker(creator: PandaPowerCreator, pieces: Dict[str, list]):
+    global _worker_creator, _worker_pieces
+    _worker_creator = creator
+    _worker_pieces = pieces
+
+
+def _translate_piece(feeder_mrid: str) -> _PieceResult:
+    piece_network = create_network_from_equipment(_worker_pieces[feeder_mrid])
+    result = asyncio.run(_worker_creator.create(piece_network))
+    if not result.was_successful:
+        return _PieceResult(False, None, {}, {})
+    if result.geometry is not None:
+        # The geodata tables are re-indexed along with the rest of the net when the pieces are merged.
+        result.geometry.materialise(result.network)
+
+    to_bbn, to_nbn = mappings_to_mrids(result.mappings)
+    return _PieceResult(True, result.network, to_bbn, to_nbn)
+
+
+class _NetMerger:
+
+    def __init__(self, node_breaker_network: NetworkService, validator: PandaPowerNetworkValidator):
+        self.node_breaker_network = node_breaker_network
+        self.result = BusBranchNetworkCreationResult(validator)
+        self.frames: Dict[str, List[pd.DataFrame]] = defaultdict(list)
+        self.next_index: Dict[str, int] = defaultdict(int)
+        self.elements_by_mrid: Dict[str, Dict[str, PpElement]] = {}
+        self.std_types: Dict[str, Dict[str, dict]] = defaultdict(dict)
+
+    def add(self, piece: _PieceResult):
+        mrids_by_element: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+        for mrid, elements in piece.to_bbn.items():
+            for element in elements:
+                mrids_by_element[element].append(mrid)
+
+        # An element created from equipment shared between feeders is mapped from at least one mRID already seen in a
+        # previous piece, and is reused rather than added again.
+        index_map: Dict[str, Dict[int, int]] = defaultdict(dict)
+        new_rows: Dict[str, List[int]] = defaultdict(list)
+        for (element_type, index), mrids in sorted(mrids_by_element.items()):
+            merged = next(
+                (self.elements_by_mrid[mrid][element_type] for mrid in mrids
+                 if element_type in self.elements_by_mrid.get(mrid, {})),
+                None
+            )
+            if merged is None:
+                merged = PpElement(self.next_index[element_type], element_type)
+                self.next_index[element_type] += 1
+                new_rows[element_type].append(index)
+            index_map[element_type][index] = merged.index
+            for mrid in mrids:
+                self.elements_by_mrid.setdefault(mrid, {})[element_type] = merged
+
+        for element_type, bus_columns in BUS_COLUMNS.items():
+            rows = new_rows.get(element_type)
+            if not rows:
+                continue
+            df = piece.network[element_type].loc[rows].copy()
+            df.index = df.index.map(index_map[element_type])
+            for column in bus_columns:
+                df[column] = df[column].map(index_map["bus"]).astype(df[column].dtype)
+            if element_type == "switch":
+                df["element"] = [index_map["bus" if et == "b" else "line"][element]
+                                 for element, et in zip(df.element.tolist(), df.et.tolist())]
+            self.frames[element_type].append(df)
+
+            geodata_table = _GEODATA_TABLES.get(element_type)
+            if geodata_table is not None:
+                geodata = piece.network[geodata_table]
+                geodata = geodata.loc[geodata.index.intersection(rows)].copy()
+                geodata.index = geodata.index.map(index_map[element_type])
+                self.frames[geodata_table].append(geodata)
+
+        for element, std_types in piece.network.std_types.items():
+            self.std_types[element].update(std_types)
+
+        for name, entries in piece.to_nbn.items():
+            target = getattr(self.result.mappings.to_nbn, name)
+            for key, mrids in entries.items():
+                element_type, index = key.split(":")
+                merged_key = f"{element_type}:{index_map[element_type][int(index)]}"
+                if merged_key in target:
+                    continue
+                if name in GROUPING_MAPPINGS:
+                    border, inner, equipment = mrids
+                    target[merged_key] = TerminalGrouping(
+                        border_terminals=self._get_all(border),
+                        inner_terminals=self._get_all(inner),
+                        conducting_equipment_group=self._get_all(equipment)
+                    )
+                else:
+                    target[merged_key] = self._get_all(mrids)
+
+    def finish(self) -> BusBranchNetworkCreationResult[pp.pandapowerNet, PandaPowerNetworkValidator]:
+        net = pp.create_empty_network()
+        for table, frames in self.frames.items():
+            net[table] = pd.concat(frames, sort=False)
+        for element, std_types in self.std_types.items():
+            net.std_types[element].update(std_types)
+
+        self.result.mappings.to_bbn.objects = ElementMappingStore(
+            {mrid: elements.values() for mrid, elements in self.elements_by_mrid.items()}
+        )
+        self.result.network = net
+        self.result.was_successful = True
+        return self.result
+
+    def _get_all(self, mrids: List[str]) -> set:
+        return {self.node_breaker_network.get(mrid) for mrid in mrids}
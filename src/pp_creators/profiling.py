@@ -0,0 +1,249 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import copy
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Callable, Any, Optional
+
+import numpy as np
+import pandapower as pp
+from pandapower.toolbox import pp_elements
+from zepben.evolve import BusBranchNetworkCreator, BusBranchNetworkCreationResult, NetworkService, ConductingEquipment
+
+from pp_creators.load_providers import BatchLoadProvider, ElementLoads
+
+__all__ = ["CallbackStats", "CreationProfile", "create_profiled"]
+
+_CREATOR_CALLBACKS = (
+    "bus_branch_network_creator",
+    "topological_node_creator",
+    "topological_branch_creator",
+    "equivalent_branch_creator",
+    "power_transformer_creator",
+    "energy_source_creator",
+    "energy_consumer_creator",
+    "power_electronics_connection_creator",
+    "has_negligible_impedance",
+    "create_element"
+)
+
+_VALIDATOR_CALLBACKS = (
+    "is_valid_network_data",
+    "is_valid_topological_node_data",
+    "is_valid_topological_branch_data",
+    "is_valid_equivalent_branch_data",
+    "is_valid_power_transformer_data",
+    "is_valid_energy_source_data",
+    "is_valid_energy_consumer_data",
+    "is_valid_power_electronics_connection_data"
+)
+
+
+class CallbackStats:
+    """
+    The call count and latency of a single creator or validator callback. Latencies are in seconds, and exclude the time
+    spent in any other timed call made by the callback, e.g. the `create_element` and load provider calls made by a
+    `*_creator` callback.
+    """
+
+    def __init__(self, name: str, times: List[float]):
+        latencies = np.asarray(times, dtype=np.float64)
+        self.name = name
+        self.calls = len(latencies)
+        self.total_s = float(latencies.sum())
+        self.p50_s, self.p90_s, self.p99_s, self.max_s = (
+            (float(p) for p in np.percentile(latencies, [50, 90, 99, 100])) if self.calls else (0.0, 0.0, 0.0, 0.0)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_s": self.total_s,
+            "p50_s": self.p50_s,
+            "p90_s": self.p90_s,
+            "p99_s": self.p99_s,
+            "max_s": self.max_s
+        }
+
+
+class CreationProfile:
+    """
+    Where the time of a bus-branch network creation went.
+
+    `wall_s` covers the whole creation, so the time not spent in any callback (`untracked_s`) is mostly zepben's
+    topology collapse, plus anything the creator does after the callbacks such as flushing buffered tables.
+
+    `load_providers` has the time spent in each of the creator's load providers, keyed by their attribute name, with
+    the time spent prefetching a batch of loads under "<name>.prefetch". The pandapower element creation of the
+    pandapower creators is in `callbacks` as "create_element".
+    """
+
+    def __init__(
+            self,
+            wall_s: float,
+            callbacks: Dict[str, CallbackStats],
+            validator_callbacks: Dict[str, CallbackStats],
+            rows: Dict[str, int],
+            load_providers: Optional[Dict[str, CallbackStats]] = None
+    ):
+        self.wall_s = wall_s
+        self.callbacks = callbacks
+        self.validator_callbacks = validator_callbacks
+        self.rows = rows
+        self.load_providers = load_providers or {}
+
+    @property
+    def untracked_s(self) -> float:
+        return self.wall_s - sum(s.total_s for s in self._all_stats())
+
+    def _all_stats(self) -> List[CallbackStats]:
+        return [*self.callbacks.values(), *self.validator_callbacks.values(), *self.load_providers.values()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_s": self.wall_s,
+            "untracked_s": self.untracked_s,
+            "callbacks": {name: stats.to_dict() for name, stats in self.callbacks.items()},
+            "validator_callbacks": {name: stats.to_dict() for name, stats in self.validator_callbacks.items()},
+            "load_providers": {name: stats.to_dict() for name, stats in self.load_providers.items()},
+            "rows": dict(self.rows)
+        }
+
+    def log(self, logger: logging.Logger, level: int = logging.INFO):
+        logger.log(level, "Network creation took %.3fs, %.3fs outside of the callbacks", self.wall_s, self.untracked_s)
+        for stats in self._all_stats():
+            logger.log(
+                level,
+                "%s: %d calls, %.3fs total, p50 %.1fus, p90 %.1fus, p99 %.1fus, max %.1fus",
+                stats.name, stats.calls, stats.total_s, stats.p50_s * 1e6, stats.p90_s * 1e6, stats.p99_s * 1e6,
+                stats.max_s * 1e6
+            )
+        logger.log(level, "Rows created: %s", ", ".join(f"{k}={v}" for k, v in self.rows.items()))
+
+
+async def create_profiled(
+        creator: BusBranchNetworkCreator,
+        node_breaker_network: NetworkService,
+        *,
+        logger: Optional[logging.Logger] = None,
+        log_level: int = logging.INFO
+) -> BusBranchNetworkCreationResult:
+    """
+    Runs `creator.create(node_breaker_network)` with every creator and validator callback timed, and sets the resulting
+    `CreationProfile` as `profile` on the creation result.
+
+    The callbacks and load providers of a copy of `creator` are timed, so `creator` itself is left untouched and can be
+    used at the same time, and creating networks without this has no overhead.
+
+    :param creator: Any `BusBranchNetworkCreator`, e.g. one of the pandapower creators or `ErrorAggregator`.
+    :param node_breaker_network: The `NetworkService` to create a bus-branch network from.
+    :param logger: If set, the profile is also logged to this logger.
+    :param log_level: The level to log the profile at.
+    :return: The creation result, with the `CreationProfile` as `result.profile`.
+    """
+    timer = _Timer()
+    times: Dict[str, List[float]] = defaultdict(list)
+    validator_times: Dict[str, List[float]] = defaultdict(list)
+    load_provider_times: Dict[str, List[float]] = defaultdict(list)
+
+    profiled = copy.copy(creator)
+    _wrap(profiled, _CREATOR_CALLBACKS, times, timer)
+    for name, value in list(vars(profiled).items()):
+        if isinstance(value, BatchLoadProvider):
+            setattr(profiled, name, _TimedLoadProvider(value, name, load_provider_times, timer))
+
+    validator_creator = profiled.validator_creator
+
+    def profiled_validator_creator():
+        validator = validator_creator()
+        _wrap(validator, _VALIDATOR_CALLBACKS, validator_times, timer)
+        return validator
+
+    profiled.validator_creator = profiled_validator_creator
+    start = time.perf_counter()
+    result = await profiled.create(node_breaker_network)
+    wall_s = time.perf_counter() - start
+
+    for name in _VALIDATOR_CALLBACKS:
+        vars(result.validator).pop(name, None)
+
+    result.profile = CreationProfile(
+        wall_s,
+        {name: CallbackStats(name, t) for name, t in times.items()},
+        {name: CallbackStats(name, t) for name, t in validator_times.items()},
+        _count_rows(result),
+        {name: CallbackStats(name, t) for name, t in load_provider_times.items()}
+    )
+    if logger is not None:
+        result.profile.log(logger, log_level)
+    return result
+
+
+class _Timer:
+    # Times nested calls, charging each call only for the time not spent in the timed calls it makes itself.
+
+    def __init__(self):
+        self._nested_s = [0.0]
+
+    def timed(self, callback: Callable, times: List[float]) -> Callable:
+        perf_counter = time.perf_counter
+        nested_s = self._nested_s
+
+        def timed_callback(*args, **kwargs):
+            nested_s.append(0.0)
+            start = perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                times.append(elapsed - nested_s.pop())
+                nested_s[-1] += elapsed
+
+        return timed_callback
+
+
+class _TimedLoadProvider:
+    # Stands in for a load provider, timing its prefetch and each load it provides.
+
+    def __init__(self, provider: BatchLoadProvider, name: str, times: Dict[str, List[float]], timer: _Timer):
+        self.provider = provider
+        self.name = name
+        self.times = times
+        self.timer = timer
+        self._call = timer.timed(provider, times[name])
+
+    def prefetch(self, equipment) -> ElementLoads:
+        loads = self.timer.timed(self.provider.prefetch, self.times[f"{self.name}.prefetch"])(equipment)
+        return self.timer.timed(loads, self.times[self.name])
+
+    def __call__(self, ce: ConductingEquipment):
+        return self._call(ce)
+
+
+def _wrap(target: Any, names: tuple, times: Dict[str, List[float]], timer: _Timer) -> List[str]:
+    # Shadow each callback with a timed version on the instance itself, leaving the class untouched.
+    wrapped = []
+    for name in names:
+        callback = getattr(target, name, None)
+        if callback is None:
+            continue
+        setattr(target, name, timer.timed(callback, times[name]))
+        wrapped.append(name)
+    return wrapped
+
+
+def _count_rows(result: BusBranchNetworkCreationResult) -> Dict[str, int]:
+    if isinstance(result.network, pp.pandapowerNet):
+        return {
+            element: len(result.network[element])
+            for element in sorted(pp_elements())
+            if element in result.network and len(result.network[element])
+        }
+
+    # Other bus-branch networks are counted by the node-breaker objects they were mapped from.
+    to_nbn = result.mappings.to_nbn
+    return {name: len(mapping) for name, mapping in vars(to_nbn).items() if len(mapping)}
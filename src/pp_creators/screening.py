@@ -0,0 +1,223 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Optional, Tuple
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+from zepben.evolve import BusBranchNetworkCreationResult
+
+from pp_creators.admittance import BusAdmittance, build_bus_admittance, line_admittances
+from pp_creators.mappings import ElementMappingStore
+
+__all__ = ["LinearPowerFlow", "ScreeningResult"]
+
+
+class ScreeningResult:
+    """
+    The approximate load flow results of a batch of scenarios, with a row per scenario.
+
+    :param vm_pu: The voltage magnitude of each in service bus, with a column per bus index.
+    :param va_degree: The voltage angle of each in service bus, in the same shape as `vm_pu`.
+    :param i_ka: The larger of the currents at either end of each line, with a column per line index.
+    :param loading_percent: The loading of each line, as `res_line.loading_percent`, in the same shape as `i_ka`.
+    """
+
+    def __init__(self, *, vm_pu: pd.DataFrame, va_degree: pd.DataFrame, i_ka: pd.DataFrame,
+                 loading_percent: pd.DataFrame):
+        self.vm_pu = vm_pu
+        self.va_degree = va_degree
+        self.i_ka = i_ka
+        self.loading_percent = loading_percent
+
+
+class LinearPowerFlow:
+    """
+    A linearised load flow of a translated net, for screening many scenarios far faster than `pp.runpp`.
+
+    The bus admittance matrix is factorised once. Each scenario is then solved with a single back substitution, as a
+    first order correction to the voltages of the net with no load, which is accurate while the voltage drop is small.
+    The external grids hold their buses at their `vm_pu` and `va_degree`, and buses not connected to one have no
+    voltage.
+
+    :param result: The creation result of a pandapower creator. Its `admittance` is used if it was built with
+        `admittance=True`, and built here otherwise. Changes to the net's lines, trafos, switches or external grids
+        after this is created are not seen.
+    """
+
+    def __init__(self, result: BusBranchNetworkCreationResult):
+        net = result.network
+        self.net = net
+        objects = result.mappings.to_bbn.objects
+        self.mappings = objects if isinstance(objects, ElementMappingStore) else ElementMappingStore(objects)
+        self.sgen_sign = result.load_rows.sgen_sign
+        self.admittance: BusAdmittance = getattr(result, "admittance", None) or build_bus_admittance(net)
+
+        matrix = self.admittance.matrix
+        rows = self.admittance.rows
+        ext_grid = net.ext_grid[net.ext_grid.in_service.astype(bool) & net.ext_grid.bus.isin(rows.index)]
+        slack_rows, first = np.unique(rows[ext_grid.bus].to_numpy(), return_index=True)
+        slack_voltages = ext_grid.vm_pu.to_numpy(dtype=np.float64)[first] \
+            * np.exp(1j * np.deg2rad(ext_grid.va_degree.to_numpy(dtype=np.float64)[first]))
+
+        # Only the sparsity pattern decides which rows are connected.
+        pattern = csr_matrix((np.ones(matrix.nnz, dtype=np.int8), matrix.indices, matrix.indptr), shape=matrix.shape)
+        _, labels = connected_components(pattern, directed=False)
+        energised = np.isin(labels, labels[slack_rows])
+        energised[slack_rows] = False
+        self._pq_rows = np.flatnonzero(energised)
+        self._slack_rows = slack_rows
+        self._slack_voltages = slack_voltages
+
+        y_pq = matrix[self._pq_rows][:, self._pq_rows].tocsc()
+        self._lu = splu(y_pq)
+        # The voltages with no load, which each scenario is a correction to.
+        self._no_load = self._lu.solve(-(matrix[self._pq_rows][:, slack_rows] @ slack_voltages))
+
+        self._base_demand = self._net_demand()
+
+    def solve(self, p: pd.DataFrame, q: Optional[pd.DataFrame] = None, *, batch_size: int = 1000) -> ScreeningResult:
+        """
+        Solves a batch of scenarios, in the shape of a `LoadProfile`.
+
+        The P and Q of each mRID replace those of its load or sgen, with the same sign as a `LoadProfile` writes them.
+        Other mRIDs that map to a bus, e.g. a `ConnectivityNode` or `Terminal`, add their P and Q as load on it. The
+        loads and sgens of equipment not in the scenarios keep the P and Q of the net.
+
+        :param p: The P of each mRID in W, indexed by scenario with a column per mRID.
+        :param q: The Q of each mRID in VAr, in the same shape as `p`. If not given, Q is left as it is in the net.
+        :param batch_size: The number of scenarios solved together, which bounds the memory used.
+        :return: The voltages and line loadings of every scenario.
+        """
+        if q is not None and (not q.index.equals(p.index) or not q.columns.equals(p.columns)):
+            raise ValueError("The P and Q scenarios must have the same index and mRIDs.")
+
+        rows, factors, replaced = self._demand_of(p.columns)
+        p_mw = p.to_numpy(dtype=np.float64) / 1000000
+        q_mvar = None if q is None else q.to_numpy(dtype=np.float64) / 1000000
+        row_count = self.admittance.matrix.shape[0]
+        # Scatters the demand of each mRID onto its bus row.
+        scatter = csr_matrix((factors, (np.arange(len(rows)), rows)), shape=(len(rows), row_count))
+        replaced_demand = np.zeros(row_count, dtype=np.complex128)
+        np.add.at(replaced_demand, rows, replaced)
+        base_p = self._base_demand.real - replaced_demand.real
+        base_q = self._base_demand.imag - (0 if q is None else replaced_demand.imag)
+
+        voltages = np.full((len(p), row_count), np.nan, dtype=np.complex128)
+        for start in range(0, len(p), batch_size):
+            batch = slice(start, start + batch_size)
+            demand_p = base_p + scatter.T.dot(p_mw[batch].T).T
+            demand_q = base_q + (0 if q_mvar is None else scatter.T.dot(q_mvar[batch].T).T)
+            voltages[batch] = self._voltages(demand_p + 1j * demand_q)
+
+        return self._result(p.index, voltages)
+
+    def _net_demand(self) -> np.ndarray:
+        # The complex power drawn by the loads and sgens of the net at each row, in MVA.
+        net = self.net
+        rows = self.admittance.rows
+        demand = np.zeros(self.admittance.matrix.shape[0], dtype=np.complex128)
+        for table, sign in (("load", 1), ("sgen", -1)):
+            elements = net[table]
+            elements = elements[elements.in_service.astype(bool) & elements.bus.isin(rows.index)]
+            power = (elements.p_mw.to_numpy(dtype=np.float64) + 1j * elements.q_mvar.to_numpy(dtype=np.float64)) \
+                * elements.scaling.to_numpy(dtype=np.float64) * sign
+            np.add.at(demand, rows[elements.bus].to_numpy(), power)
+        return demand
+
+    def _demand_of(self, mrids: pd.Index) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # For each mRID, its row, the factor its P and Q are drawn with and the demand of the element it replaces.
+        # mRIDs without a row in service are given the factor 0.
+        net = self.net
+        rows = self.admittance.rows
+        bus = np.full(len(mrids), -1, dtype=np.int64)
+        factors = np.zeros(len(mrids))
+        replaced = np.zeros(len(mrids), dtype=np.complex128)
+
+        # Loads are looked up last, so equipment with both a load and an sgen only replaces its load, as in
+        # `LoadRowIndex`.
+        for table, sign in (("sgen", -self.sgen_sign), ("load", 1)):
+            elements = self.mappings.indices(mrids, table)
+            found = elements >= 0
+            table_rows = net[table].loc[elements[found]]
+            in_service = table_rows.in_service.to_numpy(dtype=bool)
+            scaling = table_rows.scaling.to_numpy(dtype=np.float64) * in_service
+            bus[found] = table_rows.bus.to_numpy()
+            factors[found] = sign * scaling
+            power = table_rows.p_mw.to_numpy(dtype=np.float64) + 1j * table_rows.q_mvar.to_numpy(dtype=np.float64)
+            replaced[found] = power * scaling * (1 if table == "load" else -1)
+
+        buses = self.mappings.indices(mrids, "bus")
+        only_bus = (bus < 0) & (buses >= 0)
+        bus[only_bus] = buses[only_bus]
+        factors[only_bus] = 1
+
+        bus_rows = rows.reindex(bus).fillna(-1).to_numpy(dtype=np.int64)
+        missing = bus_rows < 0
+        bus_rows[missing] = 0
+        factors[missing] = 0
+        replaced[missing] = 0
+        return bus_rows, factors, replaced
+
+    def _voltages(self, demand: np.ndarray) -> np.ndarray:
+        # The voltage of each row for each scenario, from the demand at each row in MVA.
+        injections = -demand[:, self._pq_rows] / self.admittance.sn_mva
+        currents = np.conj(injections / self._no_load)
+        voltages = np.full(demand.shape, np.nan, dtype=np.complex128)
+        voltages[:, self._pq_rows] = self._no_load + self._lu.solve(np.ascontiguousarray(currents.T)).T
+        voltages[:, self._slack_rows] = self._slack_voltages
+        return voltages
+
+    def _result(self, scenarios: pd.Index, voltages: np.ndarray) -> ScreeningResult:
+        net = self.net
+        rows = self.admittance.rows
+        bus_voltages = voltages[:, rows.to_numpy()]
+
+        line = net.line
+        ys, ysh = line_admittances(net, line)
+        y_half = ysh / 2
+        from_rows = rows.reindex(line.from_bus).fillna(-1).to_numpy(dtype=np.int64)
+        to_rows = rows.reindex(line.to_bus).fillna(-1).to_numpy(dtype=np.int64)
+        open_from, open_to = _open_ends(net, from_rows, to_rows)
+        v_from = voltages[:, np.maximum(from_rows, 0)]
+        v_to = voltages[:, np.maximum(to_rows, 0)]
+        # An open end floats at the voltage the charging of the line leaves it at.
+        floating = ys / (ys + y_half)
+        v_from = np.where(open_from & ~open_to, v_to * floating, v_from)
+        v_to = np.where(open_to & ~open_from, v_from * floating, v_to)
+        i_from = np.abs(ys * (v_from - v_to) + y_half * v_from)
+        i_to = np.abs(ys * (v_to - v_from) + y_half * v_to)
+
+        from_kv = net.bus.vn_kv.reindex(line.from_bus).to_numpy(dtype=np.float64)
+        base_ka = self.admittance.sn_mva / (np.sqrt(3) * from_kv)
+        i_ka = np.fmax(i_from, i_to) * base_ka
+        i_ka[:, ~line.in_service.to_numpy(dtype=bool) | (open_from & open_to)] = 0
+        rating_ka = (line.max_i_ka * line.df * line.parallel).to_numpy(dtype=np.float64)
+
+        return ScreeningResult(
+            vm_pu=pd.DataFrame(np.abs(bus_voltages), index=scenarios, columns=rows.index),
+            va_degree=pd.DataFrame(np.angle(bus_voltages, deg=True), index=scenarios, columns=rows.index),
+            i_ka=pd.DataFrame(i_ka, index=scenarios, columns=line.index),
+            loading_percent=pd.DataFrame(i_ka / rating_ka * 100, index=scenarios, columns=line.index)
+        )
+
+
+def _open_ends(net: pp.pandapowerNet, from_rows: np.ndarray, to_rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Which ends of each line are open, from a switch or an out of service bus.
+    switch = net.switch
+    open_switches = switch[(switch.et == "l") & ~switch.closed.astype(bool)]
+    positions = net.line.index.get_indexer(open_switches.element)
+    found = positions >= 0
+    at_from = open_switches.bus.to_numpy()[found] == net.line.from_bus.to_numpy()[positions[found]]
+    open_from = from_rows < 0
+    open_to = to_rows < 0
+    open_from[positions[found][at_from]] = True
+    open_to[positions[found][~at_from]] = True
+    return open_from, open_to
@@ -0,0 +1,192 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import copy
+from typing import Dict, List, Tuple, Optional, Union, Iterable, Set
+
+import pandapower as pp
+from zepben.evolve import NetworkService, BusBranchNetworkCreationResult, TerminalGrouping, IdentifiedObject
+
+from pp_creators.admittance import build_bus_admittance
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.creator_ee import PandaPowerNetworkCreatorEE
+from pp_creators.elements import PpElement
+from pp_creators.geometry import NetGeometry
+from pp_creators.load_profiles import LoadRowIndex
+from pp_creators.load_providers import PrefetchedLoads
+from pp_creators.mappings import GROUPING_MAPPINGS, SET_MAPPINGS, compact_mappings
+from pp_creators.switches import use_line_switches
+from pp_creators.table_buffer import PpTableBuffer
+from pp_creators.validators.validator import PandaPowerNetworkValidator
+from pp_creators.warm_start import seed_bus_voltages
+
+__all__ = ["create_shared_net"]
+
+PandaPowerCreator = Union[BasicPandaPowerNetworkCreator, PandaPowerNetworkCreatorEE]
+
+
+async def create_shared_net(
+        creator: PandaPowerCreator,
+        node_breaker_networks: Iterable[NetworkService],
+        *,
+        target_network: Optional[pp.pandapowerNet] = None
+) -> BusBranchNetworkCreationResult[pp.pandapowerNet, PandaPowerNetworkValidator]:
+    """
+    Translates several networks into a single pandapower net in one pass, rather than translating each into its own
+    net and merging them.
+
+    Equipment that is in more than one of the networks, such as the zone substation shared by the networks of each of
+    its feeders (see `pp_creators.feeders.feeder_networks`), is only translated once. Its elements are shared by every
+    network it is in, so feeders fed from the same bus share its external grid. The elements of every network are staged
+    together and written to the net once all the networks have been translated, and their indices are unique across the
+    whole net.
+
+    :param creator: The pandapower creator used to translate each network. It is left untouched, so it can be used at
+        the same time.
+    :param node_breaker_networks: The networks to translate. Equipment is matched between them by mRID.
+    :param target_network: The net to add the elements to. Defaults to a new empty net.
+    :return: The creation result for all the networks, with the mappings of every network. If any network fails to
+        translate, the result is unsuccessful with no network, and the positions of the networks that failed are set
+        as `failed_networks`.
+    """
+    net = target_network if target_network is not None else pp.create_empty_network()
+    shared = _SharedNetCreator(creator, net)
+    result = BusBranchNetworkCreationResult(creator.validator_creator())
+    result.failed_networks = []
+    result.geometry = None
+
+    for position, node_breaker_network in enumerate(node_breaker_networks):
+        network_result = await shared.creator.create(node_breaker_network)
+        if network_result.was_successful:
+            _add_mappings(result, network_result)
+            if network_result.geometry is not None:
+                result.geometry = result.geometry or NetGeometry()
+                result.geometry.extend(network_result.geometry)
+        else:
+            result.failed_networks.append(position)
+
+    if result.failed_networks:
+        creator.logger.error(f"Failed to translate networks {result.failed_networks}, see the errors logged above.")
+        PrefetchedLoads.detach(net)
+        return result
+
+    shared.table_buffer.flush(net)
+    compact_mappings(result.mappings)
+    result.network = net
+    if getattr(creator, "switch_elements", False):
+        use_line_switches(result)
+    result.was_successful = True
+    result.load_rows = LoadRowIndex.from_mappings(
+        result.mappings,
+        sgen_sign=1 if isinstance(creator, PandaPowerNetworkCreatorEE) else -1
+    )
+    if creator.initial_voltages is not None:
+        seed_bus_voltages(net, result.mappings.to_bbn.objects, creator.initial_voltages)
+    if creator.admittance:
+        result.admittance = build_bus_admittance(net)
+    return result
+
+
+class _SharedNetCreator:
+    # Wraps the callbacks of a copy of a creator, so every network it translates is created in the same net and the
+    # elements of equipment that has already been translated are returned again rather than created twice.
+
+    def __init__(self, creator: PandaPowerCreator, net: pp.pandapowerNet):
+        self.net = net
+        self.table_buffer = PpTableBuffer(net)
+        # What the creator callbacks returned for the equipment and terminals of each mRID.
+        self.results_by_mrid: Dict[str, Union[Tuple[str, PpElement], Dict[str, PpElement]]] = {}
+
+        self.creator = copy.copy(creator)
+        self.creator.buffer_tables = False
+        # The admittance matrix is assembled and the bus voltages seeded once every network has been written to the net.
+        self.creator.admittance = False
+        self.creator.initial_voltages = None
+        self.creator.create_network = lambda: self.net
+        self.creator.create_element = lambda _, element_type, **kwargs: self.table_buffer.add(element_type, **kwargs)
+        self._wrap_node_creator()
+        self._wrap_branch_creator()
+        for name in ("equivalent_branch_creator", "power_transformer_creator", "energy_source_creator",
+                     "energy_consumer_creator", "power_electronics_connection_creator"):
+            self._wrap_equipment_creator(name)
+        if hasattr(self.creator, "switch_creator"):
+            self._wrap_equipment_creator("switch_creator")
+
+    def _wrap_node_creator(self):
+        node_creator = self.creator.topological_node_creator
+
+        def shared_node_creator(net, base_voltage, collapsed_conducting_equipment, border_terminals, inner_terminals,
+                                node_breaker_network) -> Tuple[str, PpElement]:
+            mrids = [t.mrid for t in (*border_terminals, *inner_terminals)]
+            created = self._created(mrids)
+            if created is None:
+                created = node_creator(net, base_voltage, collapsed_conducting_equipment, border_terminals,
+                                       inner_terminals, node_breaker_network)
+            self._remember(mrids, created)
+            return created
+
+        self.creator.topological_node_creator = shared_node_creator
+
+    def _wrap_branch_creator(self):
+        branch_creator = self.creator.topological_branch_creator
+
+        def shared_branch_creator(net, connected_topological_nodes, length, collapsed_ac_line_segments,
+                                  border_terminals, inner_terminals, node_breaker_network) -> Tuple[str, PpElement]:
+            mrids = [acls.mrid for acls in collapsed_ac_line_segments]
+            created = self._created(mrids)
+            if created is None:
+                created = branch_creator(net, connected_topological_nodes, length, collapsed_ac_line_segments,
+                                         border_terminals, inner_terminals, node_breaker_network)
+            self._remember(mrids, created)
+            return created
+
+        self.creator.topological_branch_creator = shared_branch_creator
+
+    def _wrap_equipment_creator(self, name: str):
+        equipment_creator = getattr(self.creator, name)
+
+        def shared_equipment_creator(net, equipment, *args):
+            created = self._created([equipment.mrid])
+            if created is None:
+                created = equipment_creator(net, equipment, *args)
+            self._remember([equipment.mrid], created)
+            return created
+
+        setattr(self.creator, name, shared_equipment_creator)
+
+    def _created(self, mrids: List[str]):
+        return next((self.results_by_mrid[mrid] for mrid in mrids if mrid in self.results_by_mrid), None)
+
+    def _remember(self, mrids: List[str], created):
+        for mrid in mrids:
+            self.results_by_mrid.setdefault(mrid, created)
+
+
+def _add_mappings(result: BusBranchNetworkCreationResult, network_result: BusBranchNetworkCreationResult):
+    objects = result.mappings.to_bbn.objects
+    for mrid, elements in network_result.mappings.to_bbn.objects.items():
+        objects.setdefault(mrid, set()).update(elements)
+
+    for name in GROUPING_MAPPINGS:
+        target: Dict[str, TerminalGrouping] = getattr(result.mappings.to_nbn, name)
+        for key, grouping in getattr(network_result.mappings.to_nbn, name).items():
+            existing = target.get(key)
+            target[key] = grouping if existing is None else TerminalGrouping(
+                border_terminals=_union(existing.border_terminals, grouping.border_terminals),
+                inner_terminals=_union(existing.inner_terminals, grouping.inner_terminals),
+                conducting_equipment_group=_union(existing.conducting_equipment_group,
+                                                  grouping.conducting_equipment_group)
+            )
+    for name in SET_MAPPINGS:
+        target: Dict[str, Set[IdentifiedObject]] = getattr(result.mappings.to_nbn, name)
+        for key, ios in getattr(network_result.mappings.to_nbn, name).items():
+            target[key] = _union(target.get(key, ()), ios)
+
+
+def _union(a: Iterable[IdentifiedObject], b: Iterable[IdentifiedObject]) -> set:
+    # Equipment is matched by mRID, as the networks may hold different objects for the same equipment.
+    by_mrid = {io.mrid: io for io in a}
+    by_mrid.update((io.mrid, io) for io in b if io.mrid not in by_mrid)
+    return set(by_mrid.values())
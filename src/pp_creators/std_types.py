@@ -0,0 +1,49 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import hashlib
+from typing import Dict, Any
+
+import pandapower as pp
+
+__all__ = ["intern_std_type", "update_std_type"]
+
+
+def intern_std_type(net: pp.pandapowerNet, element: str, data: Dict[str, Any]) -> str:
+    """
+    Finds the standard type of `net` with exactly the parameters in `data`, creating it the first time it is needed.
+
+    The name of the type is derived from its parameters, so the same parameters get the same type in every net and a
+    type is never created twice.
+
+    :param net: The net to add the type to.
+    :param element: "line" or "trafo".
+    :param data: The parameters of the type, as for `pp.create_std_type`.
+    :return: The name of the type.
+    """
+    name = f"{element}_{hashlib.sha1(repr(sorted(data.items())).encode()).hexdigest()[:12]}"
+    if name not in net.std_types[element]:
+        pp.create_std_type(net, dict(data), name, element)
+    return name
+
+
+def update_std_type(net: pp.pandapowerNet, element: str, name: str, **parameters):
+    """
+    Changes the parameters of a standard type, along with every element of that type, e.g. to try another impedance for
+    every line of one conductor type.
+
+    :param net: The net with the type.
+    :param element: "line" or "trafo".
+    :param name: The name of the type.
+    :param parameters: The new values of the parameters, e.g. `r_ohm_per_km=0.2`.
+    """
+    if name in net.std_types[element]:
+        net.std_types[element][name].update(parameters)
+
+    table = net[element]
+    of_type = table.std_type.values == name
+    for parameter, value in parameters.items():
+        if parameter in table.columns:
+            table.loc[of_type, parameter] = value
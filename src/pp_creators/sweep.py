@@ -0,0 +1,264 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Optional, Mapping, Iterable, Any
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import NetworkService, ConnectivityNode, AcLineSegment, PowerTransformer
+
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.mappings import ElementMappingStore
+from pp_creators.parallel_creator import worker_context
+
+__all__ = ["PARAMETER_COLUMNS", "SweepCase", "SweepResult", "run_sweep"]
+
+PARAMETER_COLUMNS: Dict[str, Optional[Tuple[Tuple[str, str], ...]]] = {
+    "vm_pu": (("ext_grid", "vm_pu"),),
+    "tap_pos": (("trafo", "tap_pos"),),
+    "load_scale": (("load", "scaling"),),
+    "min_line_r_ohm": None,
+    "min_line_x_ohm": None
+}
+"""
+The table columns each parameter of a `SweepCase` changes. Parameters mapped to None change which lines are collapsed
+into buses, so the cases with each distinct value of them are derived from a translation of their own.
+"""
+
+# A column update of a case: the table and column, and the rows to set with their values.
+_ColumnUpdate = Tuple[str, str, np.ndarray, np.ndarray]
+
+# The result columns returned from the workers for each table.
+_RESULT_COLUMNS = {
+    "bus": ["vm_pu", "va_degree", "p_mw", "q_mvar"],
+    "line": ["loading_percent", "i_ka", "p_from_mw", "q_from_mvar", "pl_mw", "ql_mvar"],
+    "trafo": ["loading_percent", "p_hv_mw", "q_hv_mvar", "pl_mw", "ql_mvar"]
+}
+
+
+class SweepCase:
+    """
+    One case of a parameter sweep. Parameters left as None keep the value of the creator the sweep is run with.
+
+    :param name: The name of the case, which indexes its results.
+    :param vm_pu: The voltage set point of the external grids.
+    :param min_line_r_ohm: The resistance below which lines are collapsed, as for `BasicPandaPowerNetworkCreator`.
+    :param min_line_x_ohm: The reactance below which lines are collapsed, as for `BasicPandaPowerNetworkCreator`.
+    :param tap_pos: The tap position of the transformers with tap changers, keyed by `PowerTransformer` mRID.
+    :param load_scale: The factor applied to the P and Q of every load.
+    """
+
+    def __init__(
+            self, *,
+            name: str,
+            vm_pu: Optional[float] = None,
+            min_line_r_ohm: Optional[float] = None,
+            min_line_x_ohm: Optional[float] = None,
+            tap_pos: Optional[Mapping[str, int]] = None,
+            load_scale: Optional[float] = None
+    ):
+        self.name = name
+        self.vm_pu = vm_pu
+        self.min_line_r_ohm = min_line_r_ohm
+        self.min_line_x_ohm = min_line_x_ohm
+        self.tap_pos = tap_pos
+        self.load_scale = load_scale
+
+    def __repr__(self):
+        return f"SweepCase(name={self.name!r})"
+
+
+class SweepResult:
+    """
+    The load flow results of every case of a sweep, stacked into one frame per table, indexed by case name and mRID.
+
+    :param buses: The `res_bus` columns of the bus of each `ConnectivityNode`.
+    :param lines: The `res_line` columns of the line of each `AcLineSegment`.
+    :param trafos: The `res_trafo` columns of the trafo of each `PowerTransformer`.
+    :param failed_cases: The names of the cases whose load flow did not converge, which have no results.
+    """
+
+    def __init__(self, *, buses: pd.DataFrame, lines: pd.DataFrame, trafos: pd.DataFrame, failed_cases: List[str]):
+        self.buses = buses
+        self.lines = lines
+        self.trafos = trafos
+        self.failed_cases = failed_cases
+
+
+async def run_sweep(
+        creator: BasicPandaPowerNetworkCreator,
+        node_breaker_network: NetworkService,
+        cases: Iterable[SweepCase],
+        *,
+        max_workers: Optional[int] = None,
+        start_method: Optional[str] = None,
+        **kwargs
+) -> SweepResult:
+    """
+    Runs a load flow for every case of a parameter sweep, translating the network once rather than once per case.
+
+    Each case is derived from the translated net by updating the columns its parameters change, see
+    `PARAMETER_COLUMNS`. The updated tables are copied for the case, and every other table is shared with the
+    translated net. The cases are solved in worker processes, which are each sent the translated nets once, and only
+    the column updates of each case after that.
+
+    :param creator: The creator to translate with. Only a copy of it is used, with tap changers included if any case
+        sets a tap position, and the line thresholds of each case.
+    :param node_breaker_network: The `NetworkService` to translate.
+    :param cases: The cases to run. Their names must be unique.
+    :param max_workers: The maximum number of worker processes. Defaults to the number of CPUs.
+    :param start_method: The multiprocessing start method of the workers. Defaults to "fork", see `create_by_feeder`.
+    :param kwargs: Keyword arguments for `pp.runpp`.
+    :return: The results of every case.
+    :raises ValueError: If the translation fails, or the case names are not unique.
+    """
+    cases = list(cases)
+    names = [case.name for case in cases]
+    if len(set(names)) != len(names):
+        raise ValueError("The names of the sweep cases must be unique.")
+
+    include_tap_changers = creator.include_tap_changers or any(case.tap_pos for case in cases)
+    bases: Dict[Tuple[float, float], _SweepBase] = {}
+    for case in cases:
+        key = _translation_key(creator, case)
+        if key not in bases:
+            bases[key] = await _SweepBase.translate(creator, node_breaker_network, key, include_tap_changers)
+
+    keys = [_translation_key(creator, case) for case in cases]
+    updates = [bases[key].updates(case) for key, case in zip(keys, cases)]
+    nets = {key: base.net for key, base in bases.items()}
+    context = worker_context(start_method, "run_sweep")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_set_worker_nets,
+                             initargs=(nets,)) as executor:
+        solved = list(executor.map(_solve_case, keys, updates, [kwargs] * len(cases)))
+
+    failed_cases = [case.name for case, results in zip(cases, solved) if results is None]
+    frames = {table: [] for table in _RESULT_COLUMNS}
+    for key, case, results in zip(keys, cases, solved):
+        if results is not None:
+            for table, frame in bases[key].by_mrid(results).items():
+                frames[table].append(pd.concat({case.name: frame}, names=["case", "mrid"]))
+
+    stacked = {
+        table: pd.concat(table_frames) if table_frames else pd.DataFrame(
+            columns=_RESULT_COLUMNS[table],
+            index=pd.MultiIndex.from_arrays([[], []], names=["case", "mrid"])
+        )
+        for table, table_frames in frames.items()
+    }
+    return SweepResult(buses=stacked["bus"], lines=stacked["line"], trafos=stacked["trafo"],
+                       failed_cases=failed_cases)
+
+
+class _SweepBase:
+    # A translation shared by the cases with the same line thresholds, and the rows each mRID maps to in it.
+
+    def __init__(
+            self,
+            net: pp.pandapowerNet,
+            rows: Dict[str, Tuple[np.ndarray, np.ndarray]],
+            store: ElementMappingStore
+    ):
+        self.net = net
+        self.rows = rows
+        self.store = store
+
+    @staticmethod
+    async def translate(
+            creator: BasicPandaPowerNetworkCreator,
+            node_breaker_network: NetworkService,
+            key: Tuple[float, float],
+            include_tap_changers: bool
+    ) -> '_SweepBase':
+        case_creator = copy.copy(creator)
+        case_creator.min_line_r_ohm, case_creator.min_line_x_ohm = key
+        case_creator.include_tap_changers = include_tap_changers
+        result = await case_creator.create(node_breaker_network)
+        if not result.was_successful:
+            raise ValueError(f"Failed to translate the network with min_line_r_ohm={key[0]} and "
+                             f"min_line_x_ohm={key[1]}.")
+
+        store = result.mappings.to_bbn.objects
+        if not isinstance(store, ElementMappingStore):
+            store = ElementMappingStore(store)
+        rows = {}
+        for table, ios in (("bus", node_breaker_network.objects(ConnectivityNode)),
+                           ("line", node_breaker_network.objects(AcLineSegment)),
+                           ("trafo", node_breaker_network.objects(PowerTransformer))):
+            mrids = np.array([io.mrid for io in ios], dtype=object)
+            indices = store.indices(mrids, table)
+            found = indices >= 0
+            rows[table] = (mrids[found], indices[found])
+        return _SweepBase(result.network, rows, store)
+
+    def updates(self, case: SweepCase) -> List[_ColumnUpdate]:
+        net = self.net
+        updates = []
+        if case.vm_pu is not None:
+            updates.append(("ext_grid", "vm_pu", net.ext_grid.index.to_numpy(),
+                            np.full(len(net.ext_grid), case.vm_pu)))
+        if case.load_scale is not None:
+            updates.append(("load", "scaling", net.load.index.to_numpy(), np.full(len(net.load), case.load_scale)))
+        if case.tap_pos:
+            mrids = list(case.tap_pos)
+            trafos = self.store.indices(mrids, "trafo")
+            if (trafos < 0).any():
+                missing = [mrid for mrid, index in zip(mrids, trafos) if index < 0]
+                raise ValueError(f"Case {case.name!r} sets the tap position of unknown transformers {missing}.")
+            positions = np.array([case.tap_pos[mrid] for mrid in mrids], dtype=np.float64)
+            updates.append(("trafo", "tap_pos", trafos, positions))
+        return updates
+
+    def by_mrid(self, results: Dict[str, np.ndarray]) -> Dict[str, pd.DataFrame]:
+        frames = {}
+        for table, (mrids, indices) in self.rows.items():
+            values = results[table]
+            positions = self.net[table].index.get_indexer(indices)
+            frames[table] = pd.DataFrame(values[positions], index=pd.Index(mrids, name="mrid"),
+                                         columns=_RESULT_COLUMNS[table])
+        return frames
+
+
+def _translation_key(creator: BasicPandaPowerNetworkCreator, case: SweepCase) -> Tuple[float, float]:
+    return (
+        creator.min_line_r_ohm if case.min_line_r_ohm is None else case.min_line_r_ohm,
+        creator.min_line_x_ohm if case.min_line_x_ohm is None else case.min_line_x_ohm
+    )
+
+
+# The translated nets of a sweep, set in each worker when it starts.
+_worker_nets: Dict[Tuple[float, float], pp.pandapowerNet] = {}
+
+
+def _set_worker_nets(nets: Dict[Tuple[float, float], pp.pandapowerNet]):
+    _worker_nets.clear()
+    _worker_nets.update(nets)
+
+
+def _solve_case(
+        key: Tuple[float, float],
+        updates: List[_ColumnUpdate],
+        kwargs: Dict[str, Any]
+) -> Optional[Dict[str, np.ndarray]]:
+    base = _worker_nets[key]
+    # A shallow copy shares every table with the translated net, so only the tables the case changes are copied.
+    net = copy.copy(base)
+    for table in {table for table, _, _, _ in updates}:
+        net[table] = base[table].copy()
+    for table, column, rows, values in updates:
+        net[table].loc[rows, column] = values
+
+    try:
+        pp.runpp(net, **kwargs)
+    except pp.LoadflowNotConverged:
+        return None
+    return {
+        table: net[f"res_{table}"][columns].to_numpy(dtype=np.float64)
+        for table, columns in _RESULT_COLUMNS.items()
+    }
@@ -0,0 +1,180 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Mapping, Optional, Dict, List
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import NetworkService, BusBranchNetworkCreationResult, Switch, Terminal, Breaker, \
+    LoadBreakSwitch, Disconnector, BusBranchNetworkCreator
+
+from pp_creators.elements import PpElement
+from pp_creators.mappings import ElementMappingStore
+from pp_creators.utils import group_terminals, grouping_mrids, get_base_voltage
+
+__all__ = ["SWITCH_TYPES", "create_switch_elements", "use_line_switches", "set_switches_open"]
+
+SWITCH_TYPES: Dict[type, str] = {Breaker: "CB", LoadBreakSwitch: "LBS", Disconnector: "DS"}
+"""
+The pandapower `type` of the `net.switch` row of each kind of `Switch`. Other switches, e.g. fuses, have none.
+"""
+
+
+def create_switch_elements(
+        creator: BusBranchNetworkCreator,
+        result: BusBranchNetworkCreationResult,
+        node_breaker_network: NetworkService
+):
+    """
+    Creates a bus-bus `net.switch` row for every `Switch` with two terminals, open or closed, with the creator's
+    `switch_creator`, and maps its mRID to it.
+
+    The creator must not treat switches as having negligible impedance, so the buses on either side of each switch are
+    kept apart. The buses of terminals that only connect to other switches are created here, as nothing else creates
+    them.
+
+    :param creator: The pandapower creator `result` is being created with.
+    :param result: The creation result, before its mappings are compacted.
+    :param node_breaker_network: The network being translated.
+    """
+    net = result.network
+    objects = result.mappings.to_bbn.objects
+
+    for switch in node_breaker_network.objects(Switch):
+        terminals = list(switch.terminals)
+        if len(terminals) != 2:
+            creator.logger.warning(f"Skipping switch {switch.mrid}, as it has {len(terminals)} terminals rather than 2.")
+            continue
+
+        buses = [_bus_of(creator, result, node_breaker_network, switch, t) for t in terminals]
+        if None in buses:
+            creator.logger.warning(f"Skipping switch {switch.mrid}, as it has no base voltage.")
+            continue
+        if buses[0] == buses[1]:
+            # Both sides are already joined by negligible impedance equipment, so the switch has no effect.
+            objects.setdefault(switch.mrid, set()).add(PpElement(buses[0], "bus"))
+            continue
+
+        objects.setdefault(switch.mrid, set()).add(creator.switch_creator(net, switch, (buses[0], buses[1])))
+
+
+def use_line_switches(result: BusBranchNetworkCreationResult):
+    """
+    Turns each bus-bus switch with a bus that only connects it to a single line into a bus-line switch at the end of
+    that line, dropping the bus. The mRIDs that mapped to the dropped bus map to the line instead.
+
+    :param result: A creation result with switches from `create_switch_elements`, once its tables are written.
+    """
+    net = result.network
+    switch = net.switch
+    if not len(switch):
+        return
+
+    references = _bus_references(net)
+    line_ends = {
+        bus: (index, column)
+        for column in ("from_bus", "to_bus")
+        for index, bus in zip(net.line.index.tolist(), net.line[column].tolist())
+    }
+
+    dropped: Dict[int, int] = {}
+    for index, bus, element, et in zip(switch.index.tolist(), switch.bus.tolist(), switch.element.tolist(),
+                                       switch.et.tolist()):
+        if et != "b":
+            continue
+        for kept, end in ((bus, element), (element, bus)):
+            if references.get(end, 0) != 2 or end not in line_ends or end in dropped or kept in dropped:
+                continue
+            line, column = line_ends[end]
+            other_column = "to_bus" if column == "from_bus" else "from_bus"
+            if net.line.at[line, other_column] == kept:
+                continue
+            net.line.at[line, column] = kept
+            switch.loc[index, ["bus", "element", "et"]] = [kept, line, "l"]
+            references[kept] += 1
+            dropped[end] = line
+            break
+
+    if not dropped:
+        return
+    net.bus.drop(index=list(dropped), inplace=True)
+    net.bus_geodata.drop(index=net.bus_geodata.index.intersection(list(dropped)), inplace=True)
+    _map_to_lines(result, dropped)
+
+
+def set_switches_open(result: BusBranchNetworkCreationResult, open_states: Mapping[str, bool]):
+    """
+    Opens and closes the `net.switch` rows of switches in bulk, e.g. to apply a switching scenario before the next
+    `pp.runpp`.
+
+    :param result: A creation result with switches from `create_switch_elements`.
+    :param open_states: Whether each switch should be open, keyed by mRID. Switches without a row are ignored.
+    """
+    objects = result.mappings.to_bbn.objects
+    if not isinstance(objects, ElementMappingStore):
+        objects = ElementMappingStore(objects)
+    mrids = list(open_states)
+    rows = objects.indices(mrids, "switch")
+    found = rows >= 0
+    closed = ~np.fromiter((open_states[mrid] for mrid in mrids), dtype=bool, count=len(mrids))
+    net = result.network
+    net.switch.loc[rows[found], "closed"] = closed[found]
+
+
+def _bus_of(
+        creator: BusBranchNetworkCreator,
+        result: BusBranchNetworkCreationResult,
+        node_breaker_network: NetworkService,
+        switch: Switch,
+        terminal: Terminal
+) -> Optional[int]:
+    objects = result.mappings.to_bbn.objects
+    bus = next((element.index for element in objects.get(terminal.mrid, ()) if element.type == "bus"), None)
+    if bus is not None:
+        return bus
+
+    grouping, _ = group_terminals(terminal, creator.has_negligible_impedance)
+    base_voltage = get_base_voltage(grouping.border_terminals)
+    if base_voltage is None and switch.base_voltage is not None:
+        base_voltage = switch.base_voltage.nominal_voltage
+    if base_voltage is None:
+        return None
+
+    tn_id, node = creator.topological_node_creator(
+        result.network,
+        base_voltage,
+        frozenset(grouping.conducting_equipment_group),
+        frozenset(grouping.border_terminals),
+        frozenset(grouping.inner_terminals),
+        node_breaker_network
+    )
+    result.mappings.to_nbn.topological_nodes[tn_id] = grouping
+    for mrid in grouping_mrids(grouping):
+        objects.setdefault(mrid, set()).add(node)
+    return node.index
+
+
+def _bus_references(net: pp.pandapowerNet) -> Dict[int, int]:
+    # How many times each bus is referenced by the elements of the net, counting each end of a branch or switch.
+    columns: List[pd.Series] = [net.line.from_bus, net.line.to_bus, net.trafo.hv_bus, net.trafo.lv_bus, net.load.bus,
+                                net.sgen.bus, net.ext_grid.bus, net.switch.bus,
+                                net.switch.element[net.switch.et == "b"]]
+    return pd.concat(columns).value_counts().to_dict()
+
+
+def _map_to_lines(result: BusBranchNetworkCreationResult, dropped: Dict[int, int]):
+    objects = result.mappings.to_bbn.objects
+    topological_nodes = result.mappings.to_nbn.topological_nodes
+    for bus, line in dropped.items():
+        grouping = topological_nodes.pop(f"bus:{bus}", None)
+        if grouping is None:
+            continue
+        for mrid in grouping_mrids(grouping):
+            elements = objects.get(mrid)
+            if elements is not None:
+                elements.discard(PpElement(bus, "bus"))
+                elements.add(PpElement(line, "line"))
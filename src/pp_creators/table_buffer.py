@@ -0,0 +1,236 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import inspect
+from typing import Dict, List, Any, Callable, Optional
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+
+__all__ = ["PpTableBuffer", "create_element"]
+
+_TABLE_BUFFER_KEY = "_pp_table_buffer"
+
+
+class _StagedTable:
+
+    def __init__(self, create_fn: Callable, first_index: int):
+        self.defaults = {name: param.default for name, param in inspect.signature(create_fn).parameters.items()}
+        self.first_index = first_index
+        self.size = 0
+        self.columns: Dict[str, List[Any]] = {}
+
+    def append(self, row: Dict[str, Any]) -> int:
+        for column, value in row.items():
+            if column not in self.columns:
+                self.columns[column] = [self.defaults.get(column)] * self.size
+            self.columns[column].append(value)
+        for column, values in self.columns.items():
+            if column not in row:
+                values.append(self.defaults.get(column))
+
+        index = self.first_index + self.size
+        self.size += 1
+        return index
+
+    def bulk_kwargs(self) -> Dict[str, Any]:
+        # pandapower only treats text and missing values correctly in bulk when they are passed as object arrays.
+        return {
+            column: values if column == "geodata" else np.array(
+                values,
+                dtype=object if any(v is None or isinstance(v, str) for v in values) else None
+            )
+            for column, values in self.columns.items()
+        }
+
+    def index(self) -> List[int]:
+        return list(range(self.first_index, self.first_index + self.size))
+
+
+_SINGLE_CREATORS: Dict[str, Callable] = {
+    "bus": pp.create_bus,
+    "line": pp.create_line_from_parameters,
+    "trafo": pp.create_transformer_from_parameters,
+    "load": pp.create_load,
+    "sgen": pp.create_sgen,
+    "ext_grid": pp.create_ext_grid,
+    "switch": pp.create_switch
+}
+
+
+class PpTableBuffer:
+    """
+    Columnar staging buffers for the pandapower element tables created by the translators.
+
+    Rows are staged with the same keyword arguments as the corresponding single element `pp.create_*` function and are
+    assigned the index that function would have returned. `flush` then materialises every table with one bulk call,
+    avoiding the per-row DataFrame appends of the single element functions.
+    """
+
+    def __init__(self, net: pp.pandapowerNet):
+        self._tables: Dict[str, _StagedTable] = {
+            element_type: _StagedTable(create_fn, pp.get_free_id(net[element_type]))
+            for element_type, create_fn in _SINGLE_CREATORS.items()
+        }
+
+    @staticmethod
+    def attach(net: pp.pandapowerNet) -> 'PpTableBuffer':
+        table_buffer = PpTableBuffer(net)
+        net[_TABLE_BUFFER_KEY] = table_buffer
+        return table_buffer
+
+    @staticmethod
+    def detach(net: pp.pandapowerNet) -> Optional['PpTableBuffer']:
+        return net.pop(_TABLE_BUFFER_KEY, None)
+
+    def add(self, element_type: str, **kwargs) -> int:
+        return self._tables[element_type].append(kwargs)
+
+    def flush(self, net: pp.pandapowerNet):
+        self._flush_buses(net, self._tables["bus"])
+        self._flush_lines(net, self._tables["line"])
+        self._flush_trafos(net, self._tables["trafo"])
+        self._flush_loads_or_sgens(net, "load", self._tables["load"], pp.create_loads)
+        self._flush_loads_or_sgens(net, "sgen", self._tables["sgen"], pp.create_sgens)
+        self._flush_ext_grids(net, self._tables["ext_grid"])
+        self._flush_switches(net, self._tables["switch"])
+        for table in self._tables.values():
+            table.first_index += table.size
+            table.size = 0
+            table.columns = {}
+
+    @staticmethod
+    def _flush_buses(net: pp.pandapowerNet, table: _StagedTable):
+        if not table.size:
+            return
+        columns = table.bulk_kwargs()
+        geodata = columns.pop("geodata", None)
+        pp.create_buses(net, table.size, index=table.index(), **columns)
+        _restore_missing_text(net, "bus", table.index())
+        if geodata is not None:
+            rows = [None if xy is None else {"x": xy[0], "y": xy[1]} for xy in geodata]
+            _append_geodata(net, "bus", table.index(), rows)
+
+    @staticmethod
+    def _flush_lines(net: pp.pandapowerNet, table: _StagedTable):
+        if not table.size:
+            return
+        columns = table.bulk_kwargs()
+        from_buses = columns.pop("from_bus")
+        to_buses = columns.pop("to_bus")
+        geodata = columns.pop("geodata", None)
+        std_types = columns.pop("std_type", None)
+        pp.create_lines_from_parameters(net, from_buses, to_buses, index=table.index(), **columns)
+        _set_std_types(net, "line", table.index(), std_types)
+        _restore_missing_text(net, "line", table.index())
+        if geodata is not None:
+            rows = [None if coords is None else {"coords": coords} for coords in geodata]
+            _append_geodata(net, "line", table.index(), rows)
+
+    @staticmethod
+    def _flush_trafos(net: pp.pandapowerNet, table: _StagedTable):
+        if not table.size:
+            return
+        columns = table.bulk_kwargs()
+        hv_buses = columns.pop("hv_bus")
+        lv_buses = columns.pop("lv_bus")
+        std_types = columns.pop("std_type", None)
+        pp.create_transformers_from_parameters(net, hv_buses, lv_buses, index=table.index(), **columns)
+        _set_std_types(net, "trafo", table.index(), std_types)
+        _restore_missing_text(net, "trafo", table.index())
+
+    @staticmethod
+    def _flush_loads_or_sgens(net: pp.pandapowerNet, element_type: str, table: _StagedTable, create_fn: Callable):
+        if not table.size:
+            return
+        columns = table.bulk_kwargs()
+        buses = columns.pop("bus")
+        existing_columns = set(net[element_type].columns)
+        create_fn(net, buses, index=table.index(), **columns)
+
+        # create_sgens always adds a generator_type column, where create_sgen only adds it when one is given.
+        extra_columns = [c for c in net[element_type].columns if c not in existing_columns and c not in columns]
+        net[element_type] = net[element_type].drop(columns=extra_columns)
+        _restore_missing_text(net, element_type, table.index())
+
+    @staticmethod
+    def _flush_ext_grids(net: pp.pandapowerNet, table: _StagedTable):
+        # There are only ever a handful of external grids, and pandapower has no bulk creator for them.
+        for i, index in enumerate(table.index()):
+            pp.create_ext_grid(net, index=index, **{column: values[i] for column, values in table.columns.items()})
+
+    @staticmethod
+    def _flush_switches(net: pp.pandapowerNet, table: _StagedTable):
+        if not table.size:
+            return
+        columns = table.bulk_kwargs()
+        buses = columns.pop("bus")
+        elements = columns.pop("element")
+        et = columns.pop("et")
+        pp.create_switches(net, buses, elements, et, index=table.index(), **columns)
+        _restore_missing_text(net, "switch", table.index())
+
+
+def create_element(net: pp.pandapowerNet, element_type: str, **kwargs) -> int:
+    """
+    Creates an element in `net[element_type]`, staging it in the net's `PpTableBuffer` if one is attached.
+
+    :param net: The pandapower network to create the element in.
+    :param element_type: The pandapower table of the element, e.g. "bus" or "line".
+    :param kwargs: Keyword arguments for the single element `pp.create_*` function of `element_type`. Lines and trafos
+        also take the name of the `std_type` their parameters come from.
+    :return: The index of the created element.
+    """
+    table_buffer = net.get(_TABLE_BUFFER_KEY)
+    if table_buffer is not None:
+        return table_buffer.add(element_type, **kwargs)
+    std_type = kwargs.pop("std_type", None)
+    index = _SINGLE_CREATORS[element_type](net, **kwargs)
+    if std_type is not None:
+        net[element_type].at[index, "std_type"] = std_type
+    return index
+
+
+def _append_geodata(net: pp.pandapowerNet, element_type: str, index: List[int], rows: List[Optional[Dict[str, Any]]]):
+    # The bulk creators only accept geodata for every element, but elements without a location must not get a row.
+    geo_table = f"{element_type}_geodata"
+    located = [(i, row) for i, row in zip(index, rows) if row is not None]
+    if not located:
+        return
+
+    dtypes = net[geo_table].dtypes
+    new_rows = pd.DataFrame(index=[i for i, _ in located], columns=net[geo_table].columns)
+    for column in new_rows.columns:
+        if column in located[0][1]:
+            new_rows[column] = [row[column] for _, row in located]
+    net[geo_table] = pd.concat([net[geo_table], new_rows], sort=False) if len(net[geo_table]) else new_rows
+    _preserve_dtypes(net[geo_table], dtypes)
+
+
+def _set_std_types(net: pp.pandapowerNet, element_type: str, index: List[int], std_types: Optional[np.ndarray]):
+    # The *_from_parameters creators always leave the std_type empty, so it is set once the rows exist.
+    if std_types is not None:
+        net[element_type].loc[index, "std_type"] = std_types
+
+
+def _restore_missing_text(net: pp.pandapowerNet, element_type: str, index: List[int]):
+    # The bulk creators leave NaN in text columns where the single element creators store None.
+    table = net[element_type]
+    for column in table.columns[table.dtypes == object]:
+        values = table.loc[index, column]
+        missing = values.index[values.isna()]
+        if len(missing):
+            table.loc[missing, column] = None
+
+
+def _preserve_dtypes(df, dtypes):
+    for column, dtype in dtypes.items():
+        if column in df.columns and df[column].dtype != dtype:
+            try:
+                df[column] = df[column].astype(dtype)
+            except (TypeError, ValueError):
+                pass
@@ -0,0 +1,226 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional, Union, Tuple, Any, Dict
+
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import NetworkService, ConductingEquipment, AcLineSegment, Switch, PowerTransformer, \
+    EnergyConsumer, PowerElectronicsConnection, EnergySource, EquivalentBranch, BusBranchNetworkCreator, \
+    BusBranchNetworkCreationResult
+
+from pp_creators.load_providers import BatchLoadProvider, describe_load_provider
+from pp_creators.mappings import mappings_to_mrids, mappings_from_mrids
+
+__all__ = ["TranslationCache", "fingerprint"]
+
+logger = logging.getLogger(__name__)
+
+_PRIMITIVES = (bool, int, float, str, type(None))
+
+
+def fingerprint(node_breaker_network: NetworkService, creator: BusBranchNetworkCreator, extra_key: str = "") -> str:
+    """
+    Hashes everything about a network that a translation depends on: the equipment and its connectivity, switch states,
+    impedances, ratings, loads and locations, along with the type of `creator`, its simple parameters such as
+    `min_line_r_ohm` and `include_tap_changers`, its tables such as `initial_voltages`, and the type and name of each of
+    its load providers.
+
+    The loads a provider returns are not part of the fingerprint, as they are not known until it is called. Pass
+    something identifying the data behind the load providers as `extra_key`.
+
+    :return: A hex digest that is the same for networks that translate identically.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    params = sorted((k, v) for k, v in vars(creator).items() if isinstance(v, _PRIMITIVES))
+    params += sorted((k, _describe_frame(v)) for k, v in vars(creator).items() if isinstance(v, pd.DataFrame))
+    params += sorted((k, describe_load_provider(v)) for k, v in _load_providers(creator).items())
+    digest.update(repr((type(creator).__module__, type(creator).__qualname__, params, extra_key)).encode())
+    for ce in sorted(node_breaker_network.objects(ConductingEquipment), key=lambda it: it.mrid):
+        digest.update(repr(_equipment_record(ce)).encode())
+    return digest.hexdigest()
+
+
+def _describe_frame(frame: pd.DataFrame) -> Tuple[Any, ...]:
+    # hash_pandas_object hashes each row with its index, but not the column names.
+    values = pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes()
+    return tuple(frame.columns), hashlib.blake2b(values, digest_size=20).hexdigest()
+
+
+def _load_providers(creator: BusBranchNetworkCreator) -> Dict[str, BatchLoadProvider]:
+    return {name: value for name, value in vars(creator).items() if isinstance(value, BatchLoadProvider)}
+
+
+def _equipment_record(ce: ConductingEquipment) -> Tuple[Any, ...]:
+    record = [
+        type(ce).__name__,
+        ce.mrid,
+        ce.name,
+        ce.base_voltage and ce.base_voltage.nominal_voltage,
+        ce.location and [(p.x_position, p.y_position) for p in ce.location.points],
+        [
+            (t.mrid, t.connectivity_node_id, t.sequence_number, t.phases.name, t.normal_feeder_direction.name,
+             t.current_feeder_direction.name)
+            for t in ce.terminals
+        ]
+    ]
+    if isinstance(ce, AcLineSegment):
+        plsi = ce.per_length_sequence_impedance
+        record += [ce.length, plsi and (plsi.r, plsi.x, plsi.r0, plsi.x0, plsi.bch, plsi.b0ch),
+                   ce.wire_info and ce.wire_info.rated_current]
+    elif isinstance(ce, Switch):
+        record += [ce.is_open(), ce.is_normally_open()]
+    elif isinstance(ce, PowerTransformer):
+        for end in sorted(ce.ends, key=lambda it: it.end_number):
+            rtc = end.ratio_tap_changer
+            record += [end.mrid, end.end_number, end.rated_u, end.rated_s, end.r, end.x,
+                       end.terminal and end.terminal.mrid,
+                       rtc and (rtc.low_step, rtc.high_step, rtc.neutral_step, rtc.normal_step, rtc.step,
+                                rtc.step_voltage_increment)]
+    elif isinstance(ce, (EnergyConsumer, PowerElectronicsConnection)):
+        record += [ce.p, ce.q]
+    elif isinstance(ce, EnergySource):
+        record += [ce.voltage_magnitude]
+    elif isinstance(ce, EquivalentBranch):
+        record += [ce.r, ce.x]
+    return tuple(record)
+
+
+class TranslationCache:
+    """
+    An on-disk cache of translated networks, keyed by the `fingerprint` of the network and creator.
+
+    Each entry is a pickled `pandapowerNet` with its mappings stored as mRIDs, which are resolved against the network
+    being translated on a hit. Entries are evicted least recently used first once the cache is larger than `max_bytes`.
+
+    :param directory: The directory to store the entries in. It is created if it does not exist.
+    :param max_bytes: The maximum total size of the entries.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 2 ** 30):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def create(
+            self,
+            creator: BusBranchNetworkCreator,
+            node_breaker_network: NetworkService,
+            *,
+            extra_key: str = ""
+    ) -> BusBranchNetworkCreationResult:
+        """
+        Returns the cached translation of `node_breaker_network` by `creator` if there is one, otherwise translates it
+        with `creator.create` and caches the result if it was successful.
+
+        A creator with any load providers is never cached without an `extra_key`, as two translations with different
+        loads from the same providers would otherwise share an entry.
+
+        :param creator: A pandapower creator whose mappings map to `PpElement`s.
+        :param node_breaker_network: The network to translate.
+        :param extra_key: Anything else the translation depends on, e.g. the version of the load provider's data.
+        """
+        if not extra_key and any(describe_load_provider(p) is not None for p in _load_providers(creator).values()):
+            logger.warning(f"Not caching the translation by {type(creator).__name__}, as it has load providers and "
+                           "no extra_key to identify their data.")
+            return await creator.create(node_breaker_network)
+
+        key = fingerprint(node_breaker_network, creator, extra_key)
+        result = self.get(key, creator, node_breaker_network)
+        if result is not None:
+            return result
+
+        result = await creator.create(node_breaker_network)
+        if result.was_successful:
+            self.put(key, result)
+        return result
+
+    def get(
+            self,
+            key: str,
+            creator: BusBranchNetworkCreator,
+            node_breaker_network: NetworkService
+    ) -> Optional[BusBranchNetworkCreationResult]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Discarding unreadable translation cache entry {path}: {e}")
+            _unlink(path)
+            return None
+
+        # Touch the entry so eviction sees it as recently used.
+        os.utime(path)
+
+        result = BusBranchNetworkCreationResult(creator.validator_creator())
+        result.network = entry["network"]
+        result.mappings = mappings_from_mrids(entry["mappings"], node_breaker_network)
+        result.was_successful = True
+        for name, value in entry["extras"].items():
+            setattr(result, name, value)
+        return result
+
+    def put(self, key: str, result: BusBranchNetworkCreationResult):
+        entry = {
+            "network": result.network,
+            "mappings": mappings_to_mrids(result.mappings),
+            # Anything the creator added to the result alongside the net, e.g. its load rows.
+            "extras": {name: value for name, value in vars(result).items()
+                       if name not in ("validator", "mappings", "network", "was_successful")}
+        }
+
+        # Write to a temporary file first so concurrent readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            _unlink(Path(tmp_path))
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is no larger than `max_bytes`.
+        """
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda it: it[0]):
+            if total <= self.max_bytes:
+                break
+            _unlink(path)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.pkl"):
+            _unlink(path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+
+def _unlink(path: Path):
+    # Path.unlink(missing_ok=True) needs Python 3.8.
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -4,14 +4,18 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-__all__ = ["get_upstream_end_to_tns"]
+__all__ = ["get_upstream_end_to_tns", "TransformerEnds", "TransformerEndIndex", "group_terminals", "grouping_mrids",
+           "get_base_voltage", "has_negligible_impedance"]
 
-from typing import List, Tuple, TypeVar
+from typing import List, Tuple, TypeVar, NamedTuple, FrozenSet, Dict, Iterable, Any, Optional, Callable, Set
 
-from zepben.evolve import PowerTransformerEnd, FeederDirection
+from zepben.evolve import PowerTransformerEnd, FeederDirection, PowerTransformer, Terminal, TerminalGrouping, \
+    ConductingEquipment, Switch, AcLineSegment, Junction, EquivalentBranch
 
 T = TypeVar("T")
 
+_TRANSFORMER_END_INDEX_KEY = "_transformer_end_index"
+
 
 def get_upstream_end_to_tns(
         ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, T]]
@@ -20,3 +24,180 @@ def get_upstream_end_to_tns(
             if tn is not None
             and end is not None
             and end.terminal.normal_feeder_direction == FeederDirection.UPSTREAM]
+
+
+def has_negligible_impedance(
+        ce: ConductingEquipment,
+        *,
+        min_line_r_ohm: float,
+        min_line_x_ohm: float,
+        switch_elements: bool = False
+) -> bool:
+    """
+    Whether a piece of equipment is collapsed into the buses either side of it. Every creator decides this the same
+    way, so the same network is given the same buses by each of them.
+
+    :param ce: The equipment.
+    :param min_line_r_ohm: The resistance below which lines are collapsed.
+    :param min_line_x_ohm: The reactance below which lines are collapsed.
+    :param switch_elements: Whether switches are kept as elements of their own rather than collapsed when closed.
+    """
+    if isinstance(ce, AcLineSegment):
+        if ce.length == 0 or ce.per_length_sequence_impedance.r == 0:
+            return True
+
+        if ce.length * ce.per_length_sequence_impedance.r < min_line_r_ohm \
+                or ce.length * ce.per_length_sequence_impedance.x < min_line_x_ohm:
+            return True
+
+        return False
+    if isinstance(ce, Switch):
+        return not switch_elements and not ce.is_open()
+    if isinstance(ce, Junction):
+        return True
+    if isinstance(ce, EquivalentBranch):
+        return True
+    return False
+
+
+class TransformerEnds(NamedTuple):
+    """
+    The ends of a `PowerTransformer`, split by the normal feeder direction of their terminals.
+    """
+    upstream: FrozenSet[str]
+    """The mRIDs of the ends whose terminal is upstream."""
+    downstream: FrozenSet[str]
+    """The mRIDs of the other ends."""
+    terminals_match: bool
+    """Whether the terminals of the ends are exactly the terminals of the transformer."""
+
+    @staticmethod
+    def of(power_transformer: PowerTransformer) -> 'TransformerEnds':
+        upstream, downstream = set(), set()
+        for end in power_transformer.ends:
+            is_upstream = end.terminal is not None and end.terminal.normal_feeder_direction == FeederDirection.UPSTREAM
+            (upstream if is_upstream else downstream).add(end.mrid)
+        end_terminals = {end.terminal.mrid for end in power_transformer.ends if end.terminal is not None}
+        terminals = {t.mrid for t in power_transformer.terminals if t is not None}
+        return TransformerEnds(frozenset(upstream), frozenset(downstream), end_terminals == terminals)
+
+
+class TransformerEndIndex:
+    """
+    The `TransformerEnds` of every `PowerTransformer` of a network, keyed by mRID and found once per translation, so
+    the creators and validators that each need the upstream end of a transformer share the work.
+
+    :param power_transformers: The transformers to index. Any other transformer is indexed when it is first looked up.
+    """
+
+    def __init__(self, power_transformers: Iterable[PowerTransformer] = ()):
+        self._ends: Dict[str, TransformerEnds] = {pt.mrid: TransformerEnds.of(pt) for pt in power_transformers}
+
+    @staticmethod
+    def attach(net: Dict[str, Any], power_transformers: Iterable[PowerTransformer]) -> 'TransformerEndIndex':
+        index = TransformerEndIndex(power_transformers)
+        net[_TRANSFORMER_END_INDEX_KEY] = index
+        return index
+
+    @staticmethod
+    def detach(net: Dict[str, Any]) -> Optional['TransformerEndIndex']:
+        return net.pop(_TRANSFORMER_END_INDEX_KEY, None)
+
+    @staticmethod
+    def of_network(net: Any) -> 'TransformerEndIndex':
+        """
+        :return: The index attached to `net`, or the `transformer_ends` of a `TopologyNetwork`, or a new empty one if
+            there is neither.
+        """
+        if isinstance(net, dict):
+            index = net.get(_TRANSFORMER_END_INDEX_KEY)
+        else:
+            index = getattr(net, "transformer_ends", None)
+        return TransformerEndIndex() if index is None else index
+
+    def ends(self, power_transformer: PowerTransformer) -> TransformerEnds:
+        ends = self._ends.get(power_transformer.mrid)
+        if ends is None:
+            ends = self._ends[power_transformer.mrid] = TransformerEnds.of(power_transformer)
+        return ends
+
+    def split_end_to_tns(
+            self,
+            power_transformer: PowerTransformer,
+            ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, T]]
+    ) -> Tuple[List[Tuple[PowerTransformerEnd, T]], List[Tuple[PowerTransformerEnd, T]]]:
+        """
+        Splits the ends of a transformer and the topological nodes they connect to into upstream and downstream.
+
+        :return: The upstream ends connected to a topological node, as with `get_upstream_end_to_tns`, and the ends
+            connected to any other topological node or to none.
+        """
+        upstream_mrids = self.ends(power_transformer).upstream
+        upstream = [(end, tn) for (end, tn) in ends_to_topological_nodes
+                    if tn is not None and end is not None and end.mrid in upstream_mrids]
+        upstream_tns = [tn for (_, tn) in upstream]
+        downstream = [(end, tn) for (end, tn) in ends_to_topological_nodes if tn not in upstream_tns]
+        return upstream, downstream
+
+
+def group_terminals(
+        start: Terminal,
+        has_negligible_impedance: Callable[[ConductingEquipment], bool]
+) -> Tuple[TerminalGrouping[ConductingEquipment], Set[str]]:
+    """
+    Groups the terminals connected to `start` through negligible impedance equipment, in the same way as a full
+    translation, but without the overhead of an async traversal.
+
+    :return: The grouping, and the mRIDs of every terminal in it.
+    """
+    grouping = TerminalGrouping[ConductingEquipment]()
+    visited = {start.mrid}
+    queue = [start]
+    while queue:
+        t = queue.pop()
+        ce = t.conducting_equipment
+        is_negligible = has_negligible_impedance(ce)
+        if is_negligible:
+            grouping.conducting_equipment_group.add(ce)
+            grouping.inner_terminals.add(t)
+        else:
+            grouping.border_terminals.add(t)
+
+        next_terminals = list(t.connectivity_node.terminals) if t.connectivity_node is not None else []
+        if is_negligible:
+            next_terminals.extend(ce.terminals)
+        for other in next_terminals:
+            if other.mrid not in visited:
+                visited.add(other.mrid)
+                queue.append(other)
+    return grouping, visited
+
+
+def grouping_mrids(grouping: TerminalGrouping) -> Iterable[str]:
+    """
+    :return: The mRIDs a full translation maps to the topological node of `grouping`.
+    """
+    for terminals in (grouping.border_terminals, grouping.inner_terminals):
+        for t in terminals:
+            yield t.mrid
+            if t.connectivity_node is not None:
+                yield t.connectivity_node.mrid
+    for ce in grouping.conducting_equipment_group:
+        yield ce.mrid
+
+
+def get_base_voltage(border_terminals: Iterable[Terminal]) -> Optional[int]:
+    """
+    :return: The voltage a full translation gives the topological node with `border_terminals`.
+    """
+    for t in border_terminals:
+        ce = t.conducting_equipment
+        if isinstance(ce, Switch):
+            continue
+        if isinstance(ce, PowerTransformer):
+            end_voltage = next((e.rated_u for e in ce.ends if e.terminal is t), None)
+            if end_voltage is not None:
+                return end_voltage
+        elif ce.base_voltage is not None:
+            return ce.base_voltage.nominal_voltage
+    return None
@@ -0,0 +1,227 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import FrozenSet, Tuple, List, Optional, Dict, Callable, Union, Collection
+
+import pandapower as pp
+from zepben.evolve import Terminal, NetworkService, AcLineSegment, PowerTransformer, EnergyConsumer, \
+    PowerTransformerEnd, ConductingEquipment, PowerElectronicsConnection, EnergySource, EquivalentBranch, \
+    BusBranchNetworkCreationResult
+
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.elements import PpElement
+from pp_creators.error_checking_creator import NetworkErrors, NetworkErrorEvent, FatalNetworkError
+from pp_creators.utils import TransformerEndIndex
+from pp_creators.validators.validator import PandaPowerNetworkValidator
+
+__all__ = ["ValidatingPandaPowerNetworkCreator"]
+
+_NETWORK_ERRORS_KEY = "_network_errors"
+
+
+class ValidatingPandaPowerNetworkCreator(BasicPandaPowerNetworkCreator):
+    """
+    A `BasicPandaPowerNetworkCreator` that checks the network for the same problems as an `ErrorAggregator` while it
+    translates it, so both come from a single pass over the network's topology. The problems found are set as `errors`
+    on the creation result.
+
+    Rather than stopping at the first problem, the whole network is checked. Once a fatal problem is found no more
+    pandapower elements are created, and the result is unsuccessful with no network.
+
+    :param max_per_category: The maximum number of mRIDs to keep for each category of problem.
+    :param fail_fast: The categories of problem to stop on, or True for every fatal category.
+    :param on_error: Called with each object found to have a problem, as it is found.
+    :param kwargs: The parameters of the `BasicPandaPowerNetworkCreator`.
+    """
+
+    def __init__(
+            self, *,
+            max_per_category: Optional[int] = None,
+            fail_fast: Union[bool, Collection[str]] = False,
+            on_error: Optional[Callable[[NetworkErrorEvent], None]] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.max_per_category = max_per_category
+        self.fail_fast = fail_fast
+        self.on_error = on_error
+
+    async def create(self, node_breaker_network: NetworkService) -> BusBranchNetworkCreationResult:
+        try:
+            result = await super().create(node_breaker_network)
+        except FatalNetworkError as e:
+            result = BusBranchNetworkCreationResult(self.validator_creator())
+            result.errors = e.errors
+            return result
+
+        result.errors = result.network.pop(_NETWORK_ERRORS_KEY)
+        if result.errors.has_fatal_errors:
+            result.network = None
+            result.was_successful = False
+        return result
+
+    def _has_missing_elements(self, net: pp.pandapowerNet) -> bool:
+        # No elements are created past a fatal error, so their buses are unset.
+        return net[_NETWORK_ERRORS_KEY].has_fatal_errors
+
+    def bus_branch_network_creator(self, node_breaker_network: NetworkService) -> pp.pandapowerNet:
+        net = super().bus_branch_network_creator(node_breaker_network)
+        net[_NETWORK_ERRORS_KEY] = NetworkErrors(
+            max_per_category=self.max_per_category,
+            fail_fast=self.fail_fast,
+            on_error=self.on_error,
+            transformer_ends=TransformerEndIndex.of_network(net)
+        )
+        return net
+
+    def topological_node_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            base_voltage: Optional[int],
+            collapsed_conducting_equipment: FrozenSet[ConductingEquipment],
+            border_terminals: FrozenSet[Terminal],
+            inner_terminals: FrozenSet[Terminal],
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        errors = bus_branch_network[_NETWORK_ERRORS_KEY]
+        errors.check_topological_node(base_voltage, collapsed_conducting_equipment, border_terminals, inner_terminals)
+        if errors.has_fatal_errors:
+            return _unchecked_element(errors, "bus")
+        return super().topological_node_creator(
+            bus_branch_network,
+            base_voltage,
+            collapsed_conducting_equipment,
+            border_terminals,
+            inner_terminals,
+            node_breaker_network
+        )
+
+    def topological_branch_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            connected_topological_nodes: Tuple[PpElement, PpElement],
+            length: Optional[float],
+            collapsed_ac_line_segments: FrozenSet[AcLineSegment],
+            border_terminals: FrozenSet[Terminal],
+            inner_terminals: FrozenSet[Terminal],
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        errors = bus_branch_network[_NETWORK_ERRORS_KEY]
+        errors.check_topological_branch(collapsed_ac_line_segments)
+        if errors.has_fatal_errors:
+            return _unchecked_element(errors, "line")
+        return super().topological_branch_creator(
+            bus_branch_network,
+            connected_topological_nodes,
+            length,
+            collapsed_ac_line_segments,
+            border_terminals,
+            inner_terminals,
+            node_breaker_network
+        )
+
+    def equivalent_branch_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            connected_topological_nodes: List[PpElement],
+            equivalent_branch: EquivalentBranch,
+            node_breaker_network: NetworkService
+    ) -> Tuple[str, PpElement]:
+        errors = bus_branch_network[_NETWORK_ERRORS_KEY]
+        if errors.has_fatal_errors:
+            return _unchecked_element(errors, "line")
+        return super().equivalent_branch_creator(
+            bus_branch_network,
+            connected_topological_nodes,
+            equivalent_branch,
+            node_breaker_network
+        )
+
+    def power_transformer_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            power_transformer: PowerTransformer,
+            ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, Optional[PpElement]]],
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        errors = bus_branch_network[_NETWORK_ERRORS_KEY]
+        errors.check_power_transformer(power_transformer, ends_to_topological_nodes)
+        if errors.has_fatal_errors:
+            return {}
+        return super().power_transformer_creator(
+            bus_branch_network,
+            power_transformer,
+            ends_to_topological_nodes,
+            node_breaker_network
+        )
+
+    def energy_source_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            energy_source: EnergySource,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        if bus_branch_network[_NETWORK_ERRORS_KEY].has_fatal_errors:
+            return {}
+        return super().energy_source_creator(
+            bus_branch_network,
+            energy_source,
+            connected_topological_node,
+            node_breaker_network
+        )
+
+    def energy_consumer_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            energy_consumer: EnergyConsumer,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService
+    ) -> Dict[str, PpElement]:
+        if bus_branch_network[_NETWORK_ERRORS_KEY].has_fatal_errors:
+            return {}
+        return super().energy_consumer_creator(
+            bus_branch_network,
+            energy_consumer,
+            connected_topological_node,
+            node_breaker_network
+        )
+
+    def power_electronics_connection_creator(
+            self,
+            bus_branch_network: pp.pandapowerNet,
+            power_electronics_connection: PowerElectronicsConnection,
+            connected_topological_node: PpElement,
+            node_breaker_network: NetworkService,
+    ) -> Dict[str, PpElement]:
+        if bus_branch_network[_NETWORK_ERRORS_KEY].has_fatal_errors:
+            return {}
+        return super().power_electronics_connection_creator(
+            bus_branch_network,
+            power_electronics_connection,
+            connected_topological_node,
+            node_breaker_network
+        )
+
+    def validator_creator(self) -> PandaPowerNetworkValidator:
+        return _CheckedNetworkValidator(logger=self.logger)
+
+
+class _CheckedNetworkValidator(PandaPowerNetworkValidator):
+    # The creator checks the data the base validator rejects itself, so the translation is never stopped part way.
+
+    def is_valid_topological_node_data(self, *args, **kwargs) -> bool:
+        return True
+
+    def is_valid_topological_branch_data(self, *args, **kwargs) -> bool:
+        return True
+
+    def is_valid_power_transformer_data(self, *args, **kwargs) -> bool:
+        return True
+
+
+def _unchecked_element(errors: NetworkErrors, element_type: str) -> Tuple[str, PpElement]:
+    # Stands in for an element that is not created because the network has already been found to have a fatal problem.
+    return f"unchecked:{errors.get_inc()}", PpElement(-1, element_type)
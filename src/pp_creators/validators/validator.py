@@ -12,7 +12,7 @@ from zepben.evolve import BusBranchNetworkCreationValidator, NetworkService, Ene
     PowerTransformer, PowerTransformerEnd, AcLineSegment, Terminal, \
     ConductingEquipment, PowerElectronicsConnection, EquivalentBranch
 
-from pp_creators.utils import get_upstream_end_to_tns
+from pp_creators.utils import TransformerEndIndex
 
 __all__ = ["PandaPowerNetworkValidator"]
 
@@ -56,7 +56,11 @@ class PandaPowerNetworkValidator(BusBranchNetworkCreationValidator[pp.pandapower
     def is_valid_power_transformer_data(self, bus_branch_network: pp.pandapowerNet, power_transformer: PowerTransformer,
                                         ends_to_topological_nodes: List[Tuple[PowerTransformerEnd, Optional[int]]],
                                         node_breaker_network: NetworkService) -> bool:
-        has_single_upstream_connection = len(get_upstream_end_to_tns(ends_to_topological_nodes)) == 1
+        upstream, _ = TransformerEndIndex.of_network(bus_branch_network).split_end_to_tns(
+            power_transformer,
+            ends_to_topological_nodes
+        )
+        has_single_upstream_connection = len(upstream) == 1
         if not has_single_upstream_connection:
             self.logger.error(
                 f"PowerTransformer '{power_transformer.name}' doesn't have a single upstream connection to a network")
@@ -0,0 +1,67 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Mapping, Iterable
+
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+from zepben.evolve import BusBranchNetworkCreationResult
+
+from pp_creators.elements import PpElement
+from pp_creators.mappings import ElementMappingStore
+
+__all__ = ["bus_voltages_by_mrid", "seed_bus_voltages"]
+
+_VOLTAGE_COLUMNS = ["vm_pu", "va_degree"]
+
+
+def bus_voltages_by_mrid(result: BusBranchNetworkCreationResult) -> pd.DataFrame:
+    """
+    Reads the load flow voltages of a translated net back onto the node-breaker network, so they can seed the load flow
+    of a later translation with `initial_voltages`, even if its buses are numbered differently.
+
+    :param result: A creation result whose net has been solved.
+    :return: The `vm_pu` and `va_degree` of the bus of every mRID that maps to one, e.g. each terminal, indexed by mRID.
+    """
+    objects = _element_store(result.mappings.to_bbn.objects)
+    mrids = np.array(list(objects), dtype=object)
+    buses = objects.indices(mrids, "bus")
+    found = buses >= 0
+    res_bus = result.network.res_bus
+    return pd.DataFrame(
+        res_bus[_VOLTAGE_COLUMNS].reindex(buses[found]).to_numpy(),
+        index=pd.Index(mrids[found], name="mrid"),
+        columns=_VOLTAGE_COLUMNS
+    ).dropna()
+
+
+def seed_bus_voltages(net: pp.pandapowerNet, objects: Mapping[str, Iterable[PpElement]], voltages: pd.DataFrame):
+    """
+    Writes the voltages of each mRID to the `res_bus` row of the bus it maps to, so `pp.runpp(net, init="results")`
+    starts from them rather than a flat start. The voltages of several mRIDs on the same bus are averaged, and buses
+    with no voltage start at 1.0 pu and 0 degrees.
+
+    :param net: The translated net.
+    :param objects: The `to_bbn.objects` mappings of the translation.
+    :param voltages: The `vm_pu` and `va_degree` of each mRID, e.g. from `bus_voltages_by_mrid`.
+    """
+    buses = _element_store(objects).indices(voltages.index, "bus")
+    found = buses >= 0
+    seeded = voltages.loc[found, _VOLTAGE_COLUMNS].groupby(buses[found]).mean()
+
+    res_bus = pd.DataFrame(
+        {"vm_pu": 1.0, "va_degree": 0.0, "p_mw": np.nan, "q_mvar": np.nan},
+        index=net.bus.index,
+        columns=net.res_bus.columns
+    )
+    seeded = seeded[seeded.index.isin(res_bus.index)]
+    res_bus.loc[seeded.index, _VOLTAGE_COLUMNS] = seeded.to_numpy()
+    net["res_bus"] = res_bus.astype(np.float64)
+
+
+def _element_store(objects: Mapping[str, Iterable[PpElement]]) -> ElementMappingStore:
+    return objects if isinstance(objects, ElementMappingStore) else ElementMappingStore(objects)
@@ -4,13 +4,18 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from typing import List
+import logging
+from typing import List, Callable
 
+import pytest
 import pytest_asyncio
 from zepben.evolve import PhaseCode, NetworkService, BaseVoltage, EnergySource, Terminal, ConductingEquipment, \
     AcLineSegment, PerLengthSequenceImpedance, \
     PowerTransformer, PowerTransformerEnd, EnergyConsumer, OverheadWireInfo, PowerTransformerInfo, EnergySourcePhase, \
-    set_phases, set_direction, Feeder
+    set_phases, set_direction, Feeder, Breaker
+
+from benchmarks.synthetic_network import SyntheticFeederSpec, create_synthetic_network
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
 
 
 @pytest_asyncio.fixture()
@@ -107,6 +112,105 @@ async def simple_node_breaker_network() -> NetworkService:
     return network
 
 
+@pytest_asyncio.fixture()
+async def two_feeder_node_breaker_network() -> NetworkService:
+    network = NetworkService()
+
+    bv_hv: BaseVoltage = BaseVoltage(mrid="20kV", nominal_voltage=20000, name="20kV")
+    bv_lv: BaseVoltage = BaseVoltage(mrid="415V", nominal_voltage=400, name="415V")
+    network.add(bv_hv)
+    network.add(bv_lv)
+
+    plsi = PerLengthSequenceImpedance(mrid="psli", r=0.642 / 1000, x=0.083 / 1000)
+    network.add(plsi)
+
+    wire_info = OverheadWireInfo(mrid="wire_info", rated_current=0.142 * 1000)
+    network.add(wire_info)
+
+    energy_source_phases = []
+    for sp in PhaseCode.ABC.single_phases:
+        esp = EnergySourcePhase()
+        esp.phase = sp
+        energy_source_phases.append(esp)
+        network.add(esp)
+    es = EnergySource(mrid="grid_connection", name="Grid Connection", energy_source_phases=energy_source_phases)
+    es.base_voltage = bv_hv
+    network.add(es)
+    es_t = _create_terminal(es)
+    network.add(es_t)
+
+    for f in range(2):
+        # Feeder head breaker
+        cb = Breaker(mrid=f"cb{f}", name=f"Breaker {f}")
+        cb.base_voltage = bv_hv
+        cb_terminals = _create_terminals(cb)
+        for t in cb_terminals:
+            network.add(t)
+        network.add(cb)
+        network.connect_terminals(es_t, cb_terminals[0])
+
+        fdr = Feeder(mrid=f"feeder{f}", name=f"Feeder {f}", normal_head_terminal=cb_terminals[1])
+        network.add(fdr)
+
+        hv_line = AcLineSegment(mrid=f"hv_line{f}", name=f"HV Line {f}", length=1000.0, per_length_impedance=plsi)
+        hv_line.asset_info = wire_info
+        hv_line.base_voltage = bv_hv
+        hv_line_terminals = _create_terminals(hv_line)
+        for t in hv_line_terminals:
+            network.add(t)
+        network.add(hv_line)
+        network.connect_terminals(cb_terminals[1], hv_line_terminals[0])
+
+        tx = PowerTransformer(mrid=f"transformer{f}", name=f"Transformer {f}")
+        tx_terminals = _create_terminals(tx, [PhaseCode.ABC, PhaseCode.ABN])
+        for t in tx_terminals:
+            network.add(t)
+        network.add(tx)
+        for end in _create_transformer_ends(tx, [20000, 400]):
+            network.add(end)
+        network.connect_terminals(hv_line_terminals[1], tx_terminals[0])
+
+        line = AcLineSegment(mrid=f"line{f}", name=f"Line {f}", length=100.0, per_length_impedance=plsi)
+        line.asset_info = wire_info
+        line.base_voltage = bv_lv
+        line_terminals = _create_terminals(line)
+        for t in line_terminals:
+            network.add(t)
+        network.add(line)
+        network.connect_terminals(tx_terminals[1], line_terminals[0])
+
+        ec = EnergyConsumer(mrid=f"load{f}", name=f"Load {f}", p=100000. * (f + 1), q=50000.)
+        ec.base_voltage = bv_lv
+        network.add(ec)
+        ec_t = _create_terminal(ec)
+        network.add(ec_t)
+        network.connect_terminals(line_terminals[1], ec_t)
+
+    await set_direction().run(network)
+    await set_phases().run(network)
+    return network
+
+
+@pytest_asyncio.fixture()
+async def synthetic_network() -> NetworkService:
+    return await create_synthetic_network(SyntheticFeederSpec(transformers=2, consumers_per_transformer=5))
+
+
+@pytest_asyncio.fixture()
+async def switched_synthetic_network() -> NetworkService:
+    return await create_synthetic_network(SyntheticFeederSpec(transformers=10, meshed=True, switched_ties=True))
+
+
+@pytest.fixture()
+def pp_creator() -> Callable[..., BasicPandaPowerNetworkCreator]:
+    # Creates a BasicPandaPowerNetworkCreator that loads each EnergyConsumer with its own P and Q.
+    def create(**kwargs) -> BasicPandaPowerNetworkCreator:
+        kwargs.setdefault("ec_load_provider", lambda ce: (ce.p, ce.q))
+        return BasicPandaPowerNetworkCreator(logger=logging.getLogger(), **kwargs)
+
+    return create
+
+
 def _create_terminal(ce: ConductingEquipment, phases: PhaseCode = PhaseCode.ABC) -> Terminal:
     return _create_terminals(ce, [phases])[0]
 
@@ -0,0 +1,57 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import numpy as np
+import pandapower as pp
+import pytest
+
+from pp_creators.admittance import build_bus_admittance
+
+
+def _pandapower_ybus(net, admittance):
+    # The Ybus pandapower builds for its load flow, in the row order of `admittance`. pandapower leaves the open end
+    # of a line on an auxiliary bus of its own, which is eliminated to compare.
+    pp.runpp(net)
+    ybus = net._ppc["internal"]["Ybus"].toarray()
+    order = np.empty(admittance.matrix.shape[0], dtype=np.int64)
+    order[admittance.rows.to_numpy()] = net._pd2ppc_lookups["bus"][admittance.rows.index.to_numpy()]
+    auxiliary = np.setdiff1d(np.arange(len(ybus)), order)
+    reduced = ybus[np.ix_(order, order)]
+    if len(auxiliary):
+        reduced -= ybus[np.ix_(order, auxiliary)] @ np.linalg.solve(ybus[np.ix_(auxiliary, auxiliary)],
+                                                                    ybus[np.ix_(auxiliary, order)])
+    return reduced
+
+
+@pytest.mark.asyncio
+async def test_admittance_matches_pandapower(synthetic_network, pp_creator):
+    result = await pp_creator(admittance=True).create(synthetic_network)
+    net = result.network
+    admittance = result.admittance
+    assert admittance.matrix.shape == (len(net.bus), len(net.bus))
+    assert admittance.base_kv.tolist() == net.bus.vn_kv.reindex(admittance.rows.index).tolist()
+
+    expected = _pandapower_ybus(net, admittance)
+    assert np.allclose(admittance.matrix.toarray(), expected, rtol=1e-9, atol=1e-9)
+
+    # Line charging, magnetising current and off nominal taps are all modelled as by pandapower.
+    net.line["c_nf_per_km"] = 200.0
+    net.trafo["i0_percent"] = 0.3
+    net.trafo["pfe_kw"] = 1.0
+    net.trafo.loc[net.trafo.index[0], "tap_pos"] = net.trafo.tap_neutral.iloc[0] + 2
+    admittance = build_bus_admittance(net)
+    expected = _pandapower_ybus(net, admittance)
+    assert np.allclose(admittance.matrix.toarray(), expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.asyncio
+async def test_closed_switches_are_fused(switched_synthetic_network, pp_creator):
+    result = await pp_creator(admittance=True, switch_elements=True).create(switched_synthetic_network)
+
+    admittance = result.admittance
+    closed = result.network.switch[(result.network.switch.et == "b") & result.network.switch.closed]
+    assert (admittance.rows[closed.bus].to_numpy() == admittance.rows[closed.element].to_numpy()).all()
+    expected = _pandapower_ybus(result.network, admittance)
+    assert np.allclose(admittance.matrix.toarray(), expected, rtol=1e-9, atol=1e-9)
@@ -0,0 +1,65 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+import pytest_asyncio
+
+from pp_creators.mappings import mappings_to_mrids
+
+pytest.importorskip("pyarrow")
+
+from pp_creators.arrow_io import export_result, load_net, load_table, load_mrid_mappings, load_mappings  # noqa: E402
+
+
+@pytest_asyncio.fixture()
+async def network_and_result(synthetic_network, pp_creator):
+    result = await pp_creator().create(synthetic_network)
+    pp.runpp(result.network)
+    return synthetic_network, result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+async def test_export_round_trips(network_and_result, tmp_path, file_format):
+    network, result = network_and_result
+    unrelated = tmp_path / "measurements.parquet"
+    unrelated.write_bytes(b"not an export")
+    export_result(result, tmp_path, file_format=file_format)
+    assert unrelated.read_bytes() == b"not an export"
+
+    net = load_net(tmp_path)
+    assert pp.nets_equal(result.network, net, exclude_elms=["converged"])
+    assert net.line_geodata.coords.equals(result.network.line_geodata.coords)
+
+    assert load_mrid_mappings(tmp_path) == mappings_to_mrids(result.mappings)
+    mappings = load_mappings(tmp_path, network)
+    assert mappings.to_nbn.energy_consumers == result.mappings.to_nbn.energy_consumers
+
+
+@pytest.mark.asyncio
+async def test_buffered_geometry_is_exported(synthetic_network, pp_creator, tmp_path):
+    result = await pp_creator(geometry="buffer").create(synthetic_network)
+    export_result(result, tmp_path)
+    assert not len(result.network.line_geodata)
+
+    expected = (await pp_creator().create(synthetic_network)).network
+    net = load_net(tmp_path)
+    assert len(net.line_geodata) == len(expected.line) > 0
+    assert net.line_geodata.coords.equals(expected.line_geodata.coords)
+    assert net.bus_geodata.equals(expected.bus_geodata)
+
+
+@pytest.mark.asyncio
+async def test_single_columns_can_be_read(network_and_result, tmp_path):
+    _, result = network_and_result
+    export_result(result, tmp_path)
+
+    lines = load_table(tmp_path, "line", columns=["from_bus", "to_bus"])
+    assert lines.column_names == ["from_bus", "to_bus"]
+    assert lines.column("to_bus").to_pylist() == result.network.line.to_bus.tolist()
+    assert load_table(tmp_path, "res_bus", columns=["vm_pu"]).num_rows == len(result.network.bus)
+    with pytest.raises(FileNotFoundError):
+        load_table(tmp_path, "trafo3w")
@@ -0,0 +1,58 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+
+import pandapower as pp
+import pytest
+
+from pp_creators.cooperative import CreationProgress, create_in_executor
+
+
+@pytest.mark.asyncio
+async def test_creation_reports_progress_without_blocking_the_loop(synthetic_network, pp_creator):
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    phases = []
+    ticker = asyncio.create_task(tick())
+    progress = CreationProgress()
+    result = await create_in_executor(
+        pp_creator(),
+        synthetic_network,
+        progress=progress,
+        on_progress=lambda p: phases.append(p.phase),
+        report_every=10
+    )
+    ticker.cancel()
+
+    assert result.was_successful
+    assert pp.nets_equal(result.network, (await pp_creator().create(synthetic_network)).network)
+    assert progress.phase == "done" and progress.elements > 0
+    assert phases[0] == "preparing" and phases[-1] == "done"
+    assert {"topological_branches", "power_transformers", "energy_consumers"} <= set(phases)
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_stops_the_creation(synthetic_network, pp_creator):
+    creator = pp_creator()
+    progress = CreationProgress()
+    started = asyncio.Event()
+    task = asyncio.create_task(
+        create_in_executor(creator, synthetic_network, progress=progress, on_progress=lambda _: started.set())
+    )
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert progress.phase != "done"
+    assert (await creator.create(synthetic_network)).was_successful
@@ -9,7 +9,10 @@ import numpy
 import pytest as pytest
 import pandapower as pp
 
+from zepben.evolve import PowerTransformer
+
 from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.utils import TransformerEndIndex, get_upstream_end_to_tns
 from test.pp_test_utils import validate_pp_load_flow_results
 
 
@@ -147,3 +150,39 @@ async def test_create_pp_bus_branch_model(simple_node_breaker_network):
         "ext_grid",
         log=True
     )
+
+
+@pytest.mark.asyncio
+async def test_buffered_tables_match_unbuffered(simple_node_breaker_network):
+    def creator(buffer_tables: bool):
+        return BasicPandaPowerNetworkCreator(vm_pu=1.02, ec_load_provider=lambda _: (100_000, 50_000),
+                                             logger=logging.getLogger(), buffer_tables=buffer_tables)
+
+    unbuffered = await creator(False).create(simple_node_breaker_network)
+    buffered = await creator(True).create(simple_node_breaker_network)
+
+    assert buffered.was_successful
+    assert "_pp_table_buffer" not in buffered.network
+    assert pp.nets_equal(unbuffered.network, buffered.network)
+    assert _mapped_elements(unbuffered) == _mapped_elements(buffered)
+
+
+@pytest.mark.asyncio
+async def test_transformer_end_index_matches_feeder_directions(two_feeder_node_breaker_network):
+    pts = list(two_feeder_node_breaker_network.objects(PowerTransformer))
+    index = TransformerEndIndex(pts)
+
+    for pt in pts:
+        ends_to_tns = [(end, i) for i, end in enumerate(pt.ends)]
+        upstream, downstream = index.split_end_to_tns(pt, ends_to_tns)
+        assert upstream == get_upstream_end_to_tns(ends_to_tns) and len(upstream) == 1
+        assert downstream == [(end, tn) for (end, tn) in ends_to_tns if tn != upstream[0][1]]
+        assert index.ends(pt).terminals_match
+
+    result = await BasicPandaPowerNetworkCreator(logger=logging.getLogger()).create(two_feeder_node_breaker_network)
+    assert result.was_successful
+    assert "_transformer_end_index" not in result.network
+
+
+def _mapped_elements(result):
+    return {mrid: {(e.type, e.index) for e in elements} for mrid, elements in result.mappings.to_bbn.objects.items()}
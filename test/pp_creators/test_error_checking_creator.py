@@ -0,0 +1,64 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from contextlib import closing
+
+import pytest
+import pytest_asyncio
+from zepben.evolve import PowerTransformer
+
+from pp_creators.error_checking_creator import ErrorAggregator
+
+
+@pytest_asyncio.fixture()
+async def broken_network(synthetic_network):
+    for pt in synthetic_network.objects(PowerTransformer):
+        pt.get_end_by_num(2).rated_u = None
+    return synthetic_network
+
+
+@pytest.mark.asyncio
+async def test_errors_are_collected_as_mrids(broken_network):
+    events = []
+    result = await ErrorAggregator(on_error=events.append).create(broken_network)
+
+    error = result.network.errors["pt_end_missing_voltage"]
+    assert result.was_successful
+    assert error.mrids == {pt.mrid for pt in broken_network.objects(PowerTransformer)}
+    assert not error.truncated
+    event_mrids = [event.mrid for event in events]
+    assert len(event_mrids) == len(set(event_mrids))
+    assert set(event_mrids) == error.mrids
+    assert result.network.get_errors()[0] is error
+
+
+@pytest.mark.asyncio
+async def test_errors_can_be_capped_per_category(broken_network):
+    result = await ErrorAggregator(max_per_category=1).create(broken_network)
+
+    error = result.network.errors["pt_end_missing_voltage"]
+    assert len(error.mrids) == 1
+    assert error.truncated
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_stops_on_the_first_fatal_error(broken_network):
+    events = []
+    result = await ErrorAggregator(fail_fast=True, on_error=events.append).create(broken_network)
+
+    assert not result.was_successful
+    assert result.network.stopped_on == "pt_end_missing_voltage"
+    assert len(events) == 1
+    assert result.network.errors["pt_end_missing_voltage"].mrids == {events[0].mrid}
+
+
+def test_errors_can_be_streamed(broken_network):
+    with closing(ErrorAggregator().stream_errors(broken_network, buffer_size=1)) as stream:
+        events = list(stream)
+    assert len(events) == len(list(broken_network.objects(PowerTransformer)))
+    assert {event.category for event in events} == {"pt_end_missing_voltage"}
+
+    with closing(ErrorAggregator().stream_errors(broken_network, buffer_size=1)) as stream:
+        assert next(stream).mrid == events[0].mrid
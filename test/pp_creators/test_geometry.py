@@ -0,0 +1,33 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import numpy as np
+import pandapower as pp
+import pytest
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("buffer_tables", [False, True])
+async def test_buffered_geometry_matches_geodata(synthetic_network, pp_creator, buffer_tables):
+    geodata = await pp_creator(buffer_tables=buffer_tables).create(synthetic_network)
+    buffered = await pp_creator(buffer_tables=buffer_tables, geometry="buffer").create(synthetic_network)
+
+    assert geodata.geometry is None
+    assert buffered.network.bus_geodata.empty and buffered.network.line_geodata.empty
+    line = geodata.network.line_geodata.index[0]
+    np.testing.assert_array_equal(buffered.geometry.lines[line], geodata.network.line_geodata.coords[line])
+
+    buffered.geometry.materialise(buffered.network)
+    assert pp.nets_equal(geodata.network, buffered.network)
+
+
+@pytest.mark.asyncio
+async def test_geometry_can_be_skipped(synthetic_network, pp_creator):
+    result = await pp_creator(geometry="none").create(synthetic_network)
+
+    assert result.was_successful
+    assert result.network.bus_geodata.empty and result.network.line_geodata.empty
+    with pytest.raises(ValueError):
+        pp_creator(geometry="wkt")
@@ -0,0 +1,58 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Dict
+
+import numpy as np
+import pandapower as pp
+import pytest
+from zepben.evolve import Switch, BusBranchNetworkCreationResult
+
+from pp_creators.incremental import IncrementalTranslation
+
+
+@pytest.mark.asyncio
+async def test_switching_matches_full_translation(switched_synthetic_network, pp_creator):
+    network = switched_synthetic_network
+    translation = await IncrementalTranslation.create(pp_creator(), network)
+    ties = sorted(switch.mrid for switch in network.objects(Switch) if "tie" in switch.mrid)
+    buses = len(translation.network.bus)
+
+    changes = translation.set_switch_states({mrid: False for mrid in ties})
+    assert len(changes.removed_buses) == len(ties) and not changes.created_buses
+    assert len(translation.network.bus) == buses - len(ties)
+    _assert_matches_full_translation(translation, await pp_creator().create(network))
+
+    changes = translation.set_switch_states({ties[0]: True, "f0_cb": True})
+    assert len(changes.created_buses) == 2 and not changes.removed_buses
+    _assert_matches_full_translation(translation, await pp_creator().create(network))
+
+    assert not translation.set_switch_states({"f0_cb": True}).updated_buses
+
+
+def _assert_matches_full_translation(translation: IncrementalTranslation, full: BusBranchNetworkCreationResult):
+    incremental_buses, full_buses = _bus_by_terminal(translation.result), _bus_by_terminal(full)
+    assert incremental_buses.keys() == full_buses.keys()
+
+    # The buses may be numbered differently, but must group the same terminals.
+    bus_pairs = {(incremental_buses[mrid], full_buses[mrid]) for mrid in full_buses}
+    assert len(bus_pairs) == len({pair[0] for pair in bus_pairs}) == len(full.network.bus)
+    assert len(translation.network.bus) == len(full.network.bus)
+
+    pp.runpp(translation.network)
+    pp.runpp(full.network)
+    mrids = list(full_buses)
+    assert np.allclose(translation.network.res_bus.vm_pu[[incremental_buses[mrid] for mrid in mrids]].to_numpy(),
+                       full.network.res_bus.vm_pu[[full_buses[mrid] for mrid in mrids]].to_numpy(), equal_nan=True)
+    assert np.allclose(translation.network.res_line.loading_percent.sort_values().to_numpy(),
+                       full.network.res_line.loading_percent.sort_values().to_numpy(), equal_nan=True)
+
+
+def _bus_by_terminal(result: BusBranchNetworkCreationResult) -> Dict[str, int]:
+    return {
+        t.mrid: int(key.partition(":")[2])
+        for key, grouping in result.mappings.to_nbn.topological_nodes.items()
+        for t in grouping.border_terminals
+    }
@@ -0,0 +1,40 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import copy
+
+import pandapower as pp
+import pytest
+
+from benchmarks.synthetic_network import create_synthetic_network, SyntheticFeederSpec
+from pp_creators.load_flow import feeder_buses, runpp_by_feeder
+
+
+@pytest.mark.asyncio
+async def test_feeders_are_solved_separately(pp_creator):
+    spec = SyntheticFeederSpec(feeders=3, transformers=2, consumers_per_transformer=5)
+    network = await create_synthetic_network(spec)
+    result = await pp_creator().create(network)
+    whole = copy.deepcopy(result.network)
+    pp.runpp(whole)
+
+    assert len(feeder_buses(result, network)) == 3
+    runpp_by_feeder(result, network, max_workers=2)
+
+    net = result.network
+    assert net.converged
+    for table, column in (("bus", "vm_pu"), ("bus", "p_mw"), ("line", "loading_percent"), ("trafo", "p_hv_mw"),
+                          ("load", "p_mw"), ("ext_grid", "p_mw")):
+        assert net[f"res_{table}"][column].tolist() == pytest.approx(whole[f"res_{table}"][column].tolist(), abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_a_single_feeder_is_solved_whole(simple_node_breaker_network, pp_creator):
+    result = await pp_creator().create(simple_node_breaker_network)
+
+    runpp_by_feeder(result, simple_node_breaker_network)
+
+    assert result.network.converged
+    assert len(result.network.res_bus) == len(result.network.bus)
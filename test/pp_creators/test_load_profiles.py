@@ -0,0 +1,114 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import logging
+
+import numpy as np
+# noinspection PyPackageRequirements
+import pandas as pd
+import pytest
+import pytest_asyncio
+from pandapower.timeseries import run_timeseries
+from zepben.evolve import EnergyConsumer, PowerElectronicsConnection, PowerTransformer, PowerTransformerEnd
+
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.creator_ee import PandaPowerNetworkCreatorEE
+from pp_creators.load_profiles import LoadProfile
+
+
+@pytest_asyncio.fixture()
+async def network_and_profiles(synthetic_network):
+    network = synthetic_network
+    mrids = [ce.mrid for ce in (*network.objects(EnergyConsumer), *network.objects(PowerElectronicsConnection))]
+    rand = np.random.default_rng(0)
+    p = pd.DataFrame(rand.uniform(-5000, 5000, (4, len(mrids))), columns=mrids,
+                     index=pd.date_range("2026-01-01", periods=4, freq="30min"))
+    q = p * 0.1
+    return network, p, q
+
+
+@pytest.mark.asyncio
+async def test_apply_matches_translating_each_snapshot(network_and_profiles):
+    network, p, q = network_and_profiles
+    result = await _create(
+        network,
+        lambda ce: (-1000, -100) if isinstance(ce, PowerElectronicsConnection) else (1000, 100)
+    )
+    profile = LoadProfile(result.load_rows, p, q)
+    assert len(result.load_rows.load) and len(result.load_rows.sgen)
+
+    for time in p.index:
+        profile.apply(result.network, time)
+        expected = await _create(network, lambda ce: (p.at[time, ce.mrid], q.at[time, ce.mrid]))
+
+        for table, sign in (("load", 1), ("sgen", -1)):
+            for mrid, row in getattr(result.load_rows, table).items():
+                assert result.network[table].at[row, "p_mw"] == pytest.approx(sign * p.at[time, mrid] / 1000000)
+                assert result.network[table].at[row, "q_mvar"] == pytest.approx(sign * q.at[time, mrid] / 1000000)
+        assert np.allclose(result.network.load.p_mw.sum() - result.network.sgen.p_mw.sum(),
+                           expected.network.load.p_mw.sum() - expected.network.sgen.p_mw.sum())
+
+
+@pytest.mark.asyncio
+async def test_zero_loads_are_created_when_requested(network_and_profiles):
+    network, p, _ = network_and_profiles
+
+    assert len((await _create(network, lambda ce: (0, 0))).load_rows) == 0
+    assert len((await _create(network, lambda ce: (0, 0), create_zero_loads=True)).load_rows) == len(p.columns)
+
+
+@pytest.mark.asyncio
+async def test_create_controllers(network_and_profiles):
+    network, p, q = network_and_profiles
+    result = await _create(network, lambda ce: (1000, 100))
+    profile = LoadProfile(result.load_rows, p, q, tables=("load",))
+
+    controllers = profile.create_controllers(result.network)
+    run_timeseries(result.network, time_steps=range(len(profile)), verbose=False)
+
+    assert len(controllers) == 2
+    last = p.iloc[-1]
+    for mrid, row in result.load_rows.load.items():
+        assert result.network.load.at[row, "p_mw"] == pytest.approx(last[mrid] / 1000000)
+
+
+@pytest.mark.asyncio
+async def test_equipment_with_a_load_and_an_sgen_is_written_once(simple_node_breaker_network):
+    # Without an LV network, the transformer is given both a load and an sgen.
+    network = simple_node_breaker_network
+    transformer = network.get("transformer", PowerTransformer)
+    lv_terminal = transformer.get_terminal_by_sn(2)
+    network.disconnect(lv_terminal)
+    network.remove(lv_terminal)
+    transformer.remove_terminal(lv_terminal)
+    lv_end = transformer.get_end_by_num(2)
+    transformer.remove_end(lv_end)
+    transformer.add_end(PowerTransformerEnd(mrid=lv_end.mrid, power_transformer=transformer, rated_u=lv_end.rated_u))
+    for end in transformer.ends:
+        end.rated_s = 1000000
+
+    result = await PandaPowerNetworkCreatorEE(
+        load_provider=lambda ce: (1000, 100),
+        pec_load_provider=lambda ce: (-500, -50),
+        geometry="none",
+        logger=logging.getLogger()
+    ).create(network)
+    (load_row,) = (e.index for e in result.mappings.to_bbn.objects["transformer"] if e.type == "load")
+    assert "transformer" not in result.load_rows.sgen
+    assert result.load_rows.load["transformer"] == load_row
+
+    p = pd.DataFrame({"transformer": [2000.0]})
+    LoadProfile(result.load_rows, p, p * 0.1).apply(result.network, 0)
+    assert result.network.load.at[load_row, "p_mw"] == pytest.approx(0.002)
+    assert result.network.sgen.p_mw.tolist() == [pytest.approx(-0.0005)]
+
+
+async def _create(network, load_provider, **kwargs):
+    return await BasicPandaPowerNetworkCreator(
+        ec_load_provider=load_provider,
+        pec_load_provider=load_provider,
+        logger=logging.getLogger(),
+        **kwargs
+    ).create(network)
@@ -0,0 +1,84 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import logging
+
+import numpy as np
+# noinspection PyPackageRequirements
+import pandas as pd
+import pytest
+from zepben.evolve import EnergyConsumer
+
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.creator_ee import PandaPowerNetworkCreatorEE
+from pp_creators.load_providers import BatchLoadProvider
+
+_LOADS = {"load0": (100_000, 50_000), "load1": (-20_000, -10_000)}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("to_batch", [
+    lambda mrids: {mrid: _LOADS[mrid] for mrid in mrids},
+    lambda mrids: pd.DataFrame([_LOADS[mrid] for mrid in mrids], index=mrids, columns=["p", "q"]),
+    lambda mrids: (np.array([_LOADS[mrid][0] for mrid in mrids]), np.array([_LOADS[mrid][1] for mrid in mrids]))
+])
+async def test_batch_load_provider_is_called_once(two_feeder_node_breaker_network, to_batch):
+    calls = []
+
+    def provide(mrids):
+        calls.append(mrids)
+        return to_batch(mrids)
+
+    creator = BasicPandaPowerNetworkCreator(ec_load_provider=BatchLoadProvider(provide), logger=logging.getLogger())
+    result = await creator.create(two_feeder_node_breaker_network)
+
+    assert result.was_successful
+    assert len(calls) == 1
+    assert sorted(calls[0]) == ["load0", "load1"]
+    _assert_loads_match(result.network)
+
+
+@pytest.mark.asyncio
+async def test_batch_load_provider_matches_per_element_provider(synthetic_network):
+    network = synthetic_network
+    loads = {ce.mrid: (1000.0 * i - 3000.0, 100.0 * i) for i, ce in enumerate(network.objects(EnergyConsumer))}
+
+    batched = await PandaPowerNetworkCreatorEE(
+        load_provider=BatchLoadProvider(lambda mrids: {mrid: loads[mrid] for mrid in mrids if mrid in loads}),
+        logger=logging.getLogger()
+    ).create(network)
+    per_element = await PandaPowerNetworkCreatorEE(
+        load_provider=lambda ce: loads.get(ce.mrid, (0, 0)),
+        logger=logging.getLogger()
+    ).create(network)
+
+    assert len(batched.network.load) and len(batched.network.sgen)
+    pd.testing.assert_frame_equal(batched.network.load, per_element.network.load)
+    pd.testing.assert_frame_equal(batched.network.sgen, per_element.network.sgen)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creations_can_share_a_creator(two_feeder_node_breaker_network, synthetic_network):
+    loads = {ce.mrid: (1000.0 * (i + 1), 100.0) for network in (two_feeder_node_breaker_network, synthetic_network)
+             for i, ce in enumerate(network.objects(EnergyConsumer))}
+    creator = BasicPandaPowerNetworkCreator(
+        ec_load_provider=BatchLoadProvider(lambda mrids: {mrid: loads[mrid] for mrid in mrids}),
+        logger=logging.getLogger()
+    )
+
+    results = await asyncio.gather(creator.create(two_feeder_node_breaker_network), creator.create(synthetic_network))
+
+    for network, result in zip((two_feeder_node_breaker_network, synthetic_network), results):
+        expected = sum(loads[ce.mrid][0] for ce in network.objects(EnergyConsumer)) / 1000000
+        assert result.network.load.p_mw.sum() == pytest.approx(expected)
+        assert "_prefetched_loads" not in result.network
+
+
+def _assert_loads_match(net):
+    assert net.load.p_mw.tolist() == [0.1]
+    assert net.load.q_mvar.tolist() == [0.05]
+    assert net.sgen.p_mw.tolist() == [0.02]
+    assert net.sgen.q_mvar.tolist() == [0.01]
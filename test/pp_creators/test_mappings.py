@@ -0,0 +1,58 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pytest
+from zepben.evolve import Terminal
+
+from pp_creators.elements import PpElement
+from pp_creators.mappings import ElementMappingStore
+
+
+def test_store_behaves_like_a_dictionary_of_sets():
+    objects = {"t1": {PpElement(0, "bus")}, "pt": {PpElement(0, "trafo"), PpElement(3, "bus")}}
+    store = ElementMappingStore(objects)
+
+    assert store == objects
+    assert set(store) == {"t1", "pt"} and len(store) == 2
+    assert PpElement(3, "bus") in store["pt"] and PpElement(1, "bus") not in store["pt"]
+    with pytest.raises(KeyError):
+        _ = store["missing"]
+
+    store["pt"].discard(PpElement(3, "bus"))
+    store.setdefault("t2", set()).add(PpElement(1, "bus"))
+    del store["t1"]
+    assert store == {"pt": {PpElement(0, "trafo")}, "t2": {PpElement(1, "bus")}}
+    assert store.to_mrid_lists() == {"pt": [("trafo", 0)], "t2": [("bus", 1)]}
+
+
+def test_looked_up_elements_are_kept_until_changed():
+    store = ElementMappingStore.from_mrid_lists({"a": [("bus", 4)], "b": [("line", 1)]})
+    elements = store["a"]
+    assert store["a"] is elements
+
+    elements |= {PpElement(2, "bus")}
+    assert store["a"] is elements
+    assert sorted(store.to_mrid_lists()["a"]) == [("bus", 2), ("bus", 4)]
+    assert store.indices(["a", "b"], "bus").tolist() == [2, -1]
+
+
+def test_indices_looks_up_many_mrids():
+    store = ElementMappingStore.from_mrid_lists({"a": [("bus", 4), ("bus", 2)], "b": [("line", 1)]})
+    store["c"] = {PpElement(7, "bus")}
+
+    assert store.indices(["a", "b", "c", "d"], "bus").tolist() == [2, -1, 7, -1]
+    assert store.indices(["a", "b"], "trafo").tolist() == [-1, -1]
+
+
+@pytest.mark.asyncio
+async def test_creators_compact_their_mappings(synthetic_network, pp_creator):
+    network = synthetic_network
+    result = await pp_creator().create(network)
+
+    to_bbn = result.mappings.to_bbn.objects
+    assert isinstance(to_bbn, ElementMappingStore)
+    terminals = [t.mrid for t in network.objects(Terminal) if t.mrid in to_bbn]
+    assert to_bbn.indices(terminals, "bus").tolist() == \
+           [min(e.index for e in to_bbn[mrid] if e.type == "bus") for mrid in terminals]
@@ -0,0 +1,73 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+from zepben.evolve import ConductingEquipment
+
+from pp_creators.feeders import partition_by_feeder
+from pp_creators.parallel_creator import create_by_feeder
+from pp_creators.warm_start import bus_voltages_by_mrid
+
+
+@pytest.mark.asyncio
+async def test_partition_by_feeder(two_feeder_node_breaker_network):
+    feeders, shared = partition_by_feeder(two_feeder_node_breaker_network)
+
+    assert set(feeders["feeder0"]) == {"cb0", "hv_line0", "transformer0", "line0", "load0"}
+    assert set(feeders["feeder1"]) == {"cb1", "hv_line1", "transformer1", "line1", "load1"}
+    assert set(shared) == {"grid_connection"}
+
+
+@pytest.mark.asyncio
+async def test_create_by_feeder_matches_serial_creation(two_feeder_node_breaker_network, pp_creator):
+    serial = await pp_creator(vm_pu=1.02).create(two_feeder_node_breaker_network)
+    parallel = await create_by_feeder(pp_creator(vm_pu=1.02), two_feeder_node_breaker_network, max_workers=2)
+
+    assert parallel.was_successful
+    for table in ("bus", "line", "trafo", "load", "ext_grid"):
+        assert len(parallel.network[table]) == len(serial.network[table])
+    assert list(parallel.network.line.dtypes) == list(serial.network.line.dtypes)
+
+    pp.runpp(serial.network)
+    pp.runpp(parallel.network)
+
+    assert set(parallel.mappings.to_bbn.objects) == set(serial.mappings.to_bbn.objects)
+    for mrid, serial_elements in serial.mappings.to_bbn.objects.items():
+        serial_buses = [e.index for e in serial_elements if e.type == "bus"]
+        parallel_buses = [e.index for e in parallel.mappings.to_bbn.objects[mrid] if e.type == "bus"]
+        assert len(serial_buses) == len(parallel_buses)
+        for s, p in zip(serial_buses, parallel_buses):
+            assert serial.network.res_bus.vm_pu[s] == pytest.approx(parallel.network.res_bus.vm_pu[p])
+
+    assert len(parallel.mappings.to_nbn.topological_nodes) == len(serial.mappings.to_nbn.topological_nodes)
+    assert len(parallel.mappings.to_nbn.energy_sources) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_feeders_are_reported(two_feeder_node_breaker_network, pp_creator):
+    for mrid in ("line1", "load1"):
+        two_feeder_node_breaker_network.get(mrid, ConductingEquipment).base_voltage = None
+    result = await create_by_feeder(pp_creator(), two_feeder_node_breaker_network, max_workers=2)
+
+    assert not result.was_successful
+    assert result.failed_feeders == ["feeder1"]
+
+
+@pytest.mark.asyncio
+async def test_initial_voltages_seed_the_merged_net(two_feeder_node_breaker_network, pp_creator):
+    previous = await pp_creator().create(two_feeder_node_breaker_network)
+    pp.runpp(previous.network)
+    voltages = bus_voltages_by_mrid(previous)
+
+    result = await create_by_feeder(pp_creator(initial_voltages=voltages), two_feeder_node_breaker_network,
+                                    max_workers=2)
+    net = result.network
+    assert net.res_bus.index.equals(net.bus.index)
+    for mrid, elements in result.mappings.to_bbn.objects.items():
+        bus = next((e.index for e in elements if e.type == "bus"), None)
+        if bus is not None:
+            assert net.res_bus.vm_pu[bus] == pytest.approx(voltages.vm_pu[mrid])
+            assert net.res_bus.va_degree[bus] == pytest.approx(voltages.va_degree[mrid])
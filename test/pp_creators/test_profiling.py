@@ -0,0 +1,46 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import logging
+
+import pytest
+
+from pp_creators.basic_creator import BasicPandaPowerNetworkCreator
+from pp_creators.error_checking_creator import ErrorAggregator
+from pp_creators.load_providers import BatchLoadProvider
+from pp_creators.profiling import create_profiled
+
+
+@pytest.mark.asyncio
+async def test_create_profiled(simple_node_breaker_network, caplog):
+    creator = BasicPandaPowerNetworkCreator(ec_load_provider=lambda _: (100_000, 50_000), logger=logging.getLogger())
+
+    with caplog.at_level(logging.INFO):
+        result = await create_profiled(creator, simple_node_breaker_network, logger=logging.getLogger())
+
+    assert result.was_successful
+    profile = result.profile
+    assert profile.callbacks["topological_node_creator"].calls == len(result.network.bus)
+    assert profile.callbacks["energy_consumer_creator"].calls == 1
+    assert profile.validator_callbacks["is_valid_energy_consumer_data"].calls == 1
+    assert profile.callbacks["create_element"].calls == sum(profile.rows.values())
+    assert profile.load_providers["ec_load_provider"].calls == 1
+    assert profile.load_providers["ec_load_provider.prefetch"].calls == 1
+    assert profile.rows == {"bus": 3, "ext_grid": 1, "line": 1, "load": 1, "trafo": 1}
+    assert 0 <= profile.untracked_s <= profile.wall_s
+    assert "Rows created: bus=3" in caplog.text
+
+    # Only a copy of the creator is profiled.
+    assert "topological_node_creator" not in vars(creator)
+    assert isinstance(creator.ec_load_provider, BatchLoadProvider)
+    assert "is_valid_energy_consumer_data" not in vars(result.validator)
+
+
+@pytest.mark.asyncio
+async def test_create_profiled_counts_mappings_of_other_networks(simple_node_breaker_network):
+    result = await create_profiled(ErrorAggregator(), simple_node_breaker_network)
+
+    assert result.profile.rows["topological_nodes"] == 3
+    assert result.profile.rows["power_transformers"] == 1
@@ -0,0 +1,53 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import numpy as np
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+import pytest
+from zepben.evolve import EnergyConsumer, ConnectivityNode
+
+from pp_creators.screening import LinearPowerFlow
+
+
+@pytest.mark.asyncio
+async def test_scenarios_approximate_load_flow(synthetic_network, pp_creator):
+    result = await pp_creator(admittance=True).create(synthetic_network)
+    net = result.network
+    screening = LinearPowerFlow(result)
+
+    consumers = list(synthetic_network.objects(EnergyConsumer))
+    scales = [0.0, 0.5, 1.0]
+    p = pd.DataFrame([[ec.p * scale for ec in consumers] for scale in scales], index=scales,
+                     columns=[ec.mrid for ec in consumers])
+    q = pd.DataFrame([[ec.q * scale for ec in consumers] for scale in scales], index=scales, columns=p.columns)
+    screened = screening.solve(p, q, batch_size=2)
+    assert screened.vm_pu.shape == (len(scales), len(net.bus))
+    assert screened.loading_percent.shape == (len(scales), len(net.line))
+
+    for scale in scales:
+        net.load["scaling"] = scale
+        pp.runpp(net)
+        vm_pu = screened.vm_pu.loc[scale]
+        assert np.allclose(vm_pu, net.res_bus.vm_pu[vm_pu.index], atol=0.01 if scale else 1e-9)
+        loading = screened.loading_percent.loc[scale]
+        assert np.allclose(loading, net.res_line.loading_percent[loading.index], atol=5 if scale else 1e-6)
+
+
+@pytest.mark.asyncio
+async def test_unmapped_equipment_keeps_net_loads(synthetic_network, pp_creator):
+    result = await pp_creator().create(synthetic_network)
+    screening = LinearPowerFlow(result)
+    base = screening.solve(pd.DataFrame(index=[0]))
+
+    # Load on a connectivity node is added to the loads already on its bus.
+    slack_buses = set(result.network.ext_grid.bus)
+    node = next(cn for cn in synthetic_network.objects(ConnectivityNode)
+                if any(e.type == "bus" and e.index not in slack_buses
+                       for e in result.mappings.to_bbn.objects.get(cn.mrid, ())))
+    loaded = screening.solve(pd.DataFrame({node.mrid: [100000.0], "unknown": [100000.0]}))
+    assert (loaded.vm_pu.loc[0] <= base.vm_pu.loc[0] + 1e-12).all()
+    assert (loaded.vm_pu.loc[0] < base.vm_pu.loc[0] - 1e-6).any()
@@ -0,0 +1,65 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+
+from pp_creators.feeders import feeder_networks
+from pp_creators.shared_net import create_shared_net
+from pp_creators.warm_start import bus_voltages_by_mrid
+
+
+@pytest.mark.asyncio
+async def test_feeders_share_one_net(two_feeder_node_breaker_network, pp_creator):
+    serial = await pp_creator().create(two_feeder_node_breaker_network)
+    shared = await create_shared_net(pp_creator(), feeder_networks(two_feeder_node_breaker_network))
+
+    assert shared.was_successful
+    for table in ("bus", "line", "trafo", "load", "ext_grid"):
+        assert len(shared.network[table]) == len(serial.network[table])
+
+    pp.runpp(serial.network)
+    pp.runpp(shared.network)
+    assert set(shared.mappings.to_bbn.objects) == set(serial.mappings.to_bbn.objects)
+    for mrid, serial_elements in serial.mappings.to_bbn.objects.items():
+        serial_bus = next((e.index for e in serial_elements if e.type == "bus"), None)
+        shared_bus = next((e.index for e in shared.mappings.to_bbn.objects[mrid] if e.type == "bus"), None)
+        if serial_bus is not None:
+            assert serial.network.res_bus.vm_pu[serial_bus] == pytest.approx(shared.network.res_bus.vm_pu[shared_bus])
+    assert len(shared.mappings.to_nbn.energy_sources) == 1
+
+
+@pytest.mark.asyncio
+async def test_networks_are_added_to_the_target_network(two_feeder_node_breaker_network, synthetic_network,
+                                                        pp_creator):
+    target = pp.create_empty_network()
+    pp.create_bus(target, vn_kv=110, index=0)
+    result = await create_shared_net(
+        pp_creator(),
+        [two_feeder_node_breaker_network, synthetic_network],
+        target_network=target
+    )
+    separate = [await pp_creator().create(network) for network in (two_feeder_node_breaker_network, synthetic_network)]
+
+    assert result.network is target
+    assert len(target.bus) == 1 + sum(len(r.network.bus) for r in separate)
+    assert target.bus.index.is_unique and target.line.index.is_unique
+    assert set(target.line.from_bus) | set(target.line.to_bus) <= set(target.bus.index) - {0}
+
+
+@pytest.mark.asyncio
+async def test_initial_voltages_seed_the_shared_net(two_feeder_node_breaker_network, pp_creator):
+    previous = await pp_creator().create(two_feeder_node_breaker_network)
+    pp.runpp(previous.network)
+    voltages = bus_voltages_by_mrid(previous)
+
+    result = await create_shared_net(pp_creator(initial_voltages=voltages), feeder_networks(two_feeder_node_breaker_network))
+    net = result.network
+    assert net.res_bus.index.equals(net.bus.index)
+    for mrid, elements in result.mappings.to_bbn.objects.items():
+        bus = next((e.index for e in elements if e.type == "bus"), None)
+        if bus is not None:
+            assert net.res_bus.vm_pu[bus] == pytest.approx(voltages.vm_pu[mrid])
+            assert net.res_bus.va_degree[bus] == pytest.approx(voltages.va_degree[mrid])
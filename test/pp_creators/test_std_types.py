@@ -0,0 +1,39 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pytest
+# noinspection PyPackageRequirements
+from pandas.testing import assert_frame_equal
+
+from pp_creators.std_types import update_std_type
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("buffer_tables", [False, True])
+async def test_lines_and_trafos_refer_to_shared_std_types(synthetic_network, pp_creator, buffer_tables):
+    plain = (await pp_creator(buffer_tables=buffer_tables).create(synthetic_network)).network
+    net = (await pp_creator(buffer_tables=buffer_tables, std_types=True).create(synthetic_network)).network
+
+    for element in ("line", "trafo"):
+        assert net[element].std_type.notna().all()
+        assert net[element].std_type.nunique() < len(net[element])
+        assert_frame_equal(net[element].drop(columns="std_type"), plain[element].drop(columns="std_type"))
+        for name, rows in net[element].groupby("std_type"):
+            for parameter, value in net.std_types[element][name].items():
+                if parameter in rows.columns and parameter != "tap_pos":
+                    assert (rows[parameter] == value).all()
+
+
+@pytest.mark.asyncio
+async def test_updating_a_std_type_updates_its_elements(synthetic_network, pp_creator):
+    net = (await pp_creator(std_types=True).create(synthetic_network)).network
+    name = net.line.std_type.iloc[0]
+    others = net.line[net.line.std_type != name].r_ohm_per_km.copy()
+
+    update_std_type(net, "line", name, r_ohm_per_km=0.5)
+
+    assert net.std_types["line"][name]["r_ohm_per_km"] == 0.5
+    assert (net.line.r_ohm_per_km[net.line.std_type == name] == 0.5).all()
+    assert net.line.r_ohm_per_km[net.line.std_type != name].equals(others)
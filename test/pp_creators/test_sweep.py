@@ -0,0 +1,56 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+from zepben.evolve import PowerTransformer, ConnectivityNode
+
+from pp_creators.sweep import run_sweep, SweepCase
+
+
+@pytest.mark.asyncio
+async def test_cases_match_separate_translations(synthetic_network, pp_creator):
+    transformer = next(iter(synthetic_network.objects(PowerTransformer))).mrid
+    cases = [
+        SweepCase(name="base"),
+        SweepCase(name="raised", vm_pu=1.03, load_scale=1.5, tap_pos={transformer: 2}),
+        SweepCase(name="collapsed", min_line_r_ohm=0.05, min_line_x_ohm=0.05)
+    ]
+
+    result = await run_sweep(pp_creator(), synthetic_network, cases, max_workers=2)
+
+    assert not result.failed_cases
+    assert list(result.buses.index.names) == ["case", "mrid"]
+    assert set(result.buses.index.get_level_values("case")) == {"base", "raised", "collapsed"}
+
+    expected = await pp_creator(vm_pu=1.03).create(synthetic_network)
+    expected.network.load.scaling = 1.5
+    (trafo,) = (e.index for e in expected.mappings.to_bbn.objects[transformer] if e.type == "trafo")
+    expected.network.trafo.at[trafo, "tap_pos"] = 2
+    pp.runpp(expected.network)
+    _assert_bus_voltages_match(result, "raised", synthetic_network, expected)
+    assert result.buses.loc["raised"].vm_pu.min() != pytest.approx(result.buses.loc["base"].vm_pu.min())
+
+    # Cases with other line thresholds are translated separately.
+    expected = await pp_creator(min_line_r_ohm=0.05, min_line_x_ohm=0.05).create(synthetic_network)
+    pp.runpp(expected.network)
+    _assert_bus_voltages_match(result, "collapsed", synthetic_network, expected)
+    assert len(expected.network.bus) < len((await pp_creator().create(synthetic_network)).network.bus)
+
+
+@pytest.mark.asyncio
+async def test_case_names_must_be_unique(synthetic_network, pp_creator):
+    with pytest.raises(ValueError):
+        await run_sweep(pp_creator(), synthetic_network, [SweepCase(name="a"), SweepCase(name="a", vm_pu=1.1)])
+
+
+def _assert_bus_voltages_match(result, case, network, expected):
+    checked = 0
+    for cn in network.objects(ConnectivityNode):
+        bus = next((e.index for e in expected.mappings.to_bbn.objects.get(cn.mrid, ()) if e.type == "bus"), None)
+        if bus is not None:
+            assert result.buses.at[(case, cn.mrid), "vm_pu"] == pytest.approx(expected.network.res_bus.vm_pu[bus])
+            checked += 1
+    assert checked
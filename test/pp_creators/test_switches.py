@@ -0,0 +1,64 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+from zepben.evolve import Switch
+
+from pp_creators.switches import set_switches_open
+
+
+def _bus_voltages(result):
+    return {
+        mrid: result.network.res_bus.vm_pu[bus.index]
+        for mrid, elements in result.mappings.to_bbn.objects.items()
+        for bus in elements if bus.type == "bus"
+    }
+
+
+def _assert_same_voltages(expected, actual):
+    expected, actual = _bus_voltages(expected), _bus_voltages(actual)
+    shared = expected.keys() & actual.keys()
+    assert shared
+    for mrid in shared:
+        assert actual[mrid] == pytest.approx(expected[mrid])
+
+
+@pytest.mark.asyncio
+async def test_switches_are_created_as_elements(switched_synthetic_network, pp_creator):
+    collapsed = await pp_creator().create(switched_synthetic_network)
+    result = await pp_creator(switch_elements=True).create(switched_synthetic_network)
+
+    switches = list(switched_synthetic_network.objects(Switch))
+    net = result.network
+    assert len(net.switch) == len(switches)
+    for switch in switches:
+        (element,) = result.mappings.to_bbn.objects[switch.mrid]
+        assert element.type == "switch"
+        assert net.switch.closed[element.index] == (not switch.is_open())
+        if net.switch.et[element.index] == "l":
+            assert net.switch.bus[element.index] in set(net.line.loc[net.switch.element[element.index],
+                                                                     ["from_bus", "to_bus"]])
+
+    pp.runpp(collapsed.network)
+    pp.runpp(net)
+    _assert_same_voltages(collapsed, result)
+
+
+@pytest.mark.asyncio
+async def test_switching_only_changes_the_switch_table(switched_synthetic_network, pp_creator):
+    result = await pp_creator(switch_elements=True).create(switched_synthetic_network)
+    buses = result.network.bus.index.copy()
+
+    set_switches_open(result, {switch.mrid: False for switch in switched_synthetic_network.objects(Switch)})
+    assert result.network.switch.closed.all()
+    assert result.network.bus.index.equals(buses)
+    pp.runpp(result.network)
+
+    for switch in switched_synthetic_network.objects(Switch):
+        switch.set_open(False)
+    retranslated = await pp_creator().create(switched_synthetic_network)
+    pp.runpp(retranslated.network)
+    _assert_same_voltages(retranslated, result)
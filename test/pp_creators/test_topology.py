@@ -0,0 +1,88 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import logging
+
+import pytest
+from zepben.evolve import AcLineSegment, EnergyConsumer
+
+from pp_creators.creator import TopologyNetworkCreator
+
+
+def _elements(result, element_type):
+    elements_by_mrid = {
+        mrid: {element.index for element in elements if element.type == element_type}
+        for mrid, elements in result.mappings.to_bbn.objects.items()
+    }
+    return {mrid: indices for mrid, indices in elements_by_mrid.items() if indices}
+
+
+@pytest.mark.asyncio
+async def test_topology_matches_pandapower_translation(synthetic_network, pp_creator):
+    expected = await pp_creator().create(synthetic_network)
+    result = await TopologyNetworkCreator(logger=logging.getLogger()).create(synthetic_network)
+    assert result.was_successful
+
+    net, topology = expected.network, result.network
+    assert topology.bus_count == len(net.bus)
+    for element_type in ("bus", "line", "trafo", "ext_grid"):
+        assert _elements(result, element_type) == _elements(expected, element_type)
+
+    edges = topology.edges()
+    lines = edges[edges.type == "line"].set_index("index")
+    assert lines.from_bus.tolist() == net.line.from_bus.tolist()
+    assert lines.to_bus.tolist() == net.line.to_bus.tolist()
+    trafos = edges[edges.type == "trafo"].set_index("index")
+    assert trafos.from_bus.tolist() == net.trafo.hv_bus.tolist()
+    assert trafos.to_bus.tolist() == net.trafo.lv_bus.tolist()
+
+    adjacency = topology.adjacency()
+    assert adjacency.shape == (len(net.bus), len(net.bus))
+    assert (adjacency != adjacency.T).nnz == 0
+    assert adjacency.sum() == 2 * (len(net.line) + len(net.trafo))
+
+
+@pytest.mark.asyncio
+async def test_subnetwork_is_translated_on_demand(synthetic_network, pp_creator):
+    result = await TopologyNetworkCreator(logger=logging.getLogger()).create(synthetic_network)
+    topology = result.network
+
+    line = next(iter(synthetic_network.objects(AcLineSegment)))
+    (element,) = (e for e in result.mappings.to_bbn.objects[line.mrid] if e.type == "line")
+    edges = topology.edges()
+    (from_bus, to_bus), = edges[(edges.type == "line") & (edges["index"] == element.index)][["from_bus", "to_bus"]] \
+        .itertuples(index=False)
+
+    subnetwork = topology.subnetwork(synthetic_network, [from_bus, to_bus])
+    assert subnetwork.get(line.mrid, AcLineSegment) is line
+    consumers = {ec.mrid for ec in synthetic_network.objects(EnergyConsumer)}
+    connected = {mrid for mrid, bus in topology.connections.items() if bus in (from_bus, to_bus)}
+    assert {ec.mrid for ec in subnetwork.objects(EnergyConsumer)} == connected & consumers
+
+    sub_result = await pp_creator().create(subnetwork)
+    assert sub_result.was_successful
+    (sub_line,) = (e for e in sub_result.mappings.to_bbn.objects[line.mrid] if e.type == "line")
+    assert sub_result.network.line.length_km[sub_line.index] > 0
+
+
+@pytest.mark.asyncio
+async def test_switches_are_kept_as_edges(switched_synthetic_network, pp_creator):
+    expected = await pp_creator(switch_elements=True).create(switched_synthetic_network)
+    creator = TopologyNetworkCreator(logger=logging.getLogger(), switch_elements=True)
+    result = await creator.create(switched_synthetic_network)
+    assert result.was_successful
+
+    net, topology = expected.network, result.network
+    for element_type in ("trafo", "switch"):
+        assert _elements(result, element_type) == _elements(expected, element_type)
+    # The mRIDs of the buses dropped for bus-line switches are mapped to their line as well.
+    lines = _elements(result, "line")
+    assert lines.items() <= _elements(expected, "line").items()
+
+    edges = topology.edges()
+    switches = edges[edges.type == "switch"].set_index("index")
+    assert switches.closed.tolist() == net.switch.closed.tolist()
+    # Open switches split the buses they join.
+    assert topology.adjacency().sum() == 2 * (len(net.line) + len(net.trafo) + net.switch.closed.sum())
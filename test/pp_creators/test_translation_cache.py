@@ -0,0 +1,77 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+# noinspection PyPackageRequirements
+import pandas as pd
+import pytest
+from zepben.evolve import Switch
+
+from pp_creators.load_providers import no_load
+from pp_creators.translation_cache import TranslationCache, fingerprint
+
+# Identifies the loads of the creators' load provider, which are the P and Q of each consumer.
+_LOADS = "consumer p and q"
+
+
+@pytest.mark.asyncio
+async def test_hit_matches_translation(synthetic_network, pp_creator, tmp_path):
+    cache = TranslationCache(tmp_path)
+    miss = await cache.create(pp_creator(), synthetic_network, extra_key=_LOADS)
+    hit = await cache.create(pp_creator(), synthetic_network, extra_key=_LOADS)
+
+    assert hit is not miss
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    assert pp.nets_equal(miss.network, hit.network)
+    assert hit.load_rows.load.equals(miss.load_rows.load)
+    assert {mrid: {(e.type, e.index) for e in elements} for mrid, elements in hit.mappings.to_bbn.objects.items()} == \
+           {mrid: {(e.type, e.index) for e in elements} for mrid, elements in miss.mappings.to_bbn.objects.items()}
+    assert hit.mappings.to_nbn.topological_nodes == miss.mappings.to_nbn.topological_nodes
+    assert hit.mappings.to_nbn.energy_consumers == miss.mappings.to_nbn.energy_consumers
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_changes_with_switch_state_and_creator_parameters(synthetic_network, pp_creator):
+    key = fingerprint(synthetic_network, pp_creator())
+    assert fingerprint(synthetic_network, pp_creator()) == key
+    assert fingerprint(synthetic_network, pp_creator(min_line_r_ohm=0.01)) != key
+    assert fingerprint(synthetic_network, pp_creator(), extra_key="2026-01-01") != key
+    assert fingerprint(synthetic_network, pp_creator(ec_load_provider=lambda ce: (ce.q, ce.p))) != key
+
+    voltages = pd.DataFrame({"vm_pu": [1.01], "va_degree": [0.0]}, index=["f0_cb"])
+    seeded = fingerprint(synthetic_network, pp_creator(initial_voltages=voltages))
+    assert seeded != key
+    assert fingerprint(synthetic_network, pp_creator(initial_voltages=voltages.copy())) == seeded
+    assert fingerprint(synthetic_network, pp_creator(initial_voltages=voltages * 1.01)) != seeded
+
+    switch = synthetic_network.get("f0_cb", Switch)
+    switch.set_open(True)
+    assert fingerprint(synthetic_network, pp_creator()) != key
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(synthetic_network, pp_creator, tmp_path):
+    cache = TranslationCache(tmp_path)
+    await cache.create(pp_creator(), synthetic_network, extra_key=_LOADS)
+    entry_size = next(tmp_path.glob("*.pkl")).stat().st_size
+
+    cache.max_bytes = entry_size * 3 // 2
+    await cache.create(pp_creator(min_line_r_ohm=0.01), synthetic_network, extra_key=_LOADS)
+
+    assert [path.stem for path in tmp_path.glob("*.pkl")] == [
+        fingerprint(synthetic_network, pp_creator(min_line_r_ohm=0.01), extra_key=_LOADS)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_creators_with_load_providers_need_an_extra_key(synthetic_network, pp_creator, tmp_path):
+    cache = TranslationCache(tmp_path)
+    result = await cache.create(pp_creator(), synthetic_network)
+
+    assert result.was_successful
+    assert not list(tmp_path.glob("*.pkl"))
+
+    await cache.create(pp_creator(ec_load_provider=no_load), synthetic_network)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
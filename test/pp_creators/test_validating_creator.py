@@ -0,0 +1,63 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import logging
+
+import pandapower as pp
+import pytest
+from zepben.evolve import PowerTransformer
+
+from pp_creators.error_checking_creator import ErrorAggregator
+from pp_creators.validating_creator import ValidatingPandaPowerNetworkCreator
+
+
+def _creator(**kwargs) -> ValidatingPandaPowerNetworkCreator:
+    return ValidatingPandaPowerNetworkCreator(logger=logging.getLogger(), ec_load_provider=lambda ce: (ce.p, ce.q),
+                                              **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_translates_and_checks_in_one_pass(synthetic_network, pp_creator):
+    result = await _creator().create(synthetic_network)
+    expected = await pp_creator().create(synthetic_network)
+
+    assert result.was_successful
+    assert pp.nets_equal(result.network, expected.network)
+    assert "_network_errors" not in result.network
+    assert result.mappings.to_bbn.objects == expected.mappings.to_bbn.objects
+    assert not result.errors.has_fatal_errors
+
+
+@pytest.mark.asyncio
+async def test_whole_network_is_checked_past_fatal_errors(synthetic_network):
+    for pt in synthetic_network.objects(PowerTransformer):
+        pt.get_end_by_num(2).rated_u = None
+
+    events = []
+    result = await _creator(on_error=events.append).create(synthetic_network)
+    aggregated = (await ErrorAggregator().create(synthetic_network)).network
+
+    assert not result.was_successful
+    assert result.network is None
+    assert result.errors.has_fatal_errors
+    assert {category: error.mrids for category, error in result.errors.errors.items()} == \
+           {category: error.mrids for category, error in aggregated.errors.items()}
+    assert len(events) == len(list(synthetic_network.objects(PowerTransformer)))
+
+    result = await _creator(fail_fast=True).create(synthetic_network)
+    assert not result.was_successful
+    assert result.errors.stopped_on == "pt_end_missing_voltage"
+
+
+@pytest.mark.asyncio
+async def test_post_processing_is_skipped_past_fatal_errors(switched_synthetic_network):
+    for pt in switched_synthetic_network.objects(PowerTransformer):
+        pt.get_end_by_num(2).rated_u = None
+
+    result = await _creator(switch_elements=True, admittance=True).create(switched_synthetic_network)
+
+    assert not result.was_successful
+    assert result.network is None
+    assert result.errors.has_fatal_errors
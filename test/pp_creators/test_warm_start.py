@@ -0,0 +1,37 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pandapower as pp
+import pytest
+
+from pp_creators.warm_start import bus_voltages_by_mrid
+
+
+@pytest.mark.asyncio
+async def test_voltages_seed_the_next_translation(synthetic_network, pp_creator):
+    previous = await pp_creator().create(synthetic_network)
+    pp.runpp(previous.network)
+    flat_iterations = previous.network._ppc["iterations"]
+    voltages = bus_voltages_by_mrid(previous)
+
+    # Renumber the buses of the next translation by starting it with a bus of its own.
+    creator = pp_creator(initial_voltages=voltages)
+    offset_net = pp.create_empty_network()
+    pp.create_bus(offset_net, vn_kv=0.4)
+    creator.create_network = lambda: offset_net
+    result = await creator.create(synthetic_network)
+
+    net = result.network
+    assert net.res_bus.index.equals(net.bus.index)
+    for mrid, elements in previous.mappings.to_bbn.objects.items():
+        bus = next((e.index for e in elements if e.type == "bus"), None)
+        if bus is not None:
+            new_bus = next(e.index for e in result.mappings.to_bbn.objects[mrid] if e.type == "bus")
+            assert new_bus != bus
+            assert net.res_bus.vm_pu[new_bus] == pytest.approx(previous.network.res_bus.vm_pu[bus])
+            assert net.res_bus.va_degree[new_bus] == pytest.approx(previous.network.res_bus.va_degree[bus])
+
+    pp.runpp(net, init="results")
+    assert net._ppc["iterations"] < flat_iterations
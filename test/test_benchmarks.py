@@ -0,0 +1,40 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pytest
+from zepben.evolve import ConductingEquipment, Feeder, RatioTapChanger, Location
+
+from benchmarks.synthetic_network import SyntheticFeederSpec, create_synthetic_network
+from benchmarks.translation_benchmark import run_case
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spec", [
+    SyntheticFeederSpec(feeders=2, transformers=4, consumers_per_transformer=5),
+    SyntheticFeederSpec(transformers=7, segments_per_span=3, meshed=True, with_locations=False, with_tap_changers=False)
+])
+async def test_synthetic_network_matches_spec(spec):
+    network = await create_synthetic_network(spec)
+
+    assert len(list(network.objects(ConductingEquipment))) == spec.equipment_count()
+    assert len(list(network.objects(Feeder))) == spec.feeders
+    assert len(list(network.objects(RatioTapChanger))) == (spec.feeders * spec.transformers if spec.with_tap_changers else 0)
+    assert any(network.objects(Location)) == spec.with_locations
+
+
+def test_with_equipment_count():
+    for equipment in (1_000, 10_000, 100_000):
+        assert abs(SyntheticFeederSpec.with_equipment_count(equipment).equipment_count() - equipment) < 0.1 * equipment
+
+
+def test_run_case():
+    spec = SyntheticFeederSpec(transformers=2, consumers_per_transformer=2)
+    case = run_case("basic", spec)
+
+    assert case["was_successful"]
+    assert case["equipment"] == spec.equipment_count()
+    assert case["rows"]["trafo"] == 2
+    assert case["callbacks"]["power_transformer_creator"]["calls"] == 2
+    assert case["wall_s"] > 0